@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.authentication.models import AppUser
+from apps.authentication.models import AppUser, ConsumedToken
 
 
 @admin.register(AppUser)
@@ -10,3 +10,12 @@ class AppUserAdmin(admin.ModelAdmin):
     """
 
     list_display = ("username", "email")
+
+
+@admin.register(ConsumedToken)
+class ConsumedTokenAdmin(admin.ModelAdmin):
+    """
+    Consumed token admin
+    """
+
+    list_display = ("jti", "expires_at")
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.contrib.auth.password_validation import get_default_password_validators
 
 
 class AuthenticationConfig(AppConfig):
@@ -8,3 +9,11 @@ class AuthenticationConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.authentication"
+
+    def ready(self) -> None:
+        """
+        Loads the password validators when the app starts, so the first
+        sign up does not pay for reading the common password list
+        """
+
+        get_default_password_validators()
@@ -0,0 +1,165 @@
+from typing import Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.handlers.wsgi import WSGIRequest
+
+from apps.authentication.utils.hashing.executor import get_hashing_executor
+
+UserModel = get_user_model()
+
+
+class EmailBackend(ModelBackend):
+    """
+    Authentication backend that identifies users by email
+    """
+
+    def authenticate(
+        self,
+        request: Optional[WSGIRequest],
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[AbstractBaseUser]:
+        """
+        Authenticates the user with a single lookup by email
+
+        Parameters
+        ----------
+        request : Optional[WSGIRequest]
+            The request object
+        email : Optional[str]
+            The email of the user
+        password : Optional[str]
+            The raw password
+
+        Returns
+        -------
+        Optional[AbstractBaseUser]
+            The user if the credentials are valid, otherwise None
+        """
+
+        if email is None or password is None:
+            return None
+
+        try:
+            user = UserModel._default_manager.by_email(email).get()
+        except UserModel.DoesNotExist:
+            # Run the password hasher anyway so unknown emails
+            # take as long as wrong passwords
+            get_hashing_executor().run(make_password, password)
+            return None
+
+        if self._check_password(user, password) and self.user_can_authenticate(user):
+            return user
+
+        return None
+
+    async def aauthenticate(
+        self,
+        request: Optional[WSGIRequest],
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[AbstractBaseUser]:
+        """
+        Async version of authenticate, awaiting the hashing pool
+        instead of blocking a thread on it
+
+        Parameters
+        ----------
+        request : Optional[WSGIRequest]
+            The request object
+        email : Optional[str]
+            The email of the user
+        password : Optional[str]
+            The raw password
+
+        Returns
+        -------
+        Optional[AbstractBaseUser]
+            The user if the credentials are valid, otherwise None
+        """
+
+        if email is None or password is None:
+            return None
+
+        user = await UserModel._default_manager.by_email(email).afirst()
+
+        if user is None:
+            # Run the password hasher anyway so unknown emails
+            # take as long as wrong passwords
+            await get_hashing_executor().arun(make_password, password)
+            return None
+
+        if await self._acheck_password(user, password) and self.user_can_authenticate(
+            user
+        ):
+            return user
+
+        return None
+
+    @staticmethod
+    def _check_password(user: AbstractBaseUser, password: str) -> bool:
+        """
+        Checks the password in the hashing pool, upgrading the
+        stored hash from the request thread if it is outdated
+
+        Parameters
+        ----------
+        user : AbstractBaseUser
+            The user
+        password : str
+            The raw password
+
+        Returns
+        -------
+        bool
+            Whether the password is correct
+        """
+
+        executor = get_hashing_executor()
+        outdated = []
+
+        is_correct = executor.run(
+            check_password, password, user.password, outdated.append
+        )
+
+        if outdated:
+            user.password = executor.run(make_password, password)
+            user.save(update_fields=["password"])
+
+        return is_correct
+
+    @staticmethod
+    async def _acheck_password(user: AbstractBaseUser, password: str) -> bool:
+        """
+        Async version of _check_password
+
+        Parameters
+        ----------
+        user : AbstractBaseUser
+            The user
+        password : str
+            The raw password
+
+        Returns
+        -------
+        bool
+            Whether the password is correct
+        """
+
+        executor = get_hashing_executor()
+        outdated = []
+
+        is_correct = await executor.arun(
+            check_password, password, user.password, outdated.append
+        )
+
+        if outdated:
+            user.password = await executor.arun(make_password, password)
+            await user.asave(update_fields=["password"])
+
+        return is_correct
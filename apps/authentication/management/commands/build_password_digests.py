@@ -0,0 +1,60 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from apps.authentication.utils.passwords.digests import (
+    DIGEST_SIZE,
+    build_digests,
+    read_passwords,
+)
+from apps.authentication.validators import DJANGO_PASSWORD_LIST_PATH
+
+
+class Command(BaseCommand):
+    """
+    Builds the digest file of the common password validator
+    """
+
+    help = (
+        "Builds the sorted digest file the common password validator memory "
+        "maps from one or more password lists, one password per line"
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Adds the command arguments
+
+        Parameters
+        ----------
+        parser : CommandParser
+            The argument parser
+        """
+
+        parser.add_argument(
+            "lists",
+            nargs="*",
+            help="Password lists, gzipped or not, defaults to the Django list",
+        )
+        parser.add_argument("--output", required=True)
+
+    def handle(self, *args, **options) -> None:
+        """
+        Builds the digest file
+        """
+
+        lists = options["lists"] or [DJANGO_PASSWORD_LIST_PATH]
+        digests = build_digests(
+            password for path in lists for password in read_passwords(path)
+        )
+
+        # Replaced atomically so running workers keep their mapping intact
+        temporary = f"{options['output']}.tmp"
+
+        with open(temporary, "wb") as file:
+            file.write(digests)
+
+        os.replace(temporary, options["output"])
+
+        self.stdout.write(
+            f"Wrote {len(digests) // DIGEST_SIZE} digests to {options['output']}"
+        )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.authentication.utils.tokens.ledger import ConsumedTokenLedger
+
+
+class Command(BaseCommand):
+    """
+    Deletes the consumed tokens that have expired
+    """
+
+    help = "Deletes the ids of consumed tokens that have expired"
+
+    def handle(self, *args, **options) -> None:
+        """
+        Deletes the expired consumed tokens
+        """
+
+        deleted = ConsumedTokenLedger.clear_expired()
+
+        self.stdout.write(f"Deleted {deleted} expired consumed tokens")
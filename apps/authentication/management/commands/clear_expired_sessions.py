@@ -0,0 +1,69 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    """
+    Deletes the expired sessions in chunks
+    """
+
+    help = (
+        "Deletes the expired sessions in small chunks so the "
+        "session table is never locked for long"
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Adds the command arguments
+
+        Parameters
+        ----------
+        parser : CommandParser
+            The argument parser
+        """
+
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to wait between chunks",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Deletes the expired sessions
+        """
+
+        store = import_module(settings.SESSION_ENGINE).SessionStore
+
+        if not hasattr(store, "get_model_class"):
+            # Cache and cookie sessions expire on their own
+            store.clear_expired()
+            self.stdout.write("Session engine has no expired rows to delete")
+            return
+
+        sessions = store.get_model_class().objects
+        now = timezone.now()
+        deleted = 0
+
+        while True:
+            keys = list(
+                sessions.filter(expire_date__lt=now).values_list(
+                    "session_key", flat=True
+                )[: options["chunk_size"]]
+            )
+
+            if not keys:
+                break
+
+            sessions.filter(session_key__in=keys).delete()
+            deleted += len(keys)
+
+            time.sleep(options["pause"])
+
+        self.stdout.write(f"Deleted {deleted} expired sessions")
@@ -0,0 +1,150 @@
+import itertools
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.authentication.utils.imports.checkpoint import ImportCheckpoint
+from apps.authentication.utils.imports.importer import UserImporter
+from apps.authentication.utils.imports.readers import FORMATS, read_records
+
+
+class Command(BaseCommand):
+    """
+    Imports users from a CSV or JSON lines file
+    """
+
+    help = (
+        "Imports users from a CSV file with a header row or a JSON lines file, "
+        "with the username, email, password, first_name and last_name fields. "
+        "Records are validated like sign ups, in chunks committed one at a time"
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Adds the command arguments
+
+        Parameters
+        ----------
+        parser : CommandParser
+            The argument parser
+        """
+
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format", choices=FORMATS, help="Defaults to the file extension"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Records validated, hashed and committed together",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="Rows per insert statement"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Password hashing processes, hashes in process with 1",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="File recording the imported records, resumes from it if it exists",
+        )
+        parser.add_argument(
+            "--confirmed",
+            action="store_true",
+            help="Imports the users active with their email confirmed",
+        )
+        parser.add_argument(
+            "--send-activation-emails",
+            action="store_true",
+            help="Queues an activation email for every imported user",
+        )
+        parser.add_argument(
+            "--domain",
+            help="The domain of the activation links, defaults to SITE_DOMAIN",
+        )
+        parser.add_argument(
+            "--protocol",
+            choices=("http", "https"),
+            help="The protocol of the activation links, defaults to SITE_PROTOCOL",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Imports the users and prints the throughput report
+        """
+
+        if options["send_activation_emails"] and options["confirmed"]:
+            raise CommandError("Confirmed users do not need activation emails")
+
+        checkpoint = (
+            ImportCheckpoint(options["checkpoint"], options["path"])
+            if options["checkpoint"]
+            else None
+        )
+
+        try:
+            position = checkpoint.load() if checkpoint else 0
+        except ValueError as e:
+            raise CommandError(e)
+
+        if position:
+            self.stdout.write(f"Resuming after {position} records")
+
+        importer = UserImporter(
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            confirmed=options["confirmed"],
+            email_options=(
+                {"protocol": options["protocol"], "domain": options["domain"]}
+                if options["send_activation_emails"]
+                else None
+            ),
+        )
+        records = enumerate(
+            itertools.islice(
+                read_records(options["path"], options["format"]), position, None
+            ),
+            start=position,
+        )
+        imported = rejected = 0
+        start = time.perf_counter()
+
+        with importer:
+            while True:
+                try:
+                    chunk = list(itertools.islice(records, options["chunk_size"]))
+                except (OSError, ValueError) as e:
+                    raise CommandError(e)
+
+                if not chunk:
+                    break
+
+                result = importer.import_chunk(chunk)
+
+                for record in result.rejected:
+                    self.stderr.write(
+                        f"Record {record.position + 1}: {' '.join(record.errors)}"
+                    )
+
+                imported += len(result.created)
+                rejected += len(result.rejected)
+                position = chunk[-1][0] + 1
+
+                if checkpoint:
+                    checkpoint.save(position)
+
+        elapsed = time.perf_counter() - start
+        phases = "  ".join(
+            f"{phase} {seconds:.2f}s" for phase, seconds in importer.timings.items()
+        )
+
+        self.stdout.write(
+            f"Imported {imported} users, rejected {rejected}, in {elapsed:.2f}s "
+            f"({(imported + rejected) / elapsed if elapsed else 0:.0f} records/s)"
+        )
+        self.stdout.write(phases)
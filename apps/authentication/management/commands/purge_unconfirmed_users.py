@@ -0,0 +1,162 @@
+import datetime
+import json
+import os
+import time
+from typing import Optional, TextIO
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.authentication.models import AppUser
+from utils.tokens.constants import DEFAULT_EXPIRATION_DAYS
+
+ARCHIVED_FIELDS = ("id", "username", "email", "first_name", "last_name", "date_joined")
+
+
+class Command(BaseCommand):
+    """
+    Deletes the accounts never activated within the token lifetime in chunks
+    """
+
+    help = (
+        "Deletes, or archives and deletes, the accounts that were not activated "
+        "before their activation link expired, in small chunks walked along a "
+        "partial index so the users table is never locked for long"
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Adds the command arguments
+
+        Parameters
+        ----------
+        parser : CommandParser
+            The argument parser
+        """
+
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=DEFAULT_EXPIRATION_DAYS,
+            help="Age in days after which unconfirmed accounts are stale",
+        )
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to wait between chunks",
+        )
+        parser.add_argument(
+            "--archive",
+            help="JSON lines file the accounts are appended to before deletion",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Counts the stale accounts without deleting them",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Purges the stale unconfirmed accounts
+        """
+
+        joined_before = timezone.now() - datetime.timedelta(days=options["days"])
+        stale = AppUser.objects.stale_unconfirmed(joined_before)
+        archive = (
+            open(options["archive"], "a")
+            if options["archive"] and not options["dry_run"]
+            else None
+        )
+        purged = chunks = 0
+        last = None
+        start = time.perf_counter()
+
+        try:
+            while True:
+                # Keyset pagination, each chunk seeks the index past the last one
+                page = stale
+
+                if last is not None:
+                    page = page.filter(
+                        Q(date_joined__gt=last[0])
+                        | Q(date_joined=last[0], id__gt=last[1])
+                    )
+
+                users = list(page.values(*ARCHIVED_FIELDS)[: options["chunk_size"]])
+
+                if not users:
+                    break
+
+                last = users[-1]["date_joined"], users[-1]["id"]
+                purged += self._purge(users, archive, options["dry_run"])
+                chunks += 1
+                elapsed = time.perf_counter() - start
+
+                self.stdout.write(
+                    f"Chunk {chunks}: {purged} accounts "
+                    f"{'found' if options['dry_run'] else 'purged'} "
+                    f"in {elapsed:.2f}s ({purged / elapsed if elapsed else 0:.0f}/s)"
+                )
+
+                time.sleep(options["pause"])
+        finally:
+            if archive:
+                archive.close()
+
+        self.stdout.write(
+            f"{'Found' if options['dry_run'] else 'Purged'} {purged} unconfirmed "
+            f"accounts that signed up before {joined_before:%Y-%m-%d %H:%M}"
+        )
+
+    def _purge(
+        self, users: list[dict], archive: Optional[TextIO], dry_run: bool
+    ) -> int:
+        """
+        Archives and deletes a chunk of accounts
+
+        Parameters
+        ----------
+        users : list[dict]
+            The archived fields of the accounts
+        archive : Optional[TextIO]
+            The archive file
+        dry_run : bool
+            Whether the accounts are only counted
+
+        Returns
+        -------
+        int
+            The number of accounts purged, or found in a dry run
+        """
+
+        if dry_run:
+            return len(users)
+
+        with transaction.atomic():
+            # Accounts activated since the chunk was read are kept
+            ids = set(
+                AppUser.objects.select_for_update()
+                .filter(
+                    id__in=[user["id"] for user in users],
+                    is_active=False,
+                    email_confirmed=False,
+                )
+                .values_list("id", flat=True)
+            )
+
+            if archive:
+                archive.writelines(
+                    json.dumps(user, default=str) + "\n"
+                    for user in users
+                    if user["id"] in ids
+                )
+                archive.flush()
+                os.fsync(archive.fileno())
+
+            AppUser.objects.filter(id__in=ids).delete()
+
+        return len(ids)
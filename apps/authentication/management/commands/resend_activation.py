@@ -0,0 +1,178 @@
+import datetime
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.authentication.models import AppUser
+from utils.email.strategies.email_confirmation import EmailConfirmationStrategy
+from utils.email.throttle import Throttle
+from utils.tokens.constants import DEFAULT_EXPIRATION_DAYS
+from utils.tokens.tokens import Tokens
+
+
+class Command(BaseCommand):
+    """
+    Sends a new activation link to the accounts waiting for activation
+    """
+
+    help = (
+        "Sends a new activation email to the inactive, unconfirmed accounts, "
+        "streamed in chunks and delivered over mail connections opened once"
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Adds the command arguments
+
+        Parameters
+        ----------
+        parser : CommandParser
+            The argument parser
+        """
+
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Accounts read and tokens generated at a time",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Mail connections sending at the same time, "
+            "at most EMAIL_POOL_SIZE with the pooled backend",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=10,
+            help="Maximum emails per second across connections, 0 for no limit",
+        )
+        parser.add_argument(
+            "--since",
+            type=datetime.date.fromisoformat,
+            help="Only the accounts that signed up on or after this date, within "
+            f"the last {DEFAULT_EXPIRATION_DAYS} days, older accounts are due to "
+            "be deleted by purge_unconfirmed_users",
+        )
+        parser.add_argument("--domain", help="Defaults to SITE_DOMAIN")
+        parser.add_argument(
+            "--protocol", choices=("http", "https"), help="Defaults to SITE_PROTOCOL"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Counts the accounts without sending emails",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Sends the activation emails
+        """
+
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be at least 1")
+
+        # Accounts purge_unconfirmed_users deletes once their activation link
+        # would have expired, older ones are left out whatever --since says
+        lifetime = datetime.timedelta(days=DEFAULT_EXPIRATION_DAYS)
+        joined_after = timezone.now() - lifetime
+
+        if options["since"]:
+            joined_after = max(
+                joined_after,
+                datetime.datetime.combine(
+                    options["since"],
+                    datetime.time(),
+                    tzinfo=timezone.get_current_timezone(),
+                ),
+            )
+
+        users = AppUser.objects.filter(
+            is_active=False, email_confirmed=False, date_joined__gt=joined_after
+        )
+
+        # Streamed along the partial index of the unconfirmed accounts
+        rows = (
+            users.order_by("date_joined", "id")
+            .values_list("id", "email", "date_joined")
+            .iterator(chunk_size=options["chunk_size"])
+        )
+        throttle = Throttle(options["rate"])
+        local = threading.local()
+        connections = []
+        lock = threading.Lock()
+
+        def send(message: EmailMessage) -> bool:
+            """
+            Sends the message over the connection of the thread
+            """
+
+            if not hasattr(local, "connection"):
+                local.connection = get_connection()
+                local.connection.open()
+
+                with lock:
+                    connections.append(local.connection)
+
+            throttle.wait()
+
+            try:
+                return local.connection.send_messages([message]) == 1
+            except Exception as e:
+                self.stderr.write(f"{message.to[0]}: {e}")
+                return False
+
+        sent = failed = 0
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            try:
+                while chunk := list(itertools.islice(rows, options["chunk_size"])):
+                    if options["dry_run"]:
+                        sent += len(chunk)
+                        continue
+
+                    # A link lives as long as the account it activates
+                    tokens = Tokens.generate_tokens(
+                        [
+                            {
+                                "user_id": user_id,
+                                "exp": int((date_joined + lifetime).timestamp()),
+                            }
+                            for user_id, _, date_joined in chunk
+                        ]
+                    )
+                    messages = [
+                        EmailConfirmationStrategy.build_message(
+                            to=email,
+                            user_id=user_id,
+                            token=token,
+                            protocol=options["protocol"],
+                            domain=options["domain"],
+                        )
+                        for (user_id, email, _), token in zip(chunk, tokens)
+                    ]
+                    results = list(executor.map(send, messages))
+                    sent += sum(results)
+                    failed += len(results) - sum(results)
+                    elapsed = time.perf_counter() - start
+
+                    self.stdout.write(
+                        f"Sent {sent} emails, {failed} failed, in {elapsed:.2f}s "
+                        f"({sent / elapsed if elapsed else 0:.1f}/s)"
+                    )
+            finally:
+                for connection in connections:
+                    connection.close()
+
+        if options["dry_run"]:
+            self.stdout.write(f"Found {sent} accounts waiting for activation")
+        else:
+            self.stdout.write(f"Resent {sent} activation emails, {failed} failed")
@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-18 10:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_appuser_email_confirmed_alter_appuser_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConsumedToken',
+            fields=[
+                ('jti', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'consumed_tokens',
+            },
+        ),
+    ]
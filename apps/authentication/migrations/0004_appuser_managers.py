@@ -0,0 +1,20 @@
+# Generated by Django 5.1 on 2026-10-18 10:40
+
+import apps.authentication.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_consumedtoken'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='appuser',
+            managers=[
+                ('objects', apps.authentication.models.AppUserManager()),
+            ],
+        ),
+    ]
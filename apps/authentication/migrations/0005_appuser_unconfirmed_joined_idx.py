@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-18 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('authentication', '0004_appuser_managers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appuser',
+            index=models.Index(condition=models.Q(('email_confirmed', False), ('is_active', False)), fields=['date_joined', 'id'], name='users_unconfirmed_joined_idx'),
+        ),
+    ]
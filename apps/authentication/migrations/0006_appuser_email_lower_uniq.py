@@ -0,0 +1,96 @@
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+INDEX_NAME = "users_email_lower_uniq"
+
+
+def check_email_case_duplicates(apps, schema_editor):
+    """
+    Stops the migration when emails only differing in case exist,
+    they have to be merged or renamed before the index is built
+    """
+
+    AppUser = apps.get_model("authentication", "AppUser")
+    duplicates = (
+        AppUser.objects.values(email_lower=Lower("email"))
+        .annotate(count=models.Count("id"))
+        .filter(count__gt=1)
+        .values_list("email_lower", flat=True)
+    )
+
+    if duplicates:
+        raise RuntimeError(
+            "Emails registered more than once with a different case: "
+            + ", ".join(duplicates[:20])
+        )
+
+
+def create_email_lower_index(apps, schema_editor):
+    """
+    Builds the unique index without blocking writes on PostgreSQL
+    """
+
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "{INDEX_NAME}" '
+            'ON "users" (LOWER("email"))'
+        )
+        return
+
+    schema_editor.add_constraint(
+        apps.get_model("authentication", "AppUser"),
+        models.UniqueConstraint(Lower("email"), name=INDEX_NAME),
+    )
+
+
+def drop_email_lower_index(apps, schema_editor):
+    """
+    Drops the unique index without blocking writes on PostgreSQL
+    """
+
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{INDEX_NAME}"')
+        return
+
+    schema_editor.remove_constraint(
+        apps.get_model("authentication", "AppUser"),
+        models.UniqueConstraint(Lower("email"), name=INDEX_NAME),
+    )
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("authentication", "0005_appuser_unconfirmed_joined_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_email_case_duplicates, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_email_lower_index, drop_email_lower_index),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="appuser",
+                    constraint=models.UniqueConstraint(
+                        Lower("email"),
+                        name=INDEX_NAME,
+                        violation_error_message="A user with that email already exists.",
+                    ),
+                ),
+            ],
+        ),
+        # The case sensitive unique index is replaced by the one above
+        migrations.AlterField(
+            model_name="appuser",
+            name="email",
+            field=models.EmailField(
+                error_messages={"unique": "A user with that email already exists."},
+                max_length=254,
+            ),
+        ),
+    ]
@@ -1,5 +1,98 @@
-from django.contrib.auth.models import AbstractUser
+import datetime
+
+from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
+from django.db.models.functions import Lower
+
+
+class AppUserManager(UserManager):
+    """
+    Custom user manager
+    """
+
+    def by_email(self, email: str) -> models.QuerySet:
+        """
+        Returns the users with the email regardless of its case,
+        looked up through the unique index on the lowercased email
+
+        Parameters
+        ----------
+        email : str
+            The email
+
+        Returns
+        -------
+        models.QuerySet
+            The user with the email, if any
+        """
+
+        return self.alias(email_lower=Lower("email")).filter(
+            email_lower=Lower(models.Value(email))
+        )
+
+    def activate(self, user_id: int) -> bool:
+        """
+        Activates the user and confirms their email in a single
+        conditional update, so concurrent activations apply once
+
+        Parameters
+        ----------
+        user_id : int
+            The user id
+
+        Returns
+        -------
+        bool
+            Whether the user was activated, False if the user
+            does not exist or their email is already confirmed
+        """
+
+        return bool(
+            self.filter(id=user_id, email_confirmed=False).update(
+                is_active=True, email_confirmed=True
+            )
+        )
+
+    def stale_unconfirmed(self, joined_before: datetime.datetime) -> models.QuerySet:
+        """
+        Returns the users that signed up before the given time and never
+        activated their account, in the order of their partial index
+
+        Parameters
+        ----------
+        joined_before : datetime.datetime
+            The sign up time before which accounts are stale
+
+        Returns
+        -------
+        models.QuerySet
+            The stale unconfirmed users
+        """
+
+        return self.filter(
+            is_active=False, email_confirmed=False, date_joined__lt=joined_before
+        ).order_by("date_joined", "id")
+
+    async def aactivate(self, user_id: int) -> bool:
+        """
+        Async version of activate
+
+        Parameters
+        ----------
+        user_id : int
+            The user id
+
+        Returns
+        -------
+        bool
+            Whether the user was activated
+        """
+
+        return bool(
+            await self.filter(id=user_id, email_confirmed=False).aupdate(
+                is_active=True, email_confirmed=True
+            )
+        )
 
 
 class AppUser(AbstractUser):
@@ -7,11 +100,14 @@ class AppUser(AbstractUser):
     Custom user model
     """
 
+    # Unique regardless of its case, see Meta.constraints
     email = models.EmailField(
-        unique=True, error_messages={"unique": "A user with that email already exists."}
+        error_messages={"unique": "A user with that email already exists."}
     )
     email_confirmed = models.BooleanField(default=False)
 
+    objects = AppUserManager()
+
     def __str__(self) -> str:
         """
         String representation of the user
@@ -31,3 +127,46 @@ class AppUser(AbstractUser):
 
         db_table = "users"
         verbose_name_plural = "Users"
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"),
+                name="users_email_lower_uniq",
+                violation_error_message="A user with that email already exists.",
+            ),
+        ]
+        indexes = [
+            # Only the accounts pending activation, for the purge of stale ones
+            models.Index(
+                fields=["date_joined", "id"],
+                condition=models.Q(is_active=False, email_confirmed=False),
+                name="users_unconfirmed_joined_idx",
+            ),
+        ]
+
+
+class ConsumedToken(models.Model):
+    """
+    Single use token that has already been consumed
+    """
+
+    jti = models.CharField(max_length=32, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        """
+        String representation of the consumed token
+
+        Returns
+        -------
+        str
+            The token id
+        """
+
+        return self.jti
+
+    class Meta:
+        """
+        Metadata options
+        """
+
+        db_table = "consumed_tokens"
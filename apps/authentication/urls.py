@@ -1,10 +1,19 @@
 from django.urls import path
 
 from apps.authentication import views
+from utils.cache.page import anonymous_page_cache
 
 urlpatterns = [
-    path("sign-in", views.SignInView.as_view(), name="sign-in"),
-    path("sign-up", views.SignUpView.as_view(), name="sign-up"),
+    path(
+        "sign-in",
+        anonymous_page_cache(query_params=("next",))(views.SignInView.as_view()),
+        name="sign-in",
+    ),
+    path(
+        "sign-up",
+        anonymous_page_cache()(views.SignUpView.as_view()),
+        name="sign-up",
+    ),
     path(
         "email-confirmation",
         views.EmailConfirmationView.as_view(),
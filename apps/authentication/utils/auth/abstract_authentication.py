@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from asgiref.sync import sync_to_async
+
 
 class AbstractAuthentication(ABC):
     """
@@ -11,6 +13,8 @@ class AbstractAuthentication(ABC):
         Abstract method to validate data
     validate_user()
         Abstract method to validate user
+    avalidate_user()
+        Async version of validate_user
     """
 
     @abstractmethod
@@ -28,3 +32,11 @@ class AbstractAuthentication(ABC):
         """
 
         pass
+
+    async def avalidate_user(self) -> None:
+        """
+        Async version of validate_user, runs
+        it in a thread unless it is overridden
+        """
+
+        await sync_to_async(self.validate_user)()
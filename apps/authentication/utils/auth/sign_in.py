@@ -2,9 +2,10 @@ from typing import Optional
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.signals import user_login_failed
 from django.core.handlers.wsgi import WSGIRequest
 
-from apps.authentication.models import AppUser
+from apps.authentication.backends import EmailBackend
 from apps.authentication.utils.auth.abstract_authentication import (
     AbstractAuthentication,
 )
@@ -29,6 +30,8 @@ class SignIn(AbstractAuthentication):
         Validates the sign in data
     validate_user()
         Validates the user credentials
+    avalidate_user()
+        Async version of validate_user
     """
 
     def __init__(self, request: WSGIRequest) -> None:
@@ -59,19 +62,49 @@ class SignIn(AbstractAuthentication):
     def validate_user(self) -> None:
         """
         Validates the user credentials
+
+        Raises
+        ------
+        HashingPoolSaturatedError
+            If the password hashing pool cannot take more work
         """
 
-        user = AppUser.objects.filter(email=self.request.POST.get("email")).first()
+        user = authenticate(
+            self.request,
+            email=self.request.POST.get("email"),
+            password=self.request.POST.get("password"),
+        )
 
-        if user:
-            user = authenticate(
-                self.request,
-                username=user.username,
-                password=self.request.POST.get("password"),
-            )
+        if not user:
+            self.errors.append("Invalid credentials.")
+            return
+
+        self.user = user
+
+    async def avalidate_user(self) -> None:
+        """
+        Async version of validate_user
+
+        Raises
+        ------
+        HashingPoolSaturatedError
+            If the password hashing pool cannot take more work
+        """
+
+        email = self.request.POST.get("email")
+
+        # aauthenticate runs the sync backends in a thread that then blocks
+        # on the hashing pool, the email backend is awaited directly instead
+        user = await EmailBackend().aauthenticate(
+            self.request, email=email, password=self.request.POST.get("password")
+        )
 
         if not user:
+            await user_login_failed.asend(
+                sender=__name__, credentials={"email": email}, request=self.request
+            )
             self.errors.append("Invalid credentials.")
             return
 
+        user.backend = f"{EmailBackend.__module__}.{EmailBackend.__qualname__}"
         self.user = user
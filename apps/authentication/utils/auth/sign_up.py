@@ -1,14 +1,19 @@
 from typing import Optional
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from django.core.handlers.wsgi import WSGIRequest
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
 
 from apps.authentication.models import AppUser
 from apps.authentication.utils.auth.abstract_authentication import (
     AbstractAuthentication,
 )
+from apps.authentication.utils.hashing.executor import get_hashing_executor
+from utils.metrics.recorders import timed
 
 
 class SignUp(AbstractAuthentication):
@@ -30,6 +35,8 @@ class SignUp(AbstractAuthentication):
         Validates the sign up data
     validate_user()
         Validates the user credentials
+    avalidate_user()
+        Async version of validate_user
     """
 
     def __init__(self, request: WSGIRequest) -> None:
@@ -63,6 +70,49 @@ class SignUp(AbstractAuthentication):
     def validate_user(self) -> None:
         """
         Validates the user credentials
+
+        Raises
+        ------
+        HashingPoolSaturatedError
+            If the password hashing pool cannot take more work
+        """
+
+        user = self._clean_user()
+
+        if not self.errors:
+            user.password = get_hashing_executor().run(make_password, user.password)
+            user.is_active = False
+            self.user = user
+
+    async def avalidate_user(self) -> None:
+        """
+        Async version of validate_user
+
+        Raises
+        ------
+        HashingPoolSaturatedError
+            If the password hashing pool cannot take more work
+        """
+
+        user = await sync_to_async(self._clean_user)()
+
+        if not self.errors:
+            user.password = await get_hashing_executor().arun(
+                make_password, user.password
+            )
+            user.is_active = False
+            self.user = user
+
+    def _clean_user(self) -> AppUser:
+        """
+        Builds the user from the request data and runs the validation
+        stages from the cheapest to the most expensive, stopping at the
+        first one that fails, each one timed as a sign_up_<stage> phase
+
+        Returns
+        -------
+        AppUser
+            The unsaved user with the raw password
         """
 
         user = AppUser(
@@ -71,17 +121,79 @@ class SignUp(AbstractAuthentication):
             password=self._request.POST.get("password"),
         )
 
+        for name, stage in (
+            ("fields", self._check_fields),
+            ("password", self._check_password),
+            ("uniqueness", self._check_uniqueness),
+        ):
+            with timed(f"sign_up_{name}"):
+                stage(user)
+
+            if self.errors:
+                break
+
+        return user
+
+    def _check_fields(self, user: AppUser) -> None:
+        """
+        Runs the field validators and normalizes the email, without queries
+
+        Parameters
+        ----------
+        user : AppUser
+            The unsaved user
+        """
+
         try:
-            user.full_clean()
+            user.clean_fields()
+            user.clean()
         except ValidationError as e:
             self.errors.extend(e.messages)
 
+    def _check_password(self, user: AppUser) -> None:
+        """
+        Runs the password validators, whose instances and common
+        password list are loaded once per process
+
+        Parameters
+        ----------
+        user : AppUser
+            The unsaved user
+        """
+
         try:
-            validate_password(self._request.POST.get("password"))
+            validate_password(user.password)
         except ValidationError as e:
             self.errors.append(list(e.messages)[0])
 
-        if not self.errors:
-            user.password = make_password(user.password)
-            user.is_active = False
-            self.user = user
+    def _check_uniqueness(self, user: AppUser) -> None:
+        """
+        Checks the username and email, regardless of its case,
+        are free with a single query
+
+        Parameters
+        ----------
+        user : AppUser
+            The unsaved user
+        """
+
+        taken = (
+            AppUser.objects.alias(email_lower=Lower("email"))
+            .filter(Q(username=user.username) | Q(email_lower=Lower(Value(user.email))))
+            .values_list("username", "email")
+        )
+
+        usernames, emails = set(), set()
+
+        for username, email in taken:
+            usernames.add(username)
+            emails.add(email.lower())
+
+        for field, value, values in (
+            ("username", user.username, usernames),
+            ("email", user.email.lower(), emails),
+        ):
+            if value in values:
+                self.errors.append(
+                    AppUser._meta.get_field(field).error_messages["unique"]
+                )
@@ -0,0 +1,7 @@
+class HashingPoolSaturatedError(Exception):
+    """
+    Error that is raised when the password
+    hashing pool cannot take more work
+    """
+
+    pass
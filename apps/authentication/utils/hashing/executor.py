@@ -0,0 +1,228 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.conf import settings
+
+from apps.authentication.utils.hashing.exceptions import HashingPoolSaturatedError
+from utils.metrics.recorders import (
+    HASHING_QUEUED,
+    HASHING_REJECTED,
+    HASHING_RUNNING,
+    timed,
+)
+
+
+class HashingExecutor:
+    """
+    Bounded thread pool for password hashing with admission control
+
+    Attributes
+    ----------
+    max_workers : int
+        The number of hashes computed at the same time
+    max_queue : int
+        The number of hashes allowed to wait for a free worker
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        """
+        Initializes the hashing executor
+
+        Parameters
+        ----------
+        max_workers : int
+            The number of hashes computed at the same time
+        max_queue : int
+            The number of hashes allowed to wait for a free worker
+        """
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hashing"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs the function in the pool and waits for its result
+
+        Parameters
+        ----------
+        fn : Callable[..., Any]
+            The hashing function
+        *args : tuple
+            The positional arguments of the function
+        **kwargs : dict
+            The keyword arguments of the function
+
+        Returns
+        -------
+        Any
+            The result of the function
+
+        Raises
+        ------
+        HashingPoolSaturatedError
+            If every worker is busy and the queue is full
+        """
+
+        with timed("hash"):
+            return self.submit(fn, *args, **kwargs).result()
+
+    async def arun(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Async version of run, awaits the result without blocking the event loop
+
+        Parameters
+        ----------
+        fn : Callable[..., Any]
+            The hashing function
+        *args : tuple
+            The positional arguments of the function
+        **kwargs : dict
+            The keyword arguments of the function
+
+        Returns
+        -------
+        Any
+            The result of the function
+
+        Raises
+        ------
+        HashingPoolSaturatedError
+            If every worker is busy and the queue is full
+        """
+
+        with timed("hash"):
+            return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs):
+        """
+        Schedules the function in the pool
+
+        Parameters
+        ----------
+        fn : Callable[..., Any]
+            The hashing function
+        *args : tuple
+            The positional arguments of the function
+        **kwargs : dict
+            The keyword arguments of the function
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future of the function result
+
+        Raises
+        ------
+        HashingPoolSaturatedError
+            If every worker is busy and the queue is full
+        """
+
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+
+            HASHING_REJECTED.inc()
+            raise HashingPoolSaturatedError("Password hashing pool is saturated")
+
+        with self._lock:
+            self._queued += 1
+
+        HASHING_QUEUED.inc()
+
+        try:
+            return self._executor.submit(self._call, fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+
+            HASHING_QUEUED.dec()
+            self._slots.release()
+            raise
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Snapshot of the pool usage, exported process wide by the
+        password_hashing_* metrics
+
+        Returns
+        -------
+        dict[str, int]
+            The capacity, the queued, running and completed
+            hashes and the rejected submissions
+        """
+
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def _call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs the function in a worker thread keeping the counters up to date
+
+        Parameters
+        ----------
+        fn : Callable[..., Any]
+            The hashing function
+        *args : tuple
+            The positional arguments of the function
+        **kwargs : dict
+            The keyword arguments of the function
+
+        Returns
+        -------
+        Any
+            The result of the function
+        """
+
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+
+        HASHING_QUEUED.dec()
+        HASHING_RUNNING.inc()
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+            HASHING_RUNNING.dec()
+            self._slots.release()
+
+
+@functools.cache
+def get_hashing_executor() -> HashingExecutor:
+    """
+    Returns the hashing executor configured in the settings
+
+    Returns
+    -------
+    HashingExecutor
+        The hashing executor
+    """
+
+    return HashingExecutor(
+        max_workers=settings.PASSWORD_HASHING_MAX_WORKERS,
+        max_queue=settings.PASSWORD_HASHING_MAX_QUEUE,
+    )
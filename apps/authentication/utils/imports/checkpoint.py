@@ -0,0 +1,75 @@
+import json
+import os
+from pathlib import Path
+
+
+class ImportCheckpoint:
+    """
+    Number of records of a source already imported,
+    stored in a JSON file after every committed chunk
+
+    Attributes
+    ----------
+    path : Path
+        The path of the checkpoint file
+    source : str
+        The absolute path of the imported file
+    """
+
+    def __init__(self, path: str | Path, source: str | Path) -> None:
+        """
+        Initializes the checkpoint
+
+        Parameters
+        ----------
+        path : str | Path
+            The path of the checkpoint file
+        source : str | Path
+            The path of the imported file
+        """
+
+        self.path = Path(path)
+        self.source = str(Path(source).resolve())
+
+    def load(self) -> int:
+        """
+        Reads the number of records already imported
+
+        Returns
+        -------
+        int
+            The position to resume from, 0 without a checkpoint
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint belongs to another source
+        """
+
+        if not self.path.exists():
+            return 0
+
+        checkpoint = json.loads(self.path.read_text())
+
+        if checkpoint["source"] != self.source:
+            raise ValueError(
+                f"The checkpoint {self.path} belongs to {checkpoint['source']}"
+            )
+
+        return checkpoint["position"]
+
+    def save(self, position: int) -> None:
+        """
+        Stores the number of records imported, replacing
+        the file atomically so a crash keeps the previous one
+
+        Parameters
+        ----------
+        position : int
+            The number of records imported
+        """
+
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        temporary.write_text(json.dumps({"source": self.source, "position": position}))
+
+        os.replace(temporary, self.path)
@@ -0,0 +1,349 @@
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
+
+from apps.authentication.models import AppUser
+from apps.emails.utils.queue import EmailQueue
+from utils.email.strategies.email_confirmation import EmailConfirmationStrategy
+
+FIELDS = ("username", "email", "password", "first_name", "last_name")
+
+
+class RejectedRecord(NamedTuple):
+    """
+    Record that failed validation
+    """
+
+    position: int
+    errors: list[str]
+
+
+class ChunkResult(NamedTuple):
+    """
+    Outcome of an imported chunk
+    """
+
+    created: list[AppUser]
+    rejected: list[RejectedRecord]
+
+
+def setup_worker() -> None:
+    """
+    Sets up Django in the hashing processes, a no op when they are forked
+    """
+
+    django.setup()
+
+
+class UserImporter:
+    """
+    Imports users in chunks: validates the records, hashes the passwords
+    across processes, inserts them with bulk_create and optionally queues
+    their activation emails
+
+    Attributes
+    ----------
+    batch_size : int
+        The number of users inserted per statement
+    workers : int
+        The number of hashing processes, hashes in process with 1
+    confirmed : bool
+        Whether the users are imported active with their email confirmed
+    email_options : Optional[dict[str, str]]
+        The protocol and domain of the activation links, the site ones
+        when they are None, no emails are queued without the options
+    timings : dict[str, float]
+        The seconds spent in each phase
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        workers: int = 1,
+        confirmed: bool = False,
+        email_options: Optional[dict[str, str]] = None,
+    ) -> None:
+        """
+        Initializes the importer
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of users inserted per statement
+        workers : int
+            The number of hashing processes, hashes in process with 1
+        confirmed : bool
+            Whether the users are imported active with their email confirmed
+        email_options : Optional[dict[str, str]]
+            The protocol and domain of the activation links
+        """
+
+        self.batch_size = batch_size
+        self.workers = workers
+        self.confirmed = confirmed
+        self.email_options = email_options
+        self.timings: dict[str, float] = defaultdict(float)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "UserImporter":
+        """
+        Starts the hashing processes when there are several
+
+        Returns
+        -------
+        UserImporter
+            The importer
+        """
+
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=setup_worker
+            )
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Shuts the hashing processes down, waiting for their pending hashes
+
+        Parameters
+        ----------
+        *args : tuple
+            The exception type, value and traceback, if any
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def import_chunk(self, records: list[tuple[int, dict]]) -> ChunkResult:
+        """
+        Imports a chunk of records in one transaction
+
+        Parameters
+        ----------
+        records : list[tuple[int, dict]]
+            The records and their position in the source
+
+        Returns
+        -------
+        ChunkResult
+            The created users and the rejected records
+        """
+
+        start = time.perf_counter()
+        users, rejected = self._validate(records)
+        self.timings["validation"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        passwords = self._hash([user.password for _, user in users])
+        self.timings["hashing"] += time.perf_counter() - start
+
+        for (_, user), password in zip(users, passwords):
+            user.password = password
+
+        with transaction.atomic():
+            start = time.perf_counter()
+
+            try:
+                with transaction.atomic():
+                    created = AppUser.objects.bulk_create(
+                        [user for _, user in users], batch_size=self.batch_size
+                    )
+            except IntegrityError:
+                # Someone took one of the usernames or emails since the check
+                created, conflicts = self._create_each(users)
+                rejected = sorted(rejected + conflicts)
+
+            self.timings["insert"] += time.perf_counter() - start
+
+            if self.email_options is not None:
+                self._queue_emails(created)
+
+        return ChunkResult(created=created, rejected=rejected)
+
+    def _validate(
+        self, records: list[tuple[int, dict]]
+    ) -> tuple[list[tuple[int, AppUser]], list[RejectedRecord]]:
+        """
+        Runs the sign up validation on every record, checking the usernames
+        and emails, regardless of their case, of the whole chunk with a
+        single query
+
+        Parameters
+        ----------
+        records : list[tuple[int, dict]]
+            The records and their position in the source
+
+        Returns
+        -------
+        tuple[list[tuple[int, AppUser]], list[RejectedRecord]]
+            The unsaved users with their raw password and their position,
+            and the rejected records
+        """
+
+        candidates, rejected = [], []
+
+        for position, record in records:
+            user = AppUser(
+                **{field: record.get(field) or "" for field in FIELDS},
+                is_active=self.confirmed,
+                email_confirmed=self.confirmed,
+            )
+            errors = []
+
+            try:
+                user.clean_fields()
+                user.clean()
+                validate_password(user.password)
+            except ValidationError as e:
+                errors.extend(e.messages)
+
+            if errors:
+                rejected.append(RejectedRecord(position, errors))
+            else:
+                candidates.append((position, user))
+
+        taken = (
+            AppUser.objects.alias(email_lower=Lower("email"))
+            .filter(
+                Q(username__in=[user.username for _, user in candidates])
+                | Q(
+                    email_lower__in=[Lower(Value(user.email)) for _, user in candidates]
+                )
+            )
+            .values_list("username", "email")
+        )
+
+        usernames, emails = set(), set()
+
+        for username, email in taken:
+            usernames.add(username)
+            emails.add(email.lower())
+
+        users = []
+
+        for position, user in candidates:
+            errors = [
+                str(AppUser._meta.get_field(field).error_messages["unique"])
+                for field, value, values in (
+                    ("username", user.username, usernames),
+                    ("email", user.email.lower(), emails),
+                )
+                if value in values
+            ]
+
+            if errors:
+                rejected.append(RejectedRecord(position, errors))
+                continue
+
+            # Later duplicates of the same chunk are rejected as taken
+            usernames.add(user.username)
+            emails.add(user.email.lower())
+            users.append((position, user))
+
+        rejected.sort()
+
+        return users, rejected
+
+    def _create_each(
+        self, users: list[tuple[int, AppUser]]
+    ) -> tuple[list[AppUser], list[RejectedRecord]]:
+        """
+        Inserts the users one at a time, each in a savepoint, rejecting
+        those whose username or email the database finds taken
+
+        Parameters
+        ----------
+        users : list[tuple[int, AppUser]]
+            The users with hashed passwords and their position
+
+        Returns
+        -------
+        tuple[list[AppUser], list[RejectedRecord]]
+            The created users and the rejected records
+
+        Raises
+        ------
+        IntegrityError
+            If a user is rejected for another reason than a taken
+            username or email
+        """
+
+        created, rejected = [], []
+
+        for position, user in users:
+            try:
+                with transaction.atomic():
+                    created.extend(AppUser.objects.bulk_create([user]))
+            except IntegrityError:
+                errors = [
+                    str(AppUser._meta.get_field(field).error_messages["unique"])
+                    for field, taken in (
+                        ("username", AppUser.objects.filter(username=user.username)),
+                        ("email", AppUser.objects.by_email(user.email)),
+                    )
+                    if taken.exists()
+                ]
+
+                if not errors:
+                    raise
+
+                rejected.append(RejectedRecord(position, errors))
+
+        return created, rejected
+
+    def _hash(self, passwords: list[str]) -> list[str]:
+        """
+        Hashes the passwords, across the processes when there are several
+
+        Parameters
+        ----------
+        passwords : list[str]
+            The raw passwords
+
+        Returns
+        -------
+        list[str]
+            The encoded passwords, in the same order
+        """
+
+        if self._pool is None:
+            return [make_password(password) for password in passwords]
+
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+
+        return list(self._pool.map(make_password, passwords, chunksize=chunksize))
+
+    def _queue_emails(self, users: list[AppUser]) -> None:
+        """
+        Queues the activation email of every user in a single insert
+
+        Parameters
+        ----------
+        users : list[AppUser]
+            The created users
+        """
+
+        start = time.perf_counter()
+
+        EmailQueue.push_many(
+            [
+                EmailConfirmationStrategy.build_message(
+                    to=user.email, user_id=user.id, **self.email_options
+                )
+                for user in users
+            ],
+            batch_size=self.batch_size,
+        )
+
+        self.timings["emails"] += time.perf_counter() - start
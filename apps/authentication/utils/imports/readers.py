@@ -0,0 +1,52 @@
+import csv
+import json
+from pathlib import Path
+from typing import Iterator
+
+FORMATS = ("csv", "jsonl")
+
+
+def read_records(path: str | Path, format: str | None = None) -> Iterator[dict]:
+    """
+    Streams the user records of a CSV file with a header row
+    or of a JSON lines file, one object per line
+
+    Parameters
+    ----------
+    path : str | Path
+        The path of the file
+    format : str | None
+        csv or jsonl, guessed from the file extension by default
+
+    Yields
+    ------
+    dict
+        The record, blank lines are skipped
+
+    Raises
+    ------
+    ValueError
+        If the format is unknown or a JSON line is not an object
+    """
+
+    path = Path(path)
+    format = format or path.suffix.lstrip(".").lower()
+
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format {format}, expected one of {FORMATS}")
+
+    with open(path, newline="", encoding="utf-8") as file:
+        if format == "csv":
+            yield from csv.DictReader(file)
+            return
+
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {number} is not a JSON object")
+
+            yield record
@@ -0,0 +1,182 @@
+import gzip
+import hashlib
+import mmap
+import os
+from typing import Iterable, Iterator, Union
+
+DIGEST_SIZE = 8
+
+
+def password_digest(password: str) -> bytes:
+    """
+    Builds the fixed size digest a password is stored and looked up by
+
+    Parameters
+    ----------
+    password : str
+        The password, compared case insensitively
+
+    Returns
+    -------
+    bytes
+        The first DIGEST_SIZE bytes of its SHA-256
+    """
+
+    return hashlib.sha256(password.lower().strip().encode()).digest()[:DIGEST_SIZE]
+
+
+def read_passwords(path: Union[str, os.PathLike]) -> Iterator[str]:
+    """
+    Reads a password list with one password per line, gzipped or not
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The password list path
+
+    Returns
+    -------
+    Iterator[str]
+        The non empty passwords
+    """
+
+    with open(path, "rb") as file:
+        gzipped = file.read(2) == b"\x1f\x8b"
+
+    opener = gzip.open if gzipped else open
+
+    with opener(path, "rt", encoding="utf-8", errors="ignore") as file:
+        for line in file:
+            if line.strip():
+                yield line
+
+
+def build_digests(passwords: Iterable[str]) -> bytes:
+    """
+    Builds the sorted and deduplicated digest array of the passwords
+
+    Parameters
+    ----------
+    passwords : Iterable[str]
+        The passwords
+
+    Returns
+    -------
+    bytes
+        The digests, one after the other
+    """
+
+    return b"".join(sorted({password_digest(password) for password in passwords}))
+
+
+class PasswordDigests:
+    """
+    Sorted array of password digests searched in place. Opened from a
+    file it is memory mapped read only, so every worker process shares
+    the same page cache pages instead of holding its own copy
+
+    Attributes
+    ----------
+    buffer : bytes | mmap.mmap
+        The sorted digests
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        """
+        Initializes the password digests
+
+        Parameters
+        ----------
+        buffer : bytes | mmap.mmap
+            The sorted digests
+        """
+
+        if len(buffer) % DIGEST_SIZE:
+            raise ValueError("The digest array is truncated")
+
+        self.buffer = buffer
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike]) -> "PasswordDigests":
+        """
+        Memory maps a digest file written by build_password_digests
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The digest file path
+
+        Returns
+        -------
+        PasswordDigests
+            The password digests
+        """
+
+        with open(path, "rb") as file:
+            if not os.fstat(file.fileno()).st_size:
+                return cls(b"")
+
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_password_list(cls, path: Union[str, os.PathLike]) -> "PasswordDigests":
+        """
+        Builds the digests of a password list in memory
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The password list path, gzipped or not
+
+        Returns
+        -------
+        PasswordDigests
+            The password digests
+        """
+
+        return cls(build_digests(read_passwords(path)))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of digests
+
+        Returns
+        -------
+        int
+            The number of digests
+        """
+
+        return len(self.buffer) // DIGEST_SIZE
+
+    def __contains__(self, password: str) -> bool:
+        """
+        Binary searches the digest of the password
+
+        Parameters
+        ----------
+        password : str
+            The password
+
+        Returns
+        -------
+        bool
+            Whether the password is in the list
+        """
+
+        digest = password_digest(password)
+        low, high = 0, len(self)
+
+        while low < high:
+            middle = (low + high) // 2
+            offset = middle * DIGEST_SIZE
+            candidate = self.buffer[offset : offset + DIGEST_SIZE]
+
+            if candidate == digest:
+                return True
+
+            if candidate < digest:
+                low = middle + 1
+            else:
+                high = middle
+
+        return False
@@ -0,0 +1,161 @@
+import datetime
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from apps.authentication.models import ConsumedToken
+
+CACHE_KEY_PREFIX = "consumed-token:"
+
+
+class ConsumedTokenLedger:
+    """
+    Records single use tokens by id. The table is the source of truth
+    and the cache answers repeated checks without touching it, each
+    entry living only until the token itself would have expired
+    """
+
+    @staticmethod
+    def _cache_key(jti: str) -> str:
+        """
+        Builds the cache key of a token id
+
+        Parameters
+        ----------
+        jti : str
+            The token id
+
+        Returns
+        -------
+        str
+            The cache key
+        """
+
+        return f"{CACHE_KEY_PREFIX}{jti}"
+
+    @staticmethod
+    def _remember(jti: str, expires_at: datetime.datetime) -> None:
+        """
+        Caches a consumed token id until the token expires
+
+        Parameters
+        ----------
+        jti : str
+            The token id
+        expires_at : datetime.datetime
+            When the token expires
+        """
+
+        timeout = (expires_at - timezone.now()).total_seconds()
+
+        if timeout > 0:
+            cache.set(ConsumedTokenLedger._cache_key(jti), True, timeout=timeout)
+
+    @classmethod
+    def is_consumed(cls, jti: str) -> bool:
+        """
+        Checks if a token id has already been consumed
+
+        Parameters
+        ----------
+        jti : str
+            The token id
+
+        Returns
+        -------
+        bool
+            Whether the token has been consumed
+        """
+
+        if cache.get(cls._cache_key(jti)):
+            return True
+
+        consumed = ConsumedToken.objects.filter(jti=jti).first()
+
+        if consumed is None:
+            return False
+
+        cls._remember(jti, consumed.expires_at)
+
+        return True
+
+    @classmethod
+    def consume(cls, jti: str, expires_at: datetime.datetime) -> bool:
+        """
+        Marks a token id as consumed
+
+        Parameters
+        ----------
+        jti : str
+            The token id
+        expires_at : datetime.datetime
+            When the token expires
+
+        Returns
+        -------
+        bool
+            Whether this call consumed the token, False if it was already consumed
+
+        Raises
+        ------
+        DatabaseError
+            If the id could not be written, it is not cached as consumed then
+        """
+
+        try:
+            with transaction.atomic():
+                ConsumedToken.objects.create(jti=jti, expires_at=expires_at)
+        except IntegrityError:
+            consumed = False
+        else:
+            consumed = True
+
+        # Only once the table holds the id, other errors propagate uncached
+        cls._remember(jti, expires_at)
+
+        return consumed
+
+    @classmethod
+    async def ais_consumed(cls, jti: str) -> bool:
+        """
+        Async version of is_consumed
+        """
+
+        if await cache.aget(cls._cache_key(jti)):
+            return True
+
+        return await sync_to_async(cls.is_consumed)(jti)
+
+    @classmethod
+    async def aconsume(cls, jti: str, expires_at: datetime.datetime) -> bool:
+        """
+        Async version of consume
+        """
+
+        return await sync_to_async(cls.consume)(jti, expires_at)
+
+    @staticmethod
+    def clear_expired(now: Optional[datetime.datetime] = None) -> int:
+        """
+        Deletes the ids of tokens that have expired, since expired
+        tokens are rejected before the ledger is checked
+
+        Parameters
+        ----------
+        now : Optional[datetime.datetime]
+            The reference time, defaults to the current time
+
+        Returns
+        -------
+        int
+            The number of deleted ids
+        """
+
+        deleted, _ = ConsumedToken.objects.filter(
+            expires_at__lte=now or timezone.now()
+        ).delete()
+
+        return deleted
@@ -0,0 +1,72 @@
+from pathlib import Path
+from typing import Optional
+
+from django.contrib.auth import password_validation
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext as _
+
+from apps.authentication.utils.passwords.digests import PasswordDigests
+
+DJANGO_PASSWORD_LIST_PATH = (
+    Path(password_validation.__file__).resolve().parent / "common-passwords.txt.gz"
+)
+
+
+class CommonPasswordValidator:
+    """
+    Validates that the password is not a common password, looking it up in
+    a sorted digest array. With digests_path the array is a memory mapped
+    file built by build_password_digests, which can hold a breach list of
+    any size without adding to the memory of each worker. Without it the
+    list Django ships with is loaded in memory
+    """
+
+    def __init__(self, digests_path: Optional[str] = None) -> None:
+        """
+        Initializes the validator
+
+        Parameters
+        ----------
+        digests_path : Optional[str]
+            The digest file path, defaults to the Django password list
+        """
+
+        if digests_path:
+            self.digests = PasswordDigests.open(digests_path)
+        else:
+            self.digests = PasswordDigests.from_password_list(DJANGO_PASSWORD_LIST_PATH)
+
+    def validate(self, password: str, user=None) -> None:
+        """
+        Validates the password
+
+        Parameters
+        ----------
+        password : str
+            The password
+        user : Optional[AppUser]
+            The user, unused
+
+        Raises
+        ------
+        ValidationError
+            If the password is a common password
+        """
+
+        if password in self.digests:
+            raise ValidationError(
+                _("This password is too common."),
+                code="password_too_common",
+            )
+
+    def get_help_text(self) -> str:
+        """
+        Returns the validator help text
+
+        Returns
+        -------
+        str
+            The help text
+        """
+
+        return _("Your password can’t be a commonly used password.")
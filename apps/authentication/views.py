@@ -1,20 +1,42 @@
-from django.contrib.auth import login, logout
+import datetime
+
+from django.contrib.auth import alogin, alogout
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect, render
-from django.utils.decorators import method_decorator
+from django.utils.cache import add_never_cache_headers
 from django.views import View
-from django.views.decorators.cache import never_cache
 
 from apps.authentication.models import AppUser
 from apps.authentication.utils.auth.sign_in import SignIn
 from apps.authentication.utils.auth.sign_up import SignUp
+from apps.authentication.utils.hashing.exceptions import HashingPoolSaturatedError
+from apps.authentication.utils.tokens.ledger import ConsumedTokenLedger
+from apps.emails.utils.queue import EmailQueue
 from utils.email.context import EmailContext
 from utils.email.strategies.email_confirmation import EmailConfirmationStrategy
 from utils.tokens.exceptions import TokenValidationError
 from utils.tokens.tokens import Tokens
 
-email_confirmation = EmailContext(strategy=EmailConfirmationStrategy)
+email_confirmation = EmailContext(strategy=EmailConfirmationStrategy, queue=EmailQueue)
+
+
+def service_unavailable() -> JsonResponse:
+    """
+    Builds the response returned when the password hashing pool is saturated
+
+    Returns
+    -------
+    JsonResponse
+        A JSON response with a 503 status code
+    """
+
+    response = JsonResponse(
+        {"errors": ["Too many requests, please try again later."]}, status=503
+    )
+    response["Retry-After"] = "1"
+
+    return response
 
 
 class SignInView(View):
@@ -22,8 +44,7 @@ class SignInView(View):
     The sign in view
     """
 
-    @method_decorator(never_cache)
-    def get(self, request: WSGIRequest) -> HttpResponseRedirect | HttpResponse:
+    async def get(self, request: WSGIRequest) -> HttpResponseRedirect | HttpResponse:
         """
         Renders the sign in page
 
@@ -39,16 +60,22 @@ class SignInView(View):
             otherwise renders the sign in page
         """
 
-        if request.user.is_authenticated:
-            return redirect("user")
+        user = await request.auser()
 
-        redirected = request.GET.get("next")
+        if user.is_authenticated:
+            response = redirect("user")
+        else:
+            redirected = request.GET.get("next")
+            response = render(
+                request, "authentication/sign-in.html", {"redirected": redirected}
+            )
 
-        return render(
-            request, "authentication/sign-in.html", {"redirected": redirected}
-        )
+        # method_decorator(never_cache) does not support async handlers yet
+        add_never_cache_headers(response)
+
+        return response
 
-    def post(self, request: WSGIRequest) -> JsonResponse | HttpResponse:
+    async def post(self, request: WSGIRequest) -> JsonResponse | HttpResponse:
         """
         Handles the sign in form submission
 
@@ -71,12 +98,15 @@ class SignInView(View):
         if sign_in.errors:
             return JsonResponse({"errors": sign_in.errors}, status=422)
 
-        sign_in.validate_user()
+        try:
+            await sign_in.avalidate_user()
+        except HashingPoolSaturatedError:
+            return service_unavailable()
 
         if sign_in.errors:
             return JsonResponse({"errors": sign_in.errors}, status=401)
 
-        login(request, sign_in.user)
+        await alogin(request, sign_in.user)
 
         return HttpResponse(status=204)
 
@@ -86,8 +116,7 @@ class SignUpView(View):
     The sign up view
     """
 
-    @method_decorator(never_cache)
-    def get(self, request: WSGIRequest) -> HttpResponseRedirect | HttpResponse:
+    async def get(self, request: WSGIRequest) -> HttpResponseRedirect | HttpResponse:
         """
         Renders the sign up page
 
@@ -103,12 +132,19 @@ class SignUpView(View):
             otherwise renders the sign up page
         """
 
-        if request.user.is_authenticated:
-            return redirect("user")
+        user = await request.auser()
+
+        if user.is_authenticated:
+            response = redirect("user")
+        else:
+            response = render(request, "authentication/sign-up.html")
+
+        # method_decorator(never_cache) does not support async handlers yet
+        add_never_cache_headers(response)
 
-        return render(request, "authentication/sign-up.html")
+        return response
 
-    def post(self, request: WSGIRequest) -> JsonResponse | HttpResponse:
+    async def post(self, request: WSGIRequest) -> JsonResponse | HttpResponse:
         """
         Handles the sign up form submission
 
@@ -131,14 +167,17 @@ class SignUpView(View):
         if sign_up.errors:
             return JsonResponse({"errors": sign_up.errors}, status=422)
 
-        sign_up.validate_user()
+        try:
+            await sign_up.avalidate_user()
+        except HashingPoolSaturatedError:
+            return service_unavailable()
 
         if sign_up.errors:
             return JsonResponse({"errors": sign_up.errors}, status=422)
 
-        sign_up.user.save()
+        await sign_up.user.asave()
 
-        email_confirmation.send(
+        await email_confirmation.aenqueue(
             to=sign_up.user.email, request=request, user_id=sign_up.user.id
         )
 
@@ -150,7 +189,7 @@ class EmailConfirmationView(View):
     The email confirmation view
     """
 
-    def get(self, request: WSGIRequest) -> HttpResponseRedirect | HttpResponse:
+    async def get(self, request: WSGIRequest) -> HttpResponseRedirect | HttpResponse:
         """
         Renders the email confirmation page
 
@@ -169,7 +208,7 @@ class EmailConfirmationView(View):
 
         email = request.GET.get("email")
 
-        user = AppUser.objects.filter(email=email).first()
+        user = await AppUser.objects.by_email(email).afirst()
 
         if not user or user.email_confirmed:
             return redirect("sign-in")
@@ -184,7 +223,7 @@ class ActivateAccountView(View):
     The activate account view
     """
 
-    def get(self, request: WSGIRequest) -> HttpResponseRedirect:
+    async def get(self, request: WSGIRequest) -> HttpResponseRedirect:
         """
         Activates the user account
 
@@ -197,7 +236,8 @@ class ActivateAccountView(View):
         -------
         HttpResponseRedirect
             Redirects to the sign up page if the token is invalid or user is not found,
-            redirects to the sign in page if the user is already active,
+            redirects to the sign in page if the token has already been used
+            or the user is already active,
             otherwise signs in the user and redirects to the user page
         """
 
@@ -208,19 +248,34 @@ class ActivateAccountView(View):
         except TokenValidationError:
             return redirect("sign-up")
 
-        user = AppUser.objects.filter(id=payload["user_id"]).first()
+        jti = payload.get("jti")
 
-        if not user:
-            return redirect("sign-up")
+        # Tokens issued before they got an id expire at most DEFAULT_EXPIRATION_DAYS
+        # after the deploy that added it, until then only the conditional
+        # activation below keeps them from signing in twice
+        if jti:
+            if await ConsumedTokenLedger.ais_consumed(jti):
+                return redirect("sign-in")
 
-        if user.email_confirmed:
-            return redirect("sign-in")
+            expires_at = datetime.datetime.fromtimestamp(
+                payload["exp"], tz=datetime.timezone.utc
+            )
+
+            if not await ConsumedTokenLedger.aconsume(jti, expires_at):
+                return redirect("sign-in")
+
+        user_id = payload["user_id"]
+
+        if not await AppUser.objects.aactivate(user_id):
+            if await AppUser.objects.filter(id=user_id).aexists():
+                return redirect("sign-in")
+
+            return redirect("sign-up")
 
-        user.is_active = True
-        user.email_confirmed = True
-        user.save()
+        # Fetched after the update, only to sign in the activated user
+        user = await AppUser.objects.aget(id=user_id)
 
-        login(request, user)
+        await alogin(request, user, backend="apps.authentication.backends.EmailBackend")
 
         response = redirect("user")
         response.set_cookie("accountActivated", "true")
@@ -233,7 +288,7 @@ class SignOutView(View):
     The sign out view
     """
 
-    def get(self, request: WSGIRequest) -> HttpResponse:
+    async def get(self, request: WSGIRequest) -> HttpResponse:
         """
         Signs out the user
 
@@ -248,6 +303,6 @@ class SignOutView(View):
             A successfull HTTP response
         """
 
-        logout(request)
+        await alogout(request)
 
         return HttpResponse(status=204)
@@ -1,7 +1,8 @@
 from django.urls import path
 
 from apps.base import views
+from utils.cache.page import anonymous_page_cache
 
 urlpatterns = [
-    path("", views.home, name="home"),
+    path("", anonymous_page_cache()(views.home), name="home"),
 ]
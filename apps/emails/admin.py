@@ -0,0 +1,13 @@
+from django.contrib import admin
+
+from apps.emails.models import QueuedEmail
+
+
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    """
+    Queued email admin
+    """
+
+    list_display = ("subject", "status", "attempts", "available_at")
+    list_filter = ("status",)
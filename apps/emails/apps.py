@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class EmailsConfig(AppConfig):
+    """
+    Emails app configuration
+    """
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.emails"
@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.emails.utils.queue import MAX_ATTEMPTS, EmailQueue
+
+
+class Command(BaseCommand):
+    """
+    Delivers the queued emails
+    """
+
+    help = "Delivers the queued emails, retrying failed ones with backoff"
+
+    def add_arguments(self, parser) -> None:
+        """
+        Adds the command arguments
+
+        Parameters
+        ----------
+        parser : CommandParser
+            The argument parser
+        """
+
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Process a single batch and exit"
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Runs the worker loop
+        """
+
+        try:
+            while True:
+                close_old_connections()
+
+                sent, failed = EmailQueue.process(
+                    batch_size=options["batch_size"],
+                    max_attempts=options["max_attempts"],
+                )
+
+                if sent or failed:
+                    self.stdout.write(f"Sent {sent} emails, {failed} failed attempts")
+
+                if options["once"]:
+                    break
+
+                if not sent and not failed:
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            self.stdout.write("Email queue worker stopped")
@@ -0,0 +1,52 @@
+from django.db import models
+from django.utils import timezone
+
+
+class QueuedEmail(models.Model):
+    """
+    Outbound email waiting to be delivered by the email queue worker
+    """
+
+    class Status(models.TextChoices):
+        """
+        Delivery status choices
+        """
+
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254, blank=True)
+    to = models.JSONField(default=list)
+    alternatives = models.JSONField(default=list)
+    status = models.CharField(
+        max_length=16, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        """
+        String representation of the queued email
+
+        Returns
+        -------
+        str
+            The subject of the email
+        """
+
+        return self.subject
+
+    class Meta:
+        """
+        Metadata options
+        """
+
+        db_table = "queued_emails"
+        verbose_name_plural = "Queued emails"
+        indexes = [models.Index(fields=["status", "available_at"])]
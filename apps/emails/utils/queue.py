@@ -0,0 +1,236 @@
+import contextlib
+import datetime
+
+from django.core.mail import EmailMessage, EmailMultiAlternatives, get_connection
+from django.db.models import F
+from django.utils import timezone
+
+from apps.emails.models import QueuedEmail
+from utils.email.queues.abstract import EmailQueueAbstract
+
+MAX_ATTEMPTS = 5
+BACKOFF_SECONDS = 30
+MAX_BACKOFF_SECONDS = 60 * 60
+LEASE_SECONDS = 5 * 60
+
+
+class EmailQueue(EmailQueueAbstract):
+    """
+    Database backed email queue
+    """
+
+    @staticmethod
+    def push(message: EmailMessage) -> None:
+        """
+        Stores the email message so the worker can deliver it later
+
+        Parameters
+        ----------
+        message : EmailMessage
+            The email message to deliver
+        """
+
+        EmailQueue._to_queued_email(message).save()
+
+    @staticmethod
+    def push_many(messages: list[EmailMessage], batch_size: int = 500) -> None:
+        """
+        Stores the email messages with bulk inserts
+
+        Parameters
+        ----------
+        messages : list[EmailMessage]
+            The email messages to deliver
+        batch_size : int
+            The number of emails inserted per statement
+        """
+
+        QueuedEmail.objects.bulk_create(
+            [EmailQueue._to_queued_email(message) for message in messages],
+            batch_size=batch_size,
+        )
+
+    @staticmethod
+    async def apush(message: EmailMessage) -> None:
+        """
+        Async version of push
+
+        Parameters
+        ----------
+        message : EmailMessage
+            The email message to deliver
+        """
+
+        await EmailQueue._to_queued_email(message).asave()
+
+    @classmethod
+    def process(
+        cls, batch_size: int = 50, max_attempts: int = MAX_ATTEMPTS
+    ) -> tuple[int, int]:
+        """
+        Delivers a batch of due emails over a single mail connection,
+        rescheduling the failed ones with exponential backoff
+
+        Parameters
+        ----------
+        batch_size : int
+            The maximum number of emails to deliver
+        max_attempts : int
+            The number of attempts after which an email is marked as failed
+
+        Returns
+        -------
+        tuple[int, int]
+            The number of sent emails and the number of failed attempts
+        """
+
+        now = timezone.now()
+
+        emails = list(
+            QueuedEmail.objects.filter(
+                status=QueuedEmail.Status.PENDING, available_at__lte=now
+            ).order_by("available_at")[:batch_size]
+        )
+
+        sent = failed = 0
+
+        if not emails:
+            return sent, failed
+
+        connection = get_connection()
+
+        with contextlib.suppress(OSError):
+            # Failures are retried and rescheduled per email below
+            connection.open()
+
+        try:
+            for email in emails:
+                if not cls._claim(email, now):
+                    continue
+
+                try:
+                    cls._build_message(email, connection).send()
+                except Exception as e:
+                    cls._reschedule(email, e, max_attempts)
+                    failed += 1
+                else:
+                    email.status = QueuedEmail.Status.SENT
+                    email.sent_at = timezone.now()
+                    email.save(update_fields=["status", "sent_at"])
+                    sent += 1
+        finally:
+            connection.close()
+
+        return sent, failed
+
+    @staticmethod
+    def _to_queued_email(message: EmailMessage) -> QueuedEmail:
+        """
+        Builds the queued email from the email message
+
+        Parameters
+        ----------
+        message : EmailMessage
+            The email message
+
+        Returns
+        -------
+        QueuedEmail
+            The unsaved queued email
+        """
+
+        return QueuedEmail(
+            subject=message.subject,
+            body=message.body,
+            from_email=message.from_email or "",
+            to=list(message.to),
+            alternatives=[list(alt) for alt in getattr(message, "alternatives", [])],
+        )
+
+    @staticmethod
+    def _claim(email: QueuedEmail, now: datetime.datetime) -> bool:
+        """
+        Leases the email to the current worker so concurrent
+        workers do not deliver it twice
+
+        Parameters
+        ----------
+        email : QueuedEmail
+            The queued email
+        now : datetime.datetime
+            The current time
+
+        Returns
+        -------
+        bool
+            Whether the email was claimed
+        """
+
+        claimed = QueuedEmail.objects.filter(
+            pk=email.pk,
+            status=QueuedEmail.Status.PENDING,
+            attempts=email.attempts,
+        ).update(
+            attempts=F("attempts") + 1,
+            available_at=now + datetime.timedelta(seconds=LEASE_SECONDS),
+        )
+
+        if claimed:
+            email.attempts += 1
+
+        return bool(claimed)
+
+    @staticmethod
+    def _build_message(email: QueuedEmail, connection) -> EmailMultiAlternatives:
+        """
+        Rebuilds the email message from the queued email
+
+        Parameters
+        ----------
+        email : QueuedEmail
+            The queued email
+        connection
+            The mail connection used to send the message
+
+        Returns
+        -------
+        EmailMultiAlternatives
+            The email message
+        """
+
+        return EmailMultiAlternatives(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email or None,
+            to=email.to,
+            alternatives=[tuple(alt) for alt in email.alternatives],
+            connection=connection,
+        )
+
+    @staticmethod
+    def _reschedule(email: QueuedEmail, error: Exception, max_attempts: int) -> None:
+        """
+        Schedules a new delivery attempt or marks
+        the email as failed if there are no attempts left
+
+        Parameters
+        ----------
+        email : QueuedEmail
+            The queued email
+        error : Exception
+            The delivery error
+        max_attempts : int
+            The number of attempts after which the email is marked as failed
+        """
+
+        email.last_error = str(error)
+
+        if email.attempts >= max_attempts:
+            email.status = QueuedEmail.Status.FAILED
+        else:
+            delay = min(
+                BACKOFF_SECONDS * 2 ** (email.attempts - 1), MAX_BACKOFF_SECONDS
+            )
+            email.available_at = timezone.now() + datetime.timedelta(seconds=delay)
+
+        email.save(update_fields=["status", "available_at", "last_error"])
@@ -5,8 +5,6 @@ from django.shortcuts import render
 from django.utils.decorators import method_decorator
 from django.views import View
 
-from apps.authentication.models import AppUser
-
 
 class UserView(View):
     """
@@ -31,12 +29,10 @@ class UserView(View):
 
         account_activated = request.COOKIES.get("accountActivated")
 
-        user = AppUser.objects.get(id=request.user.id)
-
         response = render(
             request,
             "users/user.html",
-            {"account_activated": account_activated, "user": user},
+            {"account_activated": account_activated, "user": request.user},
         )
 
         if account_activated:
@@ -44,6 +40,7 @@ class UserView(View):
 
         return response
 
+    @method_decorator(login_required(login_url="sign-in"))
     def post(self, request: WSGIRequest) -> HttpResponse:
         """
         Handles the user form submission
@@ -62,14 +59,18 @@ class UserView(View):
         first_name = request.POST.get("first-name")
         last_name = request.POST.get("last-name")
 
-        user = AppUser.objects.get(id=request.user.id)
+        user = request.user
+        update_fields = []
 
         if first_name != user.first_name:
             user.first_name = first_name
+            update_fields.append("first_name")
 
         if last_name != user.last_name:
             user.last_name = last_name
+            update_fields.append("last_name")
 
-        user.save()
+        if update_fields:
+            user.save(update_fields=update_fields)
 
         return HttpResponse(status=200)
@@ -0,0 +1,331 @@
+"""
+Drives the sign up, activation, profile update, sign out and sign in flows
+over HTTP against a running server and compares them with a stored baseline
+
+Without --base-url a development server is started on a throwaway SQLite
+database with the locmem email backend and rate limits off. With it, the
+server must share this process database and SECRET_KEY, since activation
+tokens are generated here with Tokens.generate_token.
+
+Usage: python -m benchmarks.auth_flows [--users 20] [--concurrency 4] [--check]
+"""
+
+import argparse
+import contextlib
+import http.cookiejar
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+from benchmarks.environment import setup_django
+from benchmarks.stats import summarize
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "auth_flows.json"
+PASSWORD = "benchmark-password"
+STEPS = ("sign-up", "activate-account", "update-profile", "sign-out", "sign-in")
+
+
+class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """
+    Reports redirects as responses instead of following them
+    """
+
+    def redirect_request(self, *args, **kwargs) -> None:
+        """
+        Does not follow the redirect
+        """
+
+        return None
+
+
+class BrowserSession:
+    """
+    Cookie and CSRF aware HTTP client for one virtual user
+    """
+
+    def __init__(self, base_url: str) -> None:
+        """
+        Initializes the session
+
+        Parameters
+        ----------
+        base_url : str
+            The server URL
+        """
+
+        self.base_url = base_url
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), NoRedirectHandler()
+        )
+
+    def request(self, method: str, path: str, data: Optional[dict] = None) -> int:
+        """
+        Sends a request with the CSRF token of the session
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method
+        path : str
+            The path
+        data : Optional[dict]
+            The form data
+
+        Returns
+        -------
+        int
+            The response status code
+        """
+
+        csrf_token = next(
+            (cookie.value for cookie in self.cookies if cookie.name == "csrftoken"), ""
+        )
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=urllib.parse.urlencode(data).encode() if data is not None else None,
+            method=method,
+            headers={"X-CSRFToken": csrf_token, "Referer": self.base_url},
+        )
+
+        try:
+            with self.opener.open(request, timeout=60) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+
+def run_user(base_url: str, index: int, latencies: dict, errors: dict) -> None:
+    """
+    Runs the flows of one new user, timing every step
+
+    Parameters
+    ----------
+    base_url : str
+        The server URL
+    index : int
+        The user number
+    latencies : dict
+        The latencies by step, filled in place
+    errors : dict
+        The failed requests by step, filled in place
+    """
+
+    from apps.authentication.models import AppUser
+    from utils.tokens.tokens import Tokens
+
+    session = BrowserSession(base_url)
+    email = f"load{index}-{time.time_ns()}@email.com"
+
+    def step(name: str, expected: int, method: str, path: str, data=None) -> None:
+        start = time.perf_counter()
+        status = session.request(method, path, data)
+        latencies[name].append(time.perf_counter() - start)
+        errors[name] += status != expected
+
+    session.request("GET", "/sign-up")
+    step(
+        "sign-up",
+        204,
+        "POST",
+        "/sign-up",
+        {"username": email.split("@")[0], "email": email, "password": PASSWORD},
+    )
+
+    user = AppUser.objects.filter(email=email).first()
+    token = Tokens.generate_token(data={"user_id": user.id if user else 0})
+
+    step("activate-account", 302, "GET", f"/activate-account?token={token}")
+    step(
+        "update-profile",
+        200,
+        "POST",
+        "/user",
+        {"first-name": f"First{index}", "last-name": f"Last{index}"},
+    )
+    step("sign-out", 204, "GET", "/sign-out")
+    session.request("GET", "/sign-in")
+    step("sign-in", 204, "POST", "/sign-in", {"email": email, "password": PASSWORD})
+
+
+@contextlib.contextmanager
+def local_server() -> Iterator[str]:
+    """
+    Runs a development server on a throwaway database
+
+    Returns
+    -------
+    Iterator[str]
+        The server URL
+    """
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    os.environ.update(
+        DATABASE_NAME=os.path.join(tempfile.mkdtemp(), "load.sqlite3"),
+        EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+        RATELIMIT_ENABLED="False",
+    )
+    manage = [sys.executable, "manage.py"]
+    subprocess.run(manage + ["migrate", "-v", "0"], check=True)
+    server = subprocess.Popen(
+        manage + ["runserver", "--noreload", f"127.0.0.1:{port}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        for _ in range(100):
+            with contextlib.suppress(OSError):
+                urllib.request.urlopen(base_url + "/sign-in", timeout=1).close()
+                break
+
+            time.sleep(0.1)
+
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def compare(results: dict, baseline: dict, tolerance: float, slack: float) -> list[str]:
+    """
+    Lists the steps that regressed against the baseline
+
+    Parameters
+    ----------
+    results : dict
+        The flow throughput and the latencies by step
+    baseline : dict
+        The baseline results
+    tolerance : float
+        The allowed relative slowdown
+    slack : float
+        Milliseconds of p95 allowed on top, so fast steps are not flaky
+
+    Returns
+    -------
+    list[str]
+        The regressions, empty if there are none
+    """
+
+    regressions = []
+
+    for name, expected in baseline.items():
+        result = results.get(name)
+
+        if result is None:
+            regressions.append(f"{name}: not run")
+            continue
+
+        if result.get("errors"):
+            regressions.append(f"{name}: {result['errors']} failed requests")
+
+        if (
+            "p95" in expected
+            and result["p95"] > expected["p95"] * (1 + tolerance) + slack
+        ):
+            regressions.append(
+                f"{name}: p95 {result['p95']:.1f} ms, baseline {expected['p95']:.1f} ms"
+            )
+
+        if "rps" in expected and result["rps"] < expected["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['rps']:.2f}/s, baseline {expected['rps']:.2f}/s"
+            )
+
+    return regressions
+
+
+def main() -> None:
+    """
+    Runs the load test
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--base-url")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--check", action="store_true", help="Exit with 1 on a regression"
+    )
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown before a step counts as a regression",
+    )
+    parser.add_argument(
+        "--slack",
+        type=float,
+        default=10,
+        help="Milliseconds of p95 allowed on top of the tolerance",
+    )
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        base_url = args.base_url or stack.enter_context(local_server())
+        setup_django()
+
+        latencies, errors = defaultdict(list), defaultdict(int)
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            list(
+                executor.map(
+                    lambda index: run_user(base_url, index, latencies, errors),
+                    range(args.users),
+                )
+            )
+
+        elapsed = time.perf_counter() - start
+
+    # The steps of a user run one after the other while the users overlap,
+    # so throughput is only measured for whole flows and steps by latency
+    flows = args.users / elapsed if elapsed else 0.0
+    print(f"{'flows':<24} {flows:>9.2f} flows/s")
+    results = {"flows": {"rps": flows}}
+    results.update(
+        (name, summarize(name, latencies[name], None, errors[name])) for name in STEPS
+    )
+
+    if args.write_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        rounded = {
+            name: {key: round(value, 2) for key, value in result.items()}
+            for name, result in results.items()
+        }
+        args.baseline.write_text(json.dumps(rounded, indent=4) + "\n")
+        print(f"Baseline written to {args.baseline}")
+
+    if args.check:
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.tolerance, args.slack
+        )
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
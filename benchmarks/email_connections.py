@@ -0,0 +1,104 @@
+"""
+Compares one SMTP connection per message against pooled connections
+
+Usage: python -m benchmarks.email_connections [--messages 200] [--latency 0.05]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.environment import setup_django
+from benchmarks.smtp_server import SMTPSinkServer
+
+
+def run(backend: str, server: SMTPSinkServer, messages: int, threads: int) -> None:
+    """
+    Sends the messages through the given backend and prints the results
+
+    Parameters
+    ----------
+    backend : str
+        The dotted path of the email backend
+    server : SMTPSinkServer
+        The local SMTP server
+    messages : int
+        The number of messages to send
+    threads : int
+        The number of concurrent senders
+    """
+
+    from django.core.mail import EmailMessage, get_connection
+
+    def send(index: int) -> None:
+        connection = get_connection(
+            backend,
+            host="127.0.0.1",
+            port=server.port,
+            username="",
+            password="",
+            use_tls=False,
+        )
+        EmailMessage(
+            subject=f"Message {index}",
+            body="Body",
+            to=["user@email.com"],
+            connection=connection,
+        ).send()
+
+    server.connections = server.messages = 0
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(send, range(messages)))
+
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{backend.rsplit('.', 1)[-1]:<20} {messages / elapsed:>10.1f} msg/s "
+        f"{server.connections:>6} connections {server.messages:>6} messages"
+    )
+
+
+def main() -> None:
+    """
+    Runs the benchmark
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="Seconds added to every new connection to emulate TLS and auth",
+    )
+    args = parser.parse_args()
+
+    setup_django()
+
+    from utils.email.backends.pool import close_pools
+
+    server = SMTPSinkServer(connect_latency=args.latency)
+    server.start()
+
+    run(
+        "django.core.mail.backends.smtp.EmailBackend",
+        server,
+        args.messages,
+        args.threads,
+    )
+    run(
+        "utils.email.backends.pooled_smtp.PooledEmailBackend",
+        server,
+        args.messages,
+        args.threads,
+    )
+
+    close_pools()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
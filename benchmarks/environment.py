@@ -0,0 +1,50 @@
+import os
+import tempfile
+
+import django
+
+
+def setup_django() -> None:
+    """
+    Configures Django for the standalone benchmark scripts
+    """
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "dj_wc.settings")
+    django.setup()
+
+
+def setup_test_database(fast_hasher: bool = False) -> None:
+    """
+    Creates a migrated throwaway SQLite file database for the benchmark
+    and the test environment used by the Django test clients. Rate limits
+    are turned off since every benchmark request comes from the same client,
+    and static files are not hashed since they are not collected
+
+    Parameters
+    ----------
+    fast_hasher : bool
+        Whether to hash passwords with MD5 so the
+        framework overhead is not hidden by PBKDF2
+    """
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    settings.RATELIMITS = {}
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+
+    if fast_hasher:
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    connection.settings_dict["TEST"]["NAME"] = os.path.join(
+        tempfile.mkdtemp(), "benchmark.sqlite3"
+    )
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
@@ -0,0 +1,80 @@
+"""
+Measures the session cost of an authenticated request for every session engine
+
+Usage: python -m benchmarks.sessions [--requests 500]
+"""
+
+import argparse
+import time
+
+from benchmarks.environment import setup_django, setup_test_database
+
+
+def run(engine: str, requests: int) -> None:
+    """
+    Signs in and requests the user page through the given session engine
+
+    Parameters
+    ----------
+    engine : str
+        The dotted path of the session engine
+    requests : int
+        The number of requests to send
+    """
+
+    from django.db import connection
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+
+    from apps.authentication.models import AppUser
+
+    with override_settings(SESSION_ENGINE=engine):
+        client = Client()
+        client.force_login(AppUser.objects.get())
+        client.get("/user")
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+
+            for _ in range(requests):
+                client.get("/user")
+
+            elapsed = time.perf_counter() - start
+
+    session_queries = sum(
+        "django_session" in query["sql"] for query in queries.captured_queries
+    )
+
+    print(
+        f"{engine.rsplit('.', 1)[-1]:<16} {requests / elapsed:>9.1f} req/s  "
+        f"{len(queries) / requests:>5.2f} queries/request  "
+        f"{session_queries / requests:>5.2f} session queries/request"
+    )
+
+
+def main() -> None:
+    """
+    Runs the benchmark
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django()
+    setup_test_database(fast_hasher=True)
+
+    from django.conf import settings
+
+    from apps.authentication.models import AppUser
+
+    AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+
+    for engine in settings.SESSION_ENGINES.values():
+        run(engine, args.requests)
+
+
+if __name__ == "__main__":
+    main()
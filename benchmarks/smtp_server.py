@@ -0,0 +1,98 @@
+import socketserver
+import threading
+import time
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """
+    Minimal SMTP session that accepts and discards every message
+    """
+
+    def handle(self) -> None:
+        """
+        Handles one SMTP connection
+        """
+
+        self.server.connections += 1
+        time.sleep(self.server.connect_latency)
+        self._reply("220 localhost SMTP sink")
+
+        while line := self.rfile.readline():
+            command = line.decode("ascii", "replace").strip().upper()
+
+            if command.startswith(("EHLO", "HELO")):
+                self._reply("250 localhost")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+
+                self.server.messages += 1
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+    def _reply(self, line: str) -> None:
+        """
+        Writes a reply line to the client
+
+        Parameters
+        ----------
+        line : str
+            The reply line
+        """
+
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+
+class SMTPSinkServer(socketserver.ThreadingTCPServer):
+    """
+    Local SMTP server stand-in counting connections and messages
+
+    Attributes
+    ----------
+    connect_latency : float
+        Seconds to wait before greeting, emulates the TLS and auth handshake
+    connections : int
+        The number of accepted connections
+    messages : int
+        The number of received messages
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, connect_latency: float = 0) -> None:
+        """
+        Binds the server to a free local port
+
+        Parameters
+        ----------
+        connect_latency : float
+            Seconds to wait before greeting each new connection
+        """
+
+        super().__init__(("127.0.0.1", 0), SMTPSinkHandler)
+
+        self.connect_latency = connect_latency
+        self.connections = 0
+        self.messages = 0
+
+    @property
+    def port(self) -> int:
+        """
+        The port the server listens on
+        """
+
+        return self.server_address[1]
+
+    def start(self) -> None:
+        """
+        Serves in a background thread
+        """
+
+        threading.Thread(target=self.serve_forever, daemon=True).start()
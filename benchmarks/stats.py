@@ -0,0 +1,50 @@
+import statistics
+from typing import Optional
+
+
+def summarize(
+    name: str, latencies: list[float], elapsed: Optional[float], errors: int
+) -> dict:
+    """
+    Prints and returns the throughput and latency percentiles of a run
+
+    Parameters
+    ----------
+    name : str
+        The name of the run
+    latencies : list[float]
+        The latency of every request in seconds
+    elapsed : Optional[float]
+        The wall time of the run in seconds, None when the requests did
+        not run on their own and only their latencies are reported
+    errors : int
+        The number of failed requests
+
+    Returns
+    -------
+    dict
+        The requests per second, without an elapsed time,
+        and the p50, p95 and p99 latencies in milliseconds
+    """
+
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    result = {
+        "p50": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95": percentiles[94] * 1000 if percentiles else 0.0,
+        "p99": percentiles[98] * 1000 if percentiles else 0.0,
+        "errors": errors,
+    }
+
+    throughput = ""
+
+    if elapsed is not None:
+        result = {"rps": len(latencies) / elapsed if elapsed else 0.0, **result}
+        throughput = f"{result['rps']:>9.1f} req/s  "
+
+    print(
+        f"{name:<24} {throughput}p50 {result['p50']:>7.2f} ms  "
+        f"p95 {result['p95']:>7.2f} ms  p99 {result['p99']:>7.2f} ms  "
+        f"errors {errors}"
+    )
+
+    return result
@@ -0,0 +1,101 @@
+"""
+Compares the render time of the pages with and without the cached
+template loader and the fragment cache of the page assets
+
+Usage: python -m benchmarks.templates [--renders 2000]
+"""
+
+import argparse
+import copy
+import time
+
+from benchmarks.environment import setup_django
+
+PAGES = {
+    "home": "base/home.html",
+    "sign-in": "authentication/sign-in.html",
+    "sign-up": "authentication/sign-up.html",
+    "user": "users/user.html",
+}
+
+
+def templates_setting(cached: bool) -> list[dict]:
+    """
+    Returns the TEMPLATES setting with or without the cached loader
+    """
+
+    from django.conf import settings
+
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]["APP_DIRS"] = False
+    loaders = [
+        "django.template.loaders.filesystem.Loader",
+        "django.template.loaders.app_directories.Loader",
+    ]
+    templates[0]["OPTIONS"]["loaders"] = (
+        [("django.template.loaders.cached.Loader", loaders)] if cached else loaders
+    )
+
+    return templates
+
+
+def run(name: str, renders: int, cached: bool, fragments: bool) -> None:
+    """
+    Renders every page and prints the mean render time, the fragment
+    cache is replaced by a dummy one to render without fragments
+    """
+
+    from django.conf import settings
+    from django.contrib.auth.models import AnonymousUser
+    from django.template.loader import render_to_string
+    from django.test import RequestFactory, override_settings
+
+    from apps.authentication.models import AppUser
+
+    request = RequestFactory().get("/")
+    request.user = AnonymousUser()
+    user = AppUser(id=1, username="username", first_name="First", last_name="Last")
+
+    caches = copy.deepcopy(settings.CACHES)
+
+    if not fragments:
+        caches["template_fragments"] = {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+        }
+
+    with override_settings(TEMPLATES=templates_setting(cached), CACHES=caches):
+        timings = []
+
+        for page, template in PAGES.items():
+            context = {"user": user} if page == "user" else {}
+            render_to_string(template, context, request)
+            start = time.perf_counter()
+
+            for _ in range(renders):
+                render_to_string(template, context, request)
+
+            timings.append(
+                f"{page} {(time.perf_counter() - start) / renders * 1e6:>7.1f} us"
+            )
+
+    print(f"{name:<28} " + "  ".join(timings))
+
+
+def main() -> None:
+    """
+    Runs the benchmark
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    run("uncached loader", args.renders, cached=False, fragments=False)
+    run("cached loader", args.renders, cached=True, fragments=False)
+    run("cached loader and fragments", args.renders, cached=True, fragments=True)
+
+
+if __name__ == "__main__":
+    main()
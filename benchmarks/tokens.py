@@ -0,0 +1,73 @@
+"""
+Compares the tokens per second of plain PyJWT calls against the token service
+
+Usage: python -m benchmarks.tokens [--iterations 20000]
+"""
+
+import argparse
+import time
+
+from benchmarks.environment import setup_django
+
+
+def measure(name: str, function, iterations: int) -> float:
+    """
+    Calls the function the given number of times and prints the rate
+    """
+
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        function()
+
+    rate = iterations / (time.perf_counter() - start)
+    print(f"{name:<24} {rate:>12.0f} tokens/s")
+
+    return rate
+
+
+def main() -> None:
+    """
+    Runs the benchmark
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    import jwt
+    from django.conf import settings
+
+    from utils.tokens.tokens import get_token_service
+
+    service = get_token_service()
+    data = {"user_id": 1, "exp": 4102444800}
+    jwt_token = jwt.encode(data, settings.SECRET_KEY, algorithm="HS256")
+    service_token = service.generate_token(data={"user_id": 1})
+
+    measure(
+        "jwt.encode",
+        lambda: jwt.encode(data, settings.SECRET_KEY, algorithm="HS256"),
+        args.iterations,
+    )
+    measure(
+        "TokenService encode",
+        lambda: service.generate_token(data={"user_id": 1}),
+        args.iterations,
+    )
+    measure(
+        "jwt.decode",
+        lambda: jwt.decode(jwt_token, settings.SECRET_KEY, algorithms=["HS256"]),
+        args.iterations,
+    )
+    measure(
+        "TokenService decode",
+        lambda: service.validate_token(service_token),
+        args.iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
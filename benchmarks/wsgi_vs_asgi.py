@@ -0,0 +1,130 @@
+"""
+Compares the WSGI and ASGI throughput of the sign in and sign up flows
+
+Both handlers run in process through the Django test clients, the WSGI
+handler from a thread pool and the ASGI handler from concurrent tasks.
+
+Usage: python -m benchmarks.wsgi_vs_asgi [--requests 200] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.environment import setup_django, setup_test_database
+from benchmarks.stats import summarize
+
+PASSWORD = "benchmark-password"
+_counter = itertools.count()
+
+
+def sign_in_data(index: int) -> dict:
+    """
+    Returns the sign in form data of an existing user
+    """
+
+    return {"email": f"user{index}@email.com", "password": PASSWORD}
+
+
+def sign_up_data(index: int) -> dict:
+    """
+    Returns the sign up form data of a new user
+    """
+
+    number = next(_counter)
+
+    return {
+        "username": f"new{number}",
+        "email": f"new{number}@email.com",
+        "password": PASSWORD,
+    }
+
+
+def run_wsgi(path: str, data_factory, requests: int, concurrency: int) -> dict:
+    """
+    Sends the requests through the WSGI handler from a thread pool
+    """
+
+    from django.test import Client
+
+    latencies, errors = [], 0
+
+    def request(index: int) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        response = Client().post(path, data=data_factory(index % concurrency))
+        latencies.append(time.perf_counter() - start)
+        errors += response.status_code >= 400
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(request, range(requests)))
+
+    return summarize(f"WSGI {path}", latencies, time.perf_counter() - start, errors)
+
+
+def run_asgi(path: str, data_factory, requests: int, concurrency: int) -> dict:
+    """
+    Sends the requests through the ASGI handler from concurrent tasks
+    """
+
+    from django.test import AsyncClient
+
+    latencies, errors = [], 0
+
+    async def request(index: int, semaphore: asyncio.Semaphore) -> None:
+        nonlocal errors
+
+        async with semaphore:
+            start = time.perf_counter()
+            response = await AsyncClient().post(
+                path, data=data_factory(index % concurrency)
+            )
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code >= 400
+
+    async def main() -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(request(i, semaphore) for i in range(requests)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+
+    return summarize(f"ASGI {path}", latencies, time.perf_counter() - start, errors)
+
+
+def main() -> None:
+    """
+    Runs the benchmark
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--fast-hasher",
+        action="store_true",
+        help="Hash passwords with MD5 to measure the framework overhead only",
+    )
+    args = parser.parse_args()
+
+    setup_django()
+    setup_test_database(fast_hasher=args.fast_hasher)
+
+    from apps.authentication.models import AppUser
+
+    for index in range(args.concurrency):
+        AppUser.objects.create_user(
+            username=f"user{index}", email=f"user{index}@email.com", password=PASSWORD
+        )
+
+    for runner in (run_wsgi, run_asgi):
+        runner("/sign-in", sign_in_data, args.requests, args.concurrency)
+        runner("/sign-up", sign_up_data, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
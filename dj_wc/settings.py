@@ -1,6 +1,8 @@
+import json
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -30,6 +32,8 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "apps.authentication",
+    "apps.emails",
+    "utils.static",
 ]
 
 
@@ -38,13 +42,16 @@ INSTALLED_APPS = [
 ##############
 
 MIDDLEWARE = [
+    "utils.metrics.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "utils.static.middleware.StaticFilesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "utils.ratelimit.middleware.RateLimitMiddleware",
 ]
 
 
@@ -56,13 +63,25 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "utils.static.context_processors.assets",
+                "utils.cache.context_processors.page_cache_csrf",
+            ],
+            # Templates are parsed once per process, the development server
+            # resets the cache when a template changes
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
             ],
         },
     },
@@ -73,13 +92,130 @@ TEMPLATES = [
 # DATABASES #
 #############
 
-DATABASES = {
-    "default": {
+# sqlite: local file tuned for concurrent requests, WAL journal so readers
+# do not block the writer and a busy timeout instead of "database is locked"
+# postgresql: pooled connections, needs psycopg[pool]
+# DATABASE_CONN_MAX_AGE is 0, a connection per request, by default. Raise it
+# only when serving through WSGI: under ASGI every request runs its queries
+# in a new thread so persistent connections leak
+DATABASE_PROFILE = os.getenv("DATABASE_PROFILE", "sqlite")
+
+DATABASE_PROFILES = {
+    "sqlite": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+        "NAME": os.getenv("DATABASE_NAME", BASE_DIR / "db.sqlite3"),
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", 0)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "timeout": int(os.getenv("DATABASE_TIMEOUT", 20)),
+            "transaction_mode": "IMMEDIATE",
+            "init_command": (
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-20000;"
+            ),
+        },
+    },
+    "postgresql": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.getenv("DATABASE_NAME", "dj_wc"),
+        "USER": os.getenv("DATABASE_USER", "postgres"),
+        "PASSWORD": os.getenv("DATABASE_PASSWORD", ""),
+        "HOST": os.getenv("DATABASE_HOST", "localhost"),
+        "PORT": os.getenv("DATABASE_PORT", "5432"),
+        # The connection pool replaces persistent connections
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "pool": {
+                "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", 2)),
+                "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", 10)),
+                "timeout": int(os.getenv("DATABASE_TIMEOUT", 20)),
+            },
+        },
+    },
+}
+
+if DATABASE_PROFILE not in DATABASE_PROFILES:
+    raise ImproperlyConfigured(
+        f"DATABASE_PROFILE must be one of {', '.join(DATABASE_PROFILES)}, "
+        f"not {DATABASE_PROFILE!r}"
+    )
+
+DATABASES = {"default": DATABASE_PROFILES[DATABASE_PROFILE]}
+
+
+##########
+# CACHES #
+##########
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    },
+    # {% cache %} fragments, the same in every process so kept in process
+    "template_fragments": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "template_fragments",
+    },
+    # Rate limit counters, apart so they can be cleared on their own.
+    # Set it to a shared cache, on its own database, for several processes
+    "ratelimit": {
+        "BACKEND": os.getenv(
+            "RATELIMIT_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("RATELIMIT_CACHE_LOCATION", "ratelimit"),
+    },
+    # Anonymous pages, apart so query strings filling it up cannot
+    # evict the sessions of the default cache
+    "pages": {
+        "BACKEND": os.getenv(
+            "PAGE_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("PAGE_CACHE_LOCATION", "pages"),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("PAGE_CACHE_MAX_ENTRIES", 1000))},
+    },
+}
+
+# Anonymous pages, see utils.cache.page.anonymous_page_cache
+PAGE_CACHE_ALIAS = "pages"
+PAGE_CACHE_TIMEOUT = int(os.getenv("PAGE_CACHE_TIMEOUT", 300))
+
+
+############
+# SESSIONS #
+############
+
+# db: every request reads the django_session table
+# cached_db: write-through cache in front of the database, the default cache.
+# With several processes CACHE_BACKEND must be shared (Redis, Memcached...),
+# with the per process local memory cache a process can serve a session that
+# another one has changed or signed out
+# cache: cache only, sessions are lost when the cache is evicted, needs a
+# shared CACHE_BACKEND too
+# signed_cookies: no server-side storage, a signed out cookie stays
+# valid until it expires if someone kept a copy of it
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
 }
 
+SESSION_STORE = os.getenv("SESSION_STORE", "db")
+
+if SESSION_STORE not in SESSION_ENGINES:
+    raise ImproperlyConfigured(
+        f"SESSION_STORE must be one of {', '.join(SESSION_ENGINES)}, "
+        f"not {SESSION_STORE!r}"
+    )
+
+SESSION_ENGINE = SESSION_ENGINES[SESSION_STORE]
+
 
 ########
 # AUTH #
@@ -87,6 +223,11 @@ DATABASES = {
 
 AUTH_USER_MODEL = "authentication.AppUser"
 
+AUTHENTICATION_BACKENDS = [
+    "apps.authentication.backends.EmailBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -95,13 +236,98 @@ AUTH_PASSWORD_VALIDATORS = [
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
     },
     {
-        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+        "NAME": "apps.authentication.validators.CommonPasswordValidator",
+        "OPTIONS": {"digests_path": os.getenv("COMMON_PASSWORD_DIGESTS")},
     },
     {
         "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
     },
 ]
 
+PASSWORD_HASHING_MAX_WORKERS = int(
+    os.getenv("PASSWORD_HASHING_MAX_WORKERS", os.cpu_count() or 1)
+)
+PASSWORD_HASHING_MAX_QUEUE = int(os.getenv("PASSWORD_HASHING_MAX_QUEUE", 16))
+
+
+##########
+# TOKENS #
+##########
+
+# Keys tokens are verified with, by key id. To rotate, add the new key,
+# point TOKEN_SIGNING_KEY_ID at it and remove the old one once the tokens
+# signed with it have expired. Tokens without a key id use the signing key.
+# TOKEN_SIGNING_KEYS holds the keys as a JSON object, the secret key otherwise
+TOKEN_SIGNING_KEYS = json.loads(os.getenv("TOKEN_SIGNING_KEYS", "null")) or {
+    "default": SECRET_KEY
+}
+TOKEN_SIGNING_KEY_ID = os.getenv("TOKEN_SIGNING_KEY_ID", "default")
+TOKEN_ALGORITHM = "HS256"
+
+
+###########
+# PROXIES #
+###########
+
+# Addresses or networks of the reverse proxies in front of the site, comma
+# separated. Requests from them are attributed to the right-most
+# X-Forwarded-For hop that is not one of them, for the rate limits and the
+# metrics endpoint. Without it every client behind a proxy shares its address
+TRUSTED_PROXIES = os.getenv("TRUSTED_PROXIES", "").split(",")
+
+
+###########
+# METRICS #
+###########
+
+# The /metrics endpoint serves the metrics of the process that answers it,
+# scrape every worker or run a single one per container. It answers requests
+# with the METRICS_TOKEN bearer token or from METRICS_ALLOWED_IPS, resolved
+# behind TRUSTED_PROXIES, and neither is set by default: behind a same host
+# proxy every request comes from the loopback address
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_ALLOWED_IPS = [
+    address for address in os.getenv("METRICS_ALLOWED_IPS", "").split(",") if address
+]
+
+# Server-Timing tells the client where the request time went, keep it off
+# in production unless the clients are trusted
+METRICS_SERVER_TIMING = os.getenv("METRICS_SERVER_TIMING", str(DEBUG)) == "True"
+
+
+##############
+# RATE LIMIT #
+##############
+
+# utils.ratelimit.stores.cache.CacheStore: counters in the ratelimit cache,
+# shared by every process when the cache is
+# utils.ratelimit.stores.local_memory.LocalMemoryStore: per process counters
+RATELIMIT_STORE = os.getenv(
+    "RATELIMIT_STORE", "utils.ratelimit.stores.cache.CacheStore"
+)
+RATELIMIT_CACHE_ALIAS = "ratelimit"
+
+# Rules by URL name. key is ip or email, window is in seconds and
+# methods defaults to POST. Requests over any rule get a 429. The ip is
+# the proxy address behind a reverse proxy unless TRUSTED_PROXIES lists it
+RATELIMITS = {
+    "sign-in": [
+        {"key": "ip", "limit": 20, "window": 60},
+        {"key": "email", "limit": 5, "window": 60},
+    ],
+    "sign-up": [
+        {"key": "ip", "limit": 5, "window": 60},
+        {"key": "email", "limit": 3, "window": 3600},
+    ],
+    "activate-account": [
+        {"key": "ip", "limit": 10, "window": 60, "methods": ("GET",)},
+    ],
+}
+
+# Off for load tests, where every request comes from the same address
+if os.getenv("RATELIMIT_ENABLED", "True") != "True":
+    RATELIMITS = {}
+
 
 ########################
 # INTERNATIONALIZATION #
@@ -126,7 +352,7 @@ STORAGES = {
         "BACKEND": "django.core.files.storage.FileSystemStorage",
     },
     "staticfiles": {
-        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+        "BACKEND": "utils.static.storage.CompressedManifestStaticFilesStorage",
     },
 }
 
@@ -142,8 +368,17 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # EMAIL CONFIG #
 ################
 
+EMAIL_BACKEND = os.getenv(
+    "EMAIL_BACKEND", "utils.email.backends.pooled_smtp.PooledEmailBackend"
+)
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = True
 EMAIL_PORT = 587
+EMAIL_POOL_SIZE = int(os.getenv("EMAIL_POOL_SIZE", 4))
+EMAIL_POOL_MAX_IDLE = int(os.getenv("EMAIL_POOL_MAX_IDLE", 30))
+
+# Canonical address of the site, for links in emails sent outside of a request
+SITE_PROTOCOL = os.getenv("SITE_PROTOCOL", "http")
+SITE_DOMAIN = os.getenv("SITE_DOMAIN", "localhost:8000")
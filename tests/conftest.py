@@ -1,6 +1,30 @@
 import pytest
+from django.core.cache import caches
+from django.db import connections
 from django.test import Client, RequestFactory
 
+from tests.query_budget import QueryBudget
+from utils.ratelimit.limiter import get_rate_limiter
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(tmp_path_factory) -> None:
+    """
+    Runs the tests on a SQLite file instead of the shared in memory
+    database, which fails concurrent writers with "table is locked"
+    instead of waiting for the busy timeout
+    """
+
+    settings_dict = connections["default"].settings_dict
+
+    if (
+        settings_dict["ENGINE"].endswith("sqlite3")
+        and not settings_dict["TEST"]["NAME"]
+    ):
+        settings_dict["TEST"]["NAME"] = str(
+            tmp_path_factory.mktemp("database") / "test.sqlite3"
+        )
+
 
 @pytest.fixture
 def rf() -> RequestFactory:
@@ -18,3 +42,49 @@ def client() -> Client:
     """
 
     return Client()
+
+
+@pytest.fixture
+def query_budget() -> type[QueryBudget]:
+    """
+    QueryBudget fixture, used as a context manager
+    """
+
+    return QueryBudget
+
+
+@pytest.fixture(autouse=True)
+def static_storage(settings):
+    """
+    Renders the static tags without the manifest, which
+    only exists once collectstatic has run
+    """
+
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_store():
+    """
+    Starts every test with empty rate limit counters
+    """
+
+    get_rate_limiter().store.clear()
+    yield
+    get_rate_limiter().store.clear()
+
+
+@pytest.fixture(autouse=True)
+def page_cache(settings):
+    """
+    Starts every test without cached pages
+    """
+
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+    yield
+    caches[settings.PAGE_CACHE_ALIAS].clear()
@@ -1,10 +1,16 @@
-from unittest.mock import patch
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import jwt
 import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client
 from django.urls import reverse
 
-from authentication.models import AppUser
+from apps.authentication.models import AppUser
+from utils.tokens.tokens import Tokens
 
 
 def test_activate_account_get_invalid_token(client: Client):
@@ -25,11 +31,9 @@ def test_activate_account_get_user_not_found(client: Client):
     that does not match any user and checks if the response status code is 302
     """
 
-    with patch(
-        "authentication.views.EmailConfirmationTokens.validate_token",
-        return_value=1,
-    ):
-        response = client.get(reverse("activate-account") + "?token=token")
+    token = Tokens.generate_token(data={"user_id": 1})
+
+    response = client.get(reverse("activate-account") + f"?token={token}")
 
     assert response.status_code == 302
 
@@ -42,12 +46,15 @@ def test_activate_account_get_email_already_confirmed(client: Client):
     response status code is 302
     """
 
-    with (
-        patch("authentication.views.EmailConfirmationTokens.validate_token"),
-        patch("authentication.views.AppUser.objects") as mock_objects,
-    ):
-        mock_objects.filter.return_value.first.return_value = AppUser(is_active=True)
-        response = client.get(reverse("activate-account") + "?token=token")
+    user = AppUser.objects.create_user(
+        username="username",
+        email="user@email.com",
+        password="password",
+        email_confirmed=True,
+    )
+    token = Tokens.generate_token(data={"user_id": user.id})
+
+    response = client.get(reverse("activate-account") + f"?token={token}")
 
     assert response.status_code == 302
 
@@ -69,15 +76,143 @@ def test_activate_account_get_success(client: Client):
         email_confirmed=False,
     )
 
-    with (
-        patch("authentication.views.EmailConfirmationTokens.validate_token"),
-        patch("authentication.views.AppUser.objects") as mock_objects,
-    ):
-        mock_objects.filter.return_value.first.return_value = user
-        response = client.get(reverse("activate-account") + "?token=token")
+    token = Tokens.generate_token(data={"user_id": user.id})
+
+    response = client.get(reverse("activate-account") + f"?token={token}")
+    user.refresh_from_db()
 
     assert response.status_code == 302
     assert client.session["_auth_user_id"] == str(user.id)
     assert user.is_active is True
     assert user.email_confirmed is True
     assert client.cookies.get("accountActivated").value == "true"
+
+
+@pytest.mark.django_db
+def test_activate_account_get_token_without_id(client: Client):
+    """
+    Tests the GET method of the activate account view with a token issued
+    before tokens had an id and checks if it activates the account once
+    and redirects to the sign in page when it is used again
+    """
+
+    user = AppUser.objects.create_user(
+        username="username",
+        email="user@email.com",
+        password="password",
+        is_active=False,
+        email_confirmed=False,
+    )
+    token = jwt.encode(
+        {"user_id": user.id, "exp": 4102444800},
+        settings.SECRET_KEY,
+        algorithm="HS256",
+    )
+
+    first = client.get(reverse("activate-account") + f"?token={token}")
+    client.logout()
+    second = client.get(reverse("activate-account") + f"?token={token}")
+    user.refresh_from_db()
+
+    assert first.url == reverse("user")
+    assert second.url == reverse("sign-in")
+    assert user.email_confirmed is True
+
+
+@pytest.mark.django_db
+def test_activate_account_get_token_replayed(client: Client, django_assert_num_queries):
+    """
+    Tests the GET method of the activate account view with a token
+    that has already been used and checks if it redirects to the sign in
+    page without querying the database
+    """
+
+    user = AppUser.objects.create_user(
+        username="username",
+        email="user@email.com",
+        password="password",
+        is_active=False,
+    )
+    token = Tokens.generate_token(data={"user_id": user.id})
+    client.get(reverse("activate-account") + f"?token={token}")
+
+    with django_assert_num_queries(0):
+        response = Client().get(reverse("activate-account") + f"?token={token}")
+
+    assert response.url == reverse("sign-in")
+
+
+@pytest.mark.django_db
+def test_activate_account_get_token_replayed_cache_cleared(client: Client):
+    """
+    Tests the GET method of the activate account view with a used
+    token once the cache has been cleared and checks if the ledger
+    table still rejects it and refills the cache
+    """
+
+    user = AppUser.objects.create_user(
+        username="username",
+        email="user@email.com",
+        password="password",
+        is_active=False,
+    )
+    token = Tokens.generate_token(data={"user_id": user.id})
+    client.get(reverse("activate-account") + f"?token={token}")
+
+    cache.clear()
+    AppUser.objects.filter(id=user.id).update(email_confirmed=False)
+    response = Client().get(reverse("activate-account") + f"?token={token}")
+
+    assert response.url == reverse("sign-in")
+    assert cache.get(f"consumed-token:{Tokens.validate_token(token)['jti']}")
+
+
+def activate_concurrently(tokens: list[str]) -> list[str]:
+    """
+    Sends the activation requests from as many threads
+    at once and returns the URLs they redirect to
+    """
+
+    barrier = threading.Barrier(len(tokens))
+
+    def activate(token: str) -> str:
+        client = Client()
+        barrier.wait()
+
+        try:
+            return client.get(reverse("activate-account") + f"?token={token}").url
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=len(tokens)) as executor:
+        return list(executor.map(activate, tokens))
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("distinct_tokens", [False, True])
+def test_activate_account_get_concurrent(distinct_tokens: bool):
+    """
+    Tests the GET method of the activate account view with one token,
+    and with a token per request, clicked from many threads at once
+    and checks if exactly one request activates and signs in the user
+    """
+
+    user = AppUser.objects.create_user(
+        username="username",
+        email="user@email.com",
+        password="password",
+        is_active=False,
+    )
+    token = Tokens.generate_token(data={"user_id": user.id})
+    tokens = [
+        Tokens.generate_token(data={"user_id": user.id}) if distinct_tokens else token
+        for _ in range(8)
+    ]
+
+    urls = activate_concurrently(tokens)
+    user.refresh_from_db()
+
+    assert urls.count(reverse("user")) == 1
+    assert urls.count(reverse("sign-in")) == len(tokens) - 1
+    assert user.is_active is True
+    assert user.email_confirmed is True
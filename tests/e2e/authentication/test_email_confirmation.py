@@ -2,7 +2,7 @@ import pytest
 from django.test import Client
 from django.urls import reverse
 
-from authentication.models import AppUser
+from apps.authentication.models import AppUser
 
 
 @pytest.mark.django_db
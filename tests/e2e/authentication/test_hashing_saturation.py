@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from apps.authentication.utils.hashing.exceptions import HashingPoolSaturatedError
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, data",
+    [
+        ("sign-in", {"email": "user@email.com", "password": "password"}),
+        (
+            "sign-up",
+            {
+                "username": "username",
+                "email": "user@email.com",
+                "password": "s3cr3t!pw",
+            },
+        ),
+    ],
+)
+def test_auth_post_hashing_pool_saturated(client: Client, url_name: str, data: dict):
+    """
+    Tests the POST method of the sign in and sign up views when the password
+    hashing pool is saturated and checks if the response status code is 503
+    """
+
+    with patch(
+        "apps.authentication.utils.hashing.executor.HashingExecutor.submit",
+        side_effect=HashingPoolSaturatedError,
+    ):
+        response = client.post(reverse(url_name), data=data)
+
+    assert response.status_code == 503
+    assert response["Retry-After"] == "1"
@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pytest
-from django.test import Client
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
 from django.urls import reverse
 
-from authentication.models import AppUser
+from apps.authentication.models import AppUser
 
 
 def test_sign_in_get_success(client: Client):
@@ -82,3 +85,35 @@ def test_sign_in_post_success(client: Client):
 
     assert response.status_code == 204
     assert client.session["_auth_user_id"] == str(user.id)
+
+
+@pytest.mark.django_db
+def test_sign_in_post_success_async(async_client: AsyncClient):
+    """
+    Tests the POST method of the sign in view through the async client
+    and checks if the user is signed in by the async email backend,
+    without the sync authenticate or the blocking hashing calls
+    """
+
+    AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+
+    with (
+        patch("apps.authentication.backends.EmailBackend.authenticate") as sync,
+        patch("apps.authentication.utils.hashing.executor.HashingExecutor.run") as run,
+    ):
+        response = async_to_sync(async_client.post)(
+            reverse("sign-in"),
+            data={"email": "user@email.com", "password": "password"},
+        )
+        wrong = async_to_sync(AsyncClient().post)(
+            reverse("sign-in"),
+            data={"email": "user@email.com", "password": "wrong"},
+        )
+
+    assert response.status_code == 204
+    assert response.cookies["sessionid"].value
+    assert wrong.status_code == 401
+    sync.assert_not_called()
+    run.assert_not_called()
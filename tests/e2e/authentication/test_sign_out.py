@@ -1,8 +1,11 @@
 import pytest
-from django.test import Client
+from django.contrib.sessions.backends.cached_db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.test import Client, override_settings
 from django.urls import reverse
 
-from authentication.models import AppUser
+from apps.authentication.models import AppUser
 
 
 @pytest.mark.django_db
@@ -21,3 +24,27 @@ def test_sign_out_get_success(client: Client):
 
     assert response.status_code == 204
     assert client.session.get("_auth_user_id") is None
+
+
+@pytest.mark.django_db
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+def test_sign_out_get_cached_db_session_invalidated(client: Client):
+    """
+    Tests the GET method of the sign out view with the cached database
+    session engine and checks if the session is removed from the cache
+    and the database
+    """
+
+    user = AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+    client.force_login(user)
+    session_key = client.session.session_key
+    store = SessionStore(session_key=session_key)
+
+    assert cache.get(store.cache_key) is not None
+
+    client.get(reverse("sign-out"))
+
+    assert cache.get(store.cache_key) is None
+    assert not Session.objects.filter(session_key=session_key).exists()
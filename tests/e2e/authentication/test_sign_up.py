@@ -1,10 +1,10 @@
-from unittest.mock import patch
-
 import pytest
+from django.core import mail
 from django.test import Client
 from django.urls import reverse
 
-from authentication.models import AppUser
+from apps.authentication.models import AppUser
+from apps.emails.models import QueuedEmail
 
 
 def test_sign_up_get_success(client: Client):
@@ -56,11 +56,34 @@ def test_sign_up_post_invalid_data(client: Client):
     }
 
 
+def test_sign_up_post_invalid_password(client: Client):
+    """
+    Tests the POST method of the sign up view with a short password
+    and checks if the response status code is 422 and only the
+    password error is returned
+    """
+
+    response = client.post(
+        reverse("sign-up"),
+        data={
+            "username": "username",
+            "email": "user@email.com",
+            "password": "1234",
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json() == {
+        "errors": ["This password is too short. It must contain at least 8 characters."]
+    }
+
+
 @pytest.mark.django_db
 def test_sign_up_post_invalid_credentials(client: Client):
     """
-    Tests the POST method of the sign up view with invalid credentials
-    and checks if the response status code is 422 and the errors are returned
+    Tests the POST method of the sign up view with a taken username and
+    email and checks if the response status code is 422 and the errors
+    are returned
     """
 
     AppUser.objects.create_user(
@@ -72,7 +95,7 @@ def test_sign_up_post_invalid_credentials(client: Client):
         data={
             "username": "username",
             "email": "user@email.com",
-            "password": "1234",
+            "password": "secret1234",
         },
     )
 
@@ -81,7 +104,6 @@ def test_sign_up_post_invalid_credentials(client: Client):
         "errors": [
             "A user with that username already exists.",
             "A user with that email already exists.",
-            "This password is too short. It must contain at least 8 characters.",
         ]
     }
 
@@ -91,23 +113,21 @@ def test_sign_up_post_success(client: Client):
     """
     Tests the POST method of the sign up view with valid credentials
     and checks if the response status code is 204, the user is created
-    with is active and email confirmed set to False and the email is sent
+    with is active and email confirmed set to False and the email is queued
     """
 
-    with patch(
-        "authentication.views.EmailConfirmationSender.send_email"
-    ) as mock_send_email:
-        response = client.post(
-            reverse("sign-up"),
-            data={
-                "username": "username",
-                "email": "user@email.com",
-                "password": "secret1234",
-            },
-        )
+    response = client.post(
+        reverse("sign-up"),
+        data={
+            "username": "username",
+            "email": "user@email.com",
+            "password": "secret1234",
+        },
+    )
     user = AppUser.objects.get(username="username")
 
     assert response.status_code == 204
     assert user.is_active is False
     assert user.email_confirmed is False
-    mock_send_email.assert_called_once()
+    assert QueuedEmail.objects.filter(to=[user.email]).count() == 1
+    assert mail.outbox == []
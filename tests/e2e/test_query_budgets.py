@@ -0,0 +1,170 @@
+from typing import Callable, Optional
+
+import pytest
+from django.test import Client
+from django.urls import URLPattern, reverse
+
+from apps.authentication import urls as authentication_urls
+from apps.authentication.models import AppUser
+from apps.base import urls as base_urls
+from apps.users import urls as users_urls
+from utils.tokens.tokens import Tokens
+
+PASSWORD = "password"
+
+
+def create_user(**kwargs) -> AppUser:
+    """
+    Creates the user the requests act on
+    """
+
+    return AppUser.objects.create_user(
+        username="username", email="user@email.com", password=PASSWORD, **kwargs
+    )
+
+
+def anonymous(client: Client) -> Optional[dict]:
+    """
+    Sends the request without a user
+    """
+
+    return None
+
+
+def signed_in(client: Client) -> Optional[dict]:
+    """
+    Sends the request as a signed in user
+    """
+
+    client.force_login(create_user())
+
+
+def sign_in_data(client: Client) -> dict:
+    """
+    Sends the credentials of an existing user
+    """
+
+    create_user()
+
+    return {"email": "user@email.com", "password": PASSWORD}
+
+
+def sign_up_data(client: Client) -> dict:
+    """
+    Sends the data of a new user
+    """
+
+    return {"username": "new", "email": "new@email.com", "password": "secret1234"}
+
+
+def email_confirmation_query(client: Client) -> dict:
+    """
+    Sends the email of a user pending confirmation
+    """
+
+    create_user(is_active=False)
+
+    return {"email": "user@email.com"}
+
+
+def activation_query(client: Client) -> dict:
+    """
+    Sends the activation token of a user pending confirmation
+    """
+
+    user = create_user(is_active=False)
+
+    return {"token": Tokens.generate_token(data={"user_id": user.id})}
+
+
+def profile_data(client: Client) -> dict:
+    """
+    Sends a profile change as a signed in user
+    """
+
+    signed_in(client)
+
+    return {"first-name": "First", "last-name": "Last"}
+
+
+# Queries allowed per route, method and scenario. Session reads and writes
+# count, since the default session engine stores them in the database, and
+# so do the savepoints of atomic blocks, which run inside the test transaction
+BUDGETS: list[tuple[str, str, Callable[[Client], Optional[dict]], int]] = [
+    ("home", "GET", anonymous, 0),
+    ("sign-in", "GET", anonymous, 0),
+    ("sign-in", "GET", signed_in, 2),
+    ("sign-in", "POST", sign_in_data, 9),
+    ("sign-up", "GET", anonymous, 0),
+    ("sign-up", "POST", sign_up_data, 3),
+    ("email-confirmation", "GET", email_confirmation_query, 1),
+    ("activate-account", "GET", activation_query, 14),
+    ("sign-out", "GET", signed_in, 4),
+    ("user", "GET", signed_in, 2),
+    ("user", "POST", profile_data, 3),
+]
+
+
+def route_names() -> set[str]:
+    """
+    Returns the names of the routes of the apps
+    """
+
+    return {
+        pattern.name
+        for module in (authentication_urls, users_urls, base_urls)
+        for pattern in module.urlpatterns
+        if isinstance(pattern, URLPattern)
+    }
+
+
+def test_query_budgets_cover_every_route():
+    """
+    Tests the query budgets and checks if every route
+    of the apps has at least one budget declared
+    """
+
+    assert route_names() <= {route for route, *_ in BUDGETS}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "route, method, scenario, budget",
+    [
+        pytest.param(*budget, id=f"{budget[0]}-{budget[1]}-{budget[2].__name__}")
+        for budget in BUDGETS
+    ],
+)
+def test_query_budget(
+    client: Client, query_budget, route: str, method: str, scenario, budget: int
+):
+    """
+    Tests every route with its scenario and checks if the request
+    runs within its query budget and does not fail
+    """
+
+    data = scenario(client)
+    send = client.post if method == "POST" else client.get
+
+    with query_budget(budget, label=f"{method} {route} ({scenario.__name__})"):
+        response = send(reverse(route), data=data)
+
+    assert response.status_code < 400
+
+
+@pytest.mark.django_db
+def test_query_budget_exceeded(query_budget):
+    """
+    Tests the query budget with a block over its budget and checks if
+    the report lists the SQL and the project frames that ran it
+    """
+
+    with pytest.raises(AssertionError) as error:
+        with query_budget(0, label="sign in"):
+            sign_in_data(Client())
+
+    report = str(error.value)
+
+    assert report.startswith("sign in ran ")
+    assert 'INSERT INTO "users"' in report
+    assert "test_query_budgets.py" not in report
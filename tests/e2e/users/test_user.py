@@ -2,7 +2,7 @@ import pytest
 from django.test import Client
 from django.urls import reverse
 
-from authentication.models import AppUser
+from apps.authentication.models import AppUser
 
 
 def test_user_info_get_unauthenticated(client: Client):
@@ -54,3 +54,79 @@ def test_user_info_post_success(client: Client):
     assert user.first_name == "first_name"
     assert user.last_name == "last_name"
     assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_user_info_get_reuses_request_user(client: Client, django_assert_num_queries):
+    """
+    Tests the GET method of the user view and checks if the user loaded
+    by the authentication middleware is reused instead of fetched again
+    """
+
+    user = AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+    client.force_login(user)
+
+    # Session and user
+    with django_assert_num_queries(2):
+        response = client.get(reverse("user"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_user_info_post_partial_update(client: Client, django_assert_num_queries):
+    """
+    Tests the POST method of the user view with a single changed field
+    and checks if only that column is written
+    """
+
+    user = AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+    client.force_login(user)
+
+    # Session, user and update
+    with django_assert_num_queries(3) as captured:
+        response = client.post(
+            reverse("user"), {"first-name": "first_name", "last-name": ""}
+        )
+
+    update = captured.captured_queries[-1]["sql"]
+
+    assert response.status_code == 200
+    assert update.startswith("UPDATE")
+    assert "first_name" in update
+    assert "last_name" not in update
+    assert "password" not in update
+
+
+@pytest.mark.django_db
+def test_user_info_post_no_changes(client: Client, django_assert_num_queries):
+    """
+    Tests the POST method of the user view with unchanged
+    data and checks if no write is performed
+    """
+
+    user = AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+    client.force_login(user)
+
+    # Session and user
+    with django_assert_num_queries(2):
+        response = client.post(reverse("user"), {"first-name": "", "last-name": ""})
+
+    assert response.status_code == 200
+
+
+def test_user_info_post_unauthenticated(client: Client):
+    """
+    Tests the POST method of the user view when the user is
+    unauthenticated and checks if the response status code is 302
+    """
+
+    response = client.post(reverse("user"), {"first-name": "first_name"})
+
+    assert response.status_code == 302
@@ -0,0 +1,127 @@
+import contextlib
+import traceback
+from pathlib import Path
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connections
+
+PROJECT_DIRS = tuple(
+    str(Path(settings.BASE_DIR) / name) for name in ("apps", "utils", "dj_wc")
+)
+# Execute wrappers of the project, which show up in every stack
+IGNORED_DIRS = (str(Path(settings.BASE_DIR) / "utils" / "metrics"),)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised when a block runs more SQL queries than its budget
+    """
+
+    pass
+
+
+class QueryBudget:
+    """
+    Context manager that fails when the block runs more SQL queries than
+    the budget, reporting every query with the project frames that ran it.
+    Queries of async views run in another thread than the view, so their
+    stack stops at the sync code that ran them
+
+    Attributes
+    ----------
+    budget : int
+        The number of queries allowed
+    label : str
+        What the block does, for the report
+    queries : list[tuple[str, Any, list[traceback.FrameSummary]]]
+        The SQL, parameters and project stack of every query
+    """
+
+    def __init__(self, budget: int, label: str = "block") -> None:
+        """
+        Initializes the query budget
+
+        Parameters
+        ----------
+        budget : int
+            The number of queries allowed
+        label : str
+            What the block does, for the report
+        """
+
+        self.budget = budget
+        self.label = label
+        self.queries: list[tuple[str, Any, list[traceback.FrameSummary]]] = []
+        self._stack = contextlib.ExitStack()
+
+    def __enter__(self) -> "QueryBudget":
+        """
+        Starts recording the queries of every database connection
+
+        Returns
+        -------
+        QueryBudget
+            The query budget
+        """
+
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self._record))
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        """
+        Stops recording and checks the budget
+
+        Raises
+        ------
+        QueryBudgetExceeded
+            If the block ran more queries than the budget
+        """
+
+        self._stack.close()
+
+        if exc_type is None and len(self.queries) > self.budget:
+            raise QueryBudgetExceeded(self.report())
+
+    def _record(
+        self, execute: Callable[..., Any], sql: str, params: Any, many: bool, context
+    ) -> Any:
+        """
+        Database execute wrapper that records the query and its stack
+        """
+
+        stack = [
+            frame
+            for frame in traceback.extract_stack()[:-1]
+            if frame.filename.startswith(PROJECT_DIRS)
+            and not frame.filename.startswith(IGNORED_DIRS)
+        ]
+        self.queries.append((sql, params, stack))
+
+        return execute(sql, params, many, context)
+
+    def report(self) -> str:
+        """
+        Describes the queries run by the block
+
+        Returns
+        -------
+        str
+            The report
+        """
+
+        lines = [
+            f"{self.label} ran {len(self.queries)} queries, "
+            f"the budget is {self.budget}:"
+        ]
+
+        for number, (sql, params, stack) in enumerate(self.queries, start=1):
+            lines.append(f"{number}. {sql}")
+            lines.append(f"   params: {params}")
+            lines.extend(
+                f"   {frame.filename}:{frame.lineno} in {frame.name}" for frame in stack
+            )
+
+        return "\n".join(lines)
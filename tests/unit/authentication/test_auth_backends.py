@@ -0,0 +1,149 @@
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import authenticate
+from django.contrib.auth.signals import user_login_failed
+from django.test import RequestFactory
+
+from apps.authentication.backends import EmailBackend
+from apps.authentication.models import AppUser
+from apps.authentication.utils.auth.sign_in import SignIn
+from apps.authentication.utils.hashing.executor import get_hashing_executor
+
+
+@pytest.fixture
+def user() -> AppUser:
+    """
+    Active user fixture
+    """
+
+    return AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+
+
+@pytest.mark.django_db
+def test_email_backend_authenticate_success(user: AppUser, django_assert_num_queries):
+    """
+    Tests the authenticate method of the EmailBackend class with valid
+    credentials and checks if the user is returned with a single query
+    """
+
+    with django_assert_num_queries(1):
+        authenticated = EmailBackend().authenticate(
+            None, email="user@email.com", password="password"
+        )
+
+    assert authenticated == user
+
+
+@pytest.mark.django_db
+def test_email_backend_authenticate_wrong_password(user: AppUser):
+    """
+    Tests the authenticate method of the EmailBackend
+    class with a wrong password and checks if None is returned
+    """
+
+    assert (
+        EmailBackend().authenticate(None, email="user@email.com", password="wrong")
+        is None
+    )
+
+
+@pytest.mark.django_db
+def test_email_backend_authenticate_inactive_user(user: AppUser):
+    """
+    Tests the authenticate method of the EmailBackend class
+    with an inactive user and checks if None is returned
+    """
+
+    user.is_active = False
+    user.save()
+
+    assert (
+        EmailBackend().authenticate(None, email="user@email.com", password="password")
+        is None
+    )
+
+
+@pytest.mark.django_db
+def test_email_backend_authenticate_unknown_email(django_assert_num_queries):
+    """
+    Tests the authenticate method of the EmailBackend class with an
+    unknown email and checks if the password is still hashed once
+    """
+
+    with (
+        django_assert_num_queries(1),
+        patch("apps.authentication.backends.make_password") as mock_hash,
+    ):
+        authenticated = EmailBackend().authenticate(
+            None, email="user@email.com", password="password"
+        )
+
+    assert authenticated is None
+    mock_hash.assert_called_once_with("password")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "email, password, expected",
+    [
+        ("user@EMAIL.com", "password", True),
+        ("user@email.com", "wrong", False),
+        ("other@email.com", "password", False),
+    ],
+)
+def test_email_backend_aauthenticate(
+    user: AppUser, email: str, password: str, expected: bool
+):
+    """
+    Tests the aauthenticate method of the EmailBackend class with valid,
+    wrong password and unknown email credentials and checks if the user
+    is returned only for valid ones, hashing once through the async pool
+    """
+
+    with patch(
+        "apps.authentication.utils.hashing.executor.HashingExecutor.arun",
+        wraps=get_hashing_executor().arun,
+    ) as arun:
+        authenticated = async_to_sync(EmailBackend().aauthenticate)(
+            None, email=email, password=password
+        )
+
+    assert (authenticated == user) is expected
+    assert arun.call_count == 1
+
+
+@pytest.mark.django_db
+def test_authenticate_email_login_failed_signal():
+    """
+    Tests the authenticate function with an unknown email and
+    checks if the user_login_failed signal is still sent
+    """
+
+    with patch.object(user_login_failed, "send") as mock_send:
+        assert authenticate(None, email="user@email.com", password="password") is None
+
+    mock_send.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_sign_in_validate_user_single_query(
+    user: AppUser, rf: RequestFactory, django_assert_num_queries
+):
+    """
+    Tests the validate_user method of the SignIn class with
+    valid credentials and checks if only one query is run
+    """
+
+    request = rf.post(
+        "/sign-in", data={"email": "user@email.com", "password": "password"}
+    )
+    sign_in = SignIn(request=request)
+
+    with django_assert_num_queries(1):
+        sign_in.validate_user()
+
+    assert sign_in.user == user
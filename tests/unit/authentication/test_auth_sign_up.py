@@ -1,8 +1,27 @@
 import pytest
 from django.test import RequestFactory
 
-from authentication.models import AppUser
-from authentication.utils.auth.sign_up import SignUp
+from apps.authentication.models import AppUser
+from apps.authentication.utils.auth.sign_up import SignUp
+from utils.metrics.recorders import RequestMetrics, finish_request, start_request
+
+
+@pytest.fixture
+def request_metrics() -> RequestMetrics:
+    """
+    Collects the phases recorded during the test as for a request
+    """
+
+    yield start_request()
+    finish_request()
+
+
+def sign_up_phases(metrics: RequestMetrics) -> list[str]:
+    """
+    Returns the sign up validation stages that ran, in order
+    """
+
+    return [phase for phase in metrics.phases if phase.startswith("sign_up_")]
 
 
 def test_sign_up_init(rf: RequestFactory):
@@ -37,11 +56,63 @@ def test_sign_up_validate_data(rf: RequestFactory):
     ]
 
 
+def test_sign_up_validate_user_invalid_fields(
+    rf: RequestFactory, request_metrics: RequestMetrics
+):
+    """
+    Tests the validate_user method of the SignUp class with an invalid
+    username and email and checks if the field errors are set and the
+    later stages do not run
+    """
+
+    request = rf.post(
+        "/sign-up",
+        data={"username": "user name", "email": "email", "password": "1234"},
+    )
+    sign_up = SignUp(request=request)
+
+    sign_up.validate_user()
+
+    assert sign_up.errors == [
+        "Enter a valid username. This value may contain only letters, "
+        "numbers, and @/./+/-/_ characters.",
+        "Enter a valid email address.",
+    ]
+    assert sign_up_phases(request_metrics) == ["sign_up_fields"]
+    assert sign_up.user is None
+
+
+def test_sign_up_validate_user_invalid_password(
+    rf: RequestFactory, request_metrics: RequestMetrics
+):
+    """
+    Tests the validate_user method of the SignUp class with a short
+    password and checks if the password error is set without querying
+    the database for the username and email
+    """
+
+    request = rf.post(
+        "/sign-up",
+        data={"username": "username", "email": "user@email.com", "password": "1234"},
+    )
+    sign_up = SignUp(request=request)
+
+    sign_up.validate_user()
+
+    assert sign_up.errors == [
+        "This password is too short. It must contain at least 8 characters."
+    ]
+    assert sign_up_phases(request_metrics) == ["sign_up_fields", "sign_up_password"]
+    assert sign_up.user is None
+
+
 @pytest.mark.django_db
-def test_sign_up_validate_user_invalid_credentials(rf: RequestFactory):
+def test_sign_up_validate_user_taken_credentials(
+    rf: RequestFactory, django_assert_num_queries, request_metrics: RequestMetrics
+):
     """
-    Tests the validate_user method of the SignUp class with invalid
-    credentials and checks if the errors are set correctly and the user is None
+    Tests the validate_user method of the SignUp class with a taken
+    username and email and checks if both errors come from one query
     """
 
     AppUser.objects.create_user(
@@ -52,21 +123,45 @@ def test_sign_up_validate_user_invalid_credentials(rf: RequestFactory):
         data={
             "username": "username",
             "email": "user@email.com",
-            "password": "1234",
+            "password": "secret1234",
         },
     )
     sign_up = SignUp(request=request)
 
-    sign_up.validate_user()
+    with django_assert_num_queries(1):
+        sign_up.validate_user()
 
     assert sign_up.errors == [
         "A user with that username already exists.",
         "A user with that email already exists.",
-        "This password is too short. It must contain at least 8 characters.",
+    ]
+    assert sign_up_phases(request_metrics) == [
+        "sign_up_fields",
+        "sign_up_password",
+        "sign_up_uniqueness",
     ]
     assert sign_up.user is None
 
 
+@pytest.mark.django_db
+def test_sign_up_validate_user_taken_email_other_case(rf: RequestFactory):
+    """
+    Tests the validate_user method of the SignUp class with the email
+    of a user in another case and checks if it is reported as taken
+    """
+
+    AppUser.objects.create_user(username="username", email="user@email.com")
+    request = rf.post(
+        "/sign-up",
+        data={"username": "other", "email": "User@email.com", "password": "secret1234"},
+    )
+    sign_up = SignUp(request=request)
+
+    sign_up.validate_user()
+
+    assert sign_up.errors == ["A user with that email already exists."]
+
+
 @pytest.mark.django_db
 def test_sign_up_validate_user_valid_credentials(rf: RequestFactory):
     """
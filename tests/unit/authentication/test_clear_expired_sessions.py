@@ -0,0 +1,51 @@
+import datetime
+from io import StringIO
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+
+@pytest.mark.django_db
+def test_clear_expired_sessions_command():
+    """
+    Tests the clear_expired_sessions command with a chunk size smaller than
+    the number of expired sessions and checks if only those are deleted
+    """
+
+    now = timezone.now()
+
+    for index in range(5):
+        Session.objects.create(
+            session_key=f"expired{index}",
+            session_data="",
+            expire_date=now - datetime.timedelta(days=1),
+        )
+
+    Session.objects.create(
+        session_key="active",
+        session_data="",
+        expire_date=now + datetime.timedelta(days=1),
+    )
+    stdout = StringIO()
+
+    call_command("clear_expired_sessions", "--chunk-size", "2", stdout=stdout)
+
+    assert list(Session.objects.values_list("session_key", flat=True)) == ["active"]
+    assert "Deleted 5 expired sessions" in stdout.getvalue()
+
+
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies")
+def test_clear_expired_sessions_command_without_table():
+    """
+    Tests the clear_expired_sessions command with a session engine
+    without server-side rows and checks if nothing is deleted
+    """
+
+    stdout = StringIO()
+
+    call_command("clear_expired_sessions", stdout=stdout)
+
+    assert "no expired rows" in stdout.getvalue()
@@ -0,0 +1,99 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import OperationalError
+from django.utils import timezone
+
+from apps.authentication.models import ConsumedToken
+from apps.authentication.utils.tokens.ledger import ConsumedTokenLedger
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Clears the cache around every test
+    """
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_consumed_token_ledger_consume_once():
+    """
+    Tests the consume method of the ConsumedTokenLedger class twice
+    with the same id and checks if only the first call consumes it
+    """
+
+    expires_at = timezone.now() + datetime.timedelta(days=1)
+
+    assert ConsumedTokenLedger.is_consumed("jti") is False
+    assert ConsumedTokenLedger.consume("jti", expires_at) is True
+    assert ConsumedTokenLedger.consume("jti", expires_at) is False
+    assert ConsumedTokenLedger.is_consumed("jti") is True
+
+
+@pytest.mark.django_db
+def test_consumed_token_ledger_is_consumed_from_cache(django_assert_num_queries):
+    """
+    Tests the is_consumed method of the ConsumedTokenLedger class with a
+    consumed id and checks if the answer comes from the cache
+    """
+
+    ConsumedTokenLedger.consume("jti", timezone.now() + datetime.timedelta(days=1))
+
+    with django_assert_num_queries(0):
+        assert ConsumedTokenLedger.is_consumed("jti") is True
+
+
+@pytest.mark.django_db
+def test_consumed_token_ledger_expired_not_cached():
+    """
+    Tests the consume method of the ConsumedTokenLedger class with an
+    expired token and checks if it is not kept in the cache
+    """
+
+    ConsumedTokenLedger.consume("jti", timezone.now() - datetime.timedelta(days=1))
+
+    assert cache.get("consumed-token:jti") is None
+
+
+@pytest.mark.django_db
+def test_consumed_token_ledger_consume_database_error():
+    """
+    Tests the consume method of the ConsumedTokenLedger class when the
+    insert fails and checks if the error is raised and the id is neither
+    cached nor recorded, so the token can still be used
+    """
+
+    expires_at = timezone.now() + datetime.timedelta(days=1)
+
+    with patch.object(
+        ConsumedToken.objects,
+        "create",
+        side_effect=OperationalError("database is locked"),
+    ):
+        with pytest.raises(OperationalError):
+            ConsumedTokenLedger.consume("jti", expires_at)
+
+    assert cache.get("consumed-token:jti") is None
+    assert ConsumedTokenLedger.is_consumed("jti") is False
+    assert ConsumedTokenLedger.consume("jti", expires_at) is True
+
+
+@pytest.mark.django_db
+def test_consumed_token_ledger_clear_expired():
+    """
+    Tests the clear_expired method of the ConsumedTokenLedger class
+    and checks if only the expired ids are deleted
+    """
+
+    now = timezone.now()
+    ConsumedTokenLedger.consume("expired", now - datetime.timedelta(days=1))
+    ConsumedTokenLedger.consume("valid", now + datetime.timedelta(days=1))
+
+    assert ConsumedTokenLedger.clear_expired() == 1
+    assert list(ConsumedToken.objects.values_list("jti", flat=True)) == ["valid"]
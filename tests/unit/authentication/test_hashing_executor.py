@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from apps.authentication.utils.hashing.exceptions import HashingPoolSaturatedError
+from apps.authentication.utils.hashing.executor import HashingExecutor
+from utils.metrics.recorders import HASHING_QUEUED, HASHING_RUNNING
+
+
+def test_hashing_executor_run():
+    """
+    Tests the run method of the HashingExecutor class and
+    checks if the result is returned and the counters are updated
+    """
+
+    executor = HashingExecutor(max_workers=1, max_queue=0)
+
+    assert executor.run(sum, [1, 2]) == 3
+    assert executor.stats == {
+        "max_workers": 1,
+        "max_queue": 0,
+        "queued": 0,
+        "running": 0,
+        "completed": 1,
+        "rejected": 0,
+    }
+
+
+def test_hashing_executor_saturated():
+    """
+    Tests the submit method of the HashingExecutor class when every worker
+    is busy and the queue is full and checks if the submission is rejected
+    and the gauges count the running and queued hashes
+    """
+
+    executor = HashingExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait()
+
+    running = executor.submit(block)
+    started.wait()
+    queued = executor.submit(block)
+
+    with pytest.raises(HashingPoolSaturatedError):
+        executor.submit(block)
+
+    assert executor.stats["running"] == 1
+    assert executor.stats["queued"] == 1
+    assert executor.stats["rejected"] == 1
+    assert HASHING_RUNNING._values[()] == 1
+    assert HASHING_QUEUED._values[()] == 1
+
+    release.set()
+    running.result()
+    queued.result()
+
+    assert executor.run(sum, [1]) == 1
+    assert HASHING_RUNNING._values[()] == 0
+    assert HASHING_QUEUED._values[()] == 0
+
+
+def test_hashing_executor_releases_slot_on_error():
+    """
+    Tests the run method of the HashingExecutor class with a failing
+    function and checks if the error is raised and the slot is released
+    """
+
+    executor = HashingExecutor(max_workers=1, max_queue=0)
+
+    with pytest.raises(ZeroDivisionError):
+        executor.run(lambda: 1 / 0)
+
+    assert executor.run(sum, [1]) == 1
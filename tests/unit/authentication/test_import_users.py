@@ -0,0 +1,230 @@
+import json
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.authentication.models import AppUser
+from apps.authentication.utils.imports.importer import RejectedRecord, UserImporter
+from apps.emails.models import QueuedEmail
+
+PASSWORD = "correct horse battery"
+
+
+@pytest.fixture(autouse=True)
+def fast_hasher(settings):
+    """
+    Hashes the imported passwords with MD5
+    """
+
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+def write_csv(path: Path, rows: list[tuple[str, str, str]]) -> Path:
+    """
+    Writes the users to a CSV file with a header row
+    """
+
+    path.write_text(
+        "username,email,password\n" + "".join(f"{','.join(row)}\n" for row in rows)
+    )
+
+    return path
+
+
+def import_users(*args) -> tuple[str, str]:
+    """
+    Runs the import_users command and returns its output and errors
+    """
+
+    stdout, stderr = StringIO(), StringIO()
+    call_command("import_users", *args, stdout=stdout, stderr=stderr)
+
+    return stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_import_users_csv(tmp_path: Path, workers: str):
+    """
+    Tests the import_users command with a CSV file holding valid, invalid,
+    taken and duplicated users and checks if only the valid ones are
+    created, inactive, with hashed passwords, and the others are reported
+    """
+
+    AppUser.objects.create_user(username="taken", email="taken@email.com")
+    path = write_csv(
+        tmp_path / "users.csv",
+        [
+            ("first", "first@email.com", PASSWORD),
+            ("second", "second@email.com", PASSWORD),
+            ("invalid", "invalid", PASSWORD),
+            ("common", "common@email.com", "password"),
+            ("taken", "other@email.com", PASSWORD),
+            ("first", "duplicate@email.com", PASSWORD),
+        ],
+    )
+
+    stdout, stderr = import_users(str(path), "--chunk-size", "4", "--workers", workers)
+    users = AppUser.objects.exclude(username="taken").order_by("username")
+
+    assert [user.username for user in users] == ["first", "second"]
+    assert all(user.check_password(PASSWORD) for user in users)
+    assert not any(user.is_active or user.email_confirmed for user in users)
+    assert "Imported 2 users, rejected 4" in stdout
+    assert stderr.splitlines() == [
+        "Record 3: Enter a valid email address.",
+        "Record 4: This password is too common.",
+        "Record 5: A user with that username already exists.",
+        "Record 6: A user with that username already exists.",
+    ]
+
+
+@pytest.mark.django_db
+def test_import_users_email_case(tmp_path: Path):
+    """
+    Tests the import_users command with emails differing only in case
+    and checks if the taken and duplicated ones are rejected as the
+    unique email index would
+    """
+
+    AppUser.objects.create_user(username="taken", email="Taken@email.com")
+    path = write_csv(
+        tmp_path / "users.csv",
+        [
+            ("first", "TAKEN@email.com", PASSWORD),
+            ("second", "Second@email.com", PASSWORD),
+            ("third", "second@email.com", PASSWORD),
+        ],
+    )
+
+    stdout, stderr = import_users(str(path))
+
+    assert "Imported 1 users, rejected 2" in stdout
+    assert stderr.splitlines() == [
+        "Record 1: A user with that email already exists.",
+        "Record 3: A user with that email already exists.",
+    ]
+    assert AppUser.objects.by_email("second@email.com").get().username == "second"
+
+
+@pytest.mark.django_db
+def test_user_importer_concurrent_sign_up():
+    """
+    Tests the import_chunk method of the UserImporter class when someone
+    signs up with an imported email after the chunk was checked and
+    checks if only that record is rejected and the others are created
+    """
+
+    importer = UserImporter()
+    hash_passwords = importer._hash
+
+    def sign_up_meanwhile(passwords: list[str]) -> list[str]:
+        AppUser.objects.create_user(username="other", email="SECOND@email.com")
+        return hash_passwords(passwords)
+
+    with patch.object(importer, "_hash", side_effect=sign_up_meanwhile):
+        result = importer.import_chunk(
+            [
+                (
+                    position,
+                    {
+                        "username": name,
+                        "email": f"{name}@email.com",
+                        "password": PASSWORD,
+                    },
+                )
+                for position, name in enumerate(["first", "second", "third"])
+            ]
+        )
+
+    assert [user.username for user in result.created] == ["first", "third"]
+    assert all(user.pk for user in result.created)
+    assert result.rejected == [
+        RejectedRecord(1, ["A user with that email already exists."])
+    ]
+    assert sorted(AppUser.objects.values_list("username", flat=True)) == [
+        "first",
+        "other",
+        "third",
+    ]
+
+
+@pytest.mark.django_db
+def test_import_users_jsonl_activation_emails(settings, tmp_path: Path):
+    """
+    Tests the import_users command with a JSON lines file and activation
+    emails and checks if an email with a link to the site is queued
+    for every imported user
+    """
+
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        "\n".join(
+            json.dumps(
+                {
+                    "username": f"user{i}",
+                    "email": f"user{i}@email.com",
+                    "password": PASSWORD,
+                }
+            )
+            for i in range(3)
+        )
+    )
+
+    settings.SITE_PROTOCOL = "https"
+    settings.SITE_DOMAIN = "example.com"
+
+    import_users(str(path), "--send-activation-emails")
+
+    emails = QueuedEmail.objects.order_by("id")
+
+    assert [email.to for email in emails] == [[f"user{i}@email.com"] for i in range(3)]
+    assert all(
+        "https://example.com/activate-account?token=" in email.body for email in emails
+    )
+
+
+@pytest.mark.django_db
+def test_import_users_checkpoint(tmp_path: Path):
+    """
+    Tests the import_users command with a checkpoint and a run stopped by
+    an unreadable line and checks if the next run resumes after the last
+    committed chunk
+    """
+
+    path = tmp_path / "users.jsonl"
+    checkpoint = tmp_path / "checkpoint.json"
+    lines = [
+        json.dumps(
+            {
+                "username": f"user{i}",
+                "email": f"user{i}@email.com",
+                "password": PASSWORD,
+            }
+        )
+        for i in range(5)
+    ]
+    path.write_text("\n".join(lines[:2] + ["{"] + lines[3:]))
+
+    with pytest.raises(CommandError):
+        import_users(str(path), "--chunk-size", "2", "--checkpoint", str(checkpoint))
+
+    path.write_text("\n".join(lines))
+    stdout, _ = import_users(
+        str(path), "--chunk-size", "2", "--checkpoint", str(checkpoint), "--confirmed"
+    )
+
+    assert json.loads(checkpoint.read_text())["position"] == 5
+    assert "Resuming after 2 records" in stdout
+    assert list(
+        AppUser.objects.order_by("username").values_list("username", "is_active")
+    ) == [
+        ("user0", False),
+        ("user1", False),
+        ("user2", True),
+        ("user3", True),
+        ("user4", True),
+    ]
@@ -0,0 +1,73 @@
+import gzip
+from pathlib import Path
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+
+from apps.authentication.utils.passwords.digests import PasswordDigests
+from apps.authentication.validators import CommonPasswordValidator
+
+
+@pytest.mark.parametrize("password", ["password", "PassWord ", "123456"])
+def test_common_password_validator_common(password: str):
+    """
+    Tests the validate method of the CommonPasswordValidator class with
+    common passwords from the Django list and checks if they are rejected
+    """
+
+    with pytest.raises(ValidationError) as error:
+        CommonPasswordValidator().validate(password)
+
+    assert error.value.code == "password_too_common"
+
+
+def test_common_password_validator_uncommon():
+    """
+    Tests the validate method of the CommonPasswordValidator class
+    with an uncommon password and checks if it is accepted
+    """
+
+    CommonPasswordValidator().validate("correct horse battery staple 1234")
+
+
+def test_build_password_digests(tmp_path: Path):
+    """
+    Tests the build_password_digests command with a plain and a gzipped
+    list and checks if the memory mapped file finds every password once
+    """
+
+    plain = tmp_path / "plain.txt"
+    plain.write_text("Hunter2\nletmein\n\n")
+
+    with gzip.open(tmp_path / "breached.txt.gz", "wt") as file:
+        file.write("letmein\ntrustno1\n")
+
+    output = tmp_path / "digests.bin"
+    call_command(
+        "build_password_digests",
+        str(plain),
+        str(tmp_path / "breached.txt.gz"),
+        output=str(output),
+    )
+
+    digests = PasswordDigests.open(output)
+    validator = CommonPasswordValidator(digests_path=str(output))
+
+    assert len(digests) == 3
+    assert all(password in digests for password in ("hunter2", "letmein", "trustno1"))
+    assert "password" not in digests
+
+    with pytest.raises(ValidationError):
+        validator.validate("TrustNo1")
+
+
+def test_password_digests_empty(tmp_path: Path):
+    """
+    Tests the PasswordDigests class with an empty
+    file and checks if nothing is found
+    """
+
+    (tmp_path / "empty.bin").write_bytes(b"")
+
+    assert "password" not in PasswordDigests.open(tmp_path / "empty.bin")
@@ -0,0 +1,115 @@
+import datetime
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.authentication.models import AppUser
+
+
+def create_users() -> None:
+    """
+    Creates stale unconfirmed accounts, a recent one, a confirmed
+    one and an old superuser, which never confirms their email
+    """
+
+    old = timezone.now() - datetime.timedelta(days=31)
+
+    for index in range(5):
+        AppUser.objects.create_user(
+            username=f"stale{index}",
+            email=f"stale{index}@email.com",
+            is_active=False,
+            date_joined=old,
+        )
+
+    AppUser.objects.create_user(
+        username="recent", email="recent@email.com", is_active=False
+    )
+    AppUser.objects.create_user(
+        username="confirmed",
+        email="confirmed@email.com",
+        email_confirmed=True,
+        date_joined=old,
+    )
+    AppUser.objects.create_superuser(
+        username="admin", email="admin@email.com", date_joined=old
+    )
+
+
+def remaining_usernames() -> list[str]:
+    """
+    Returns the usernames left in the users table
+    """
+
+    return sorted(AppUser.objects.values_list("username", flat=True))
+
+
+@pytest.mark.django_db
+def test_purge_unconfirmed_users_command(tmp_path: Path):
+    """
+    Tests the purge_unconfirmed_users command with an archive and a chunk
+    size smaller than the number of stale accounts and checks if only
+    those are archived and deleted
+    """
+
+    create_users()
+    archive = tmp_path / "archive.jsonl"
+    stdout = StringIO()
+
+    call_command(
+        "purge_unconfirmed_users",
+        "--chunk-size",
+        "2",
+        "--archive",
+        str(archive),
+        stdout=stdout,
+    )
+
+    archived = [json.loads(line) for line in archive.read_text().splitlines()]
+
+    assert remaining_usernames() == ["admin", "confirmed", "recent"]
+    assert [user["username"] for user in archived] == [f"stale{i}" for i in range(5)]
+    assert "password" not in archived[0]
+    assert "Chunk 3: 5 accounts purged" in stdout.getvalue()
+    assert "Purged 5 unconfirmed accounts" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_purge_unconfirmed_users_command_dry_run(tmp_path: Path):
+    """
+    Tests the purge_unconfirmed_users command with the dry run option
+    and checks if the stale accounts are counted and kept
+    """
+
+    create_users()
+    stdout = StringIO()
+
+    call_command(
+        "purge_unconfirmed_users",
+        "--dry-run",
+        "--chunk-size",
+        "2",
+        "--archive",
+        str(tmp_path / "archive.jsonl"),
+        stdout=stdout,
+    )
+
+    assert len(remaining_usernames()) == 8
+    assert not (tmp_path / "archive.jsonl").exists()
+    assert "Found 5 unconfirmed accounts" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_stale_unconfirmed_uses_partial_index():
+    """
+    Tests the query of the stale unconfirmed accounts
+    and checks if it is answered from the partial index
+    """
+
+    plan = AppUser.objects.stale_unconfirmed(timezone.now()).explain()
+
+    assert "users_unconfirmed_joined_idx" in plan
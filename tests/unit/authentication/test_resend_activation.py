@@ -0,0 +1,198 @@
+import datetime
+import re
+import time
+from io import StringIO
+from unittest.mock import patch
+
+import jwt
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.authentication.models import AppUser
+from utils.email.throttle import Throttle
+from utils.tokens.constants import DEFAULT_EXPIRATION_DAYS
+from utils.tokens.tokens import Tokens
+
+TOKEN = re.compile(r"activate-account\?token=([\w.-]+)")
+
+
+class CountingEmailBackend(EmailBackend):
+    """
+    Local memory email backend counting the connections opened
+    """
+
+    opened = 0
+
+    def open(self) -> bool:
+        CountingEmailBackend.opened += 1
+        return True
+
+
+@pytest.fixture
+def users(settings) -> list[AppUser]:
+    """
+    Creates four accounts waiting for activation, the last one older
+    than the token lifetime, and an active and a confirmed account
+    """
+
+    settings.EMAIL_BACKEND = f"{__name__}.CountingEmailBackend"
+    settings.SITE_PROTOCOL = "https"
+    settings.SITE_DOMAIN = "example.com"
+    CountingEmailBackend.opened = 0
+
+    pending = [
+        AppUser.objects.create_user(
+            username=f"pending{index}",
+            email=f"pending{index}@email.com",
+            is_active=False,
+            date_joined=timezone.now() - datetime.timedelta(days=days),
+        )
+        for index, days in enumerate((0, 10, 20, 40))
+    ]
+    AppUser.objects.create_user(username="active", email="active@email.com")
+    AppUser.objects.create_user(
+        username="confirmed",
+        email="confirmed@email.com",
+        is_active=False,
+        email_confirmed=True,
+    )
+
+    return pending
+
+
+@pytest.mark.django_db
+def test_resend_activation_command(users: list[AppUser]):
+    """
+    Tests the resend_activation command with chunks smaller than the
+    accounts and two connections and checks if every pending account
+    gets a link to the site domain with a token for its id, over
+    connections opened once, apart from the account past the token lifetime
+    """
+
+    stdout = StringIO()
+
+    call_command(
+        "resend_activation",
+        "--chunk-size",
+        "2",
+        "--concurrency",
+        "2",
+        "--rate",
+        "0",
+        stdout=stdout,
+    )
+
+    recipients = {message.to[0]: message for message in mail.outbox}
+
+    assert set(recipients) == {user.email for user in users[:3]}
+    assert CountingEmailBackend.opened <= 2
+    assert "Resent 3 activation emails, 0 failed" in stdout.getvalue()
+
+    for user in users[:3]:
+        body = recipients[user.email].body
+        token = TOKEN.search(body).group(1)
+
+        assert "https://example.com/activate-account" in body
+        assert Tokens.validate_token(token)["user_id"] == user.id
+
+
+@pytest.mark.django_db
+def test_resend_activation_command_since(users: list[AppUser]):
+    """
+    Tests the resend_activation command with a start date
+    and checks if only the accounts created since get an email
+    """
+
+    since = (timezone.now() - datetime.timedelta(days=15)).date().isoformat()
+
+    call_command("resend_activation", "--since", since, stdout=StringIO())
+
+    assert sorted(message.to[0] for message in mail.outbox) == [
+        "pending0@email.com",
+        "pending1@email.com",
+    ]
+
+
+@pytest.mark.django_db
+def test_resend_activation_command_since_past_lifetime(users: list[AppUser]):
+    """
+    Tests the resend_activation command with a start date before the
+    token lifetime and checks if the account due to be purged is
+    still left out
+    """
+
+    since = (timezone.now() - datetime.timedelta(days=50)).date().isoformat()
+
+    call_command("resend_activation", "--since", since, stdout=StringIO())
+
+    assert len(mail.outbox) == 3
+    assert users[3].email not in {message.to[0] for message in mail.outbox}
+
+
+@pytest.mark.django_db
+def test_resend_activation_command_agrees_with_purge(users: list[AppUser]):
+    """
+    Tests the resend_activation command followed by the
+    purge_unconfirmed_users command and checks if every resent link
+    expires when its account is purged, not a full lifetime later
+    """
+
+    call_command("resend_activation", "--rate", "0", stdout=StringIO())
+
+    for message in mail.outbox:
+        user = AppUser.objects.get(email=message.to[0])
+        token = TOKEN.search(message.body).group(1)
+        expires_at = datetime.datetime.fromtimestamp(
+            jwt.decode(token, options={"verify_signature": False})["exp"],
+            tz=datetime.timezone.utc,
+        )
+
+        assert expires_at <= user.date_joined + datetime.timedelta(
+            days=DEFAULT_EXPIRATION_DAYS
+        )
+
+        for moment, exists in (
+            (expires_at - datetime.timedelta(seconds=1), True),
+            (expires_at + datetime.timedelta(seconds=1), False),
+        ):
+            with patch(
+                "apps.authentication.management.commands."
+                "purge_unconfirmed_users.timezone.now",
+                return_value=moment,
+            ):
+                call_command("purge_unconfirmed_users", stdout=StringIO())
+
+            assert AppUser.objects.filter(id=user.id).exists() is exists
+
+
+@pytest.mark.django_db
+def test_resend_activation_command_dry_run(users: list[AppUser]):
+    """
+    Tests the resend_activation command with the dry run option
+    and checks if the accounts are counted without sending emails
+    """
+
+    stdout = StringIO()
+
+    call_command("resend_activation", "--dry-run", stdout=stdout)
+
+    assert mail.outbox == []
+    assert "Found 3 accounts waiting for activation" in stdout.getvalue()
+
+
+def test_throttle():
+    """
+    Tests the wait method of the Throttle class and
+    checks if the calls are spaced out to the rate
+    """
+
+    throttle = Throttle(rate=50)
+    start = time.monotonic()
+
+    for _ in range(6):
+        throttle.wait()
+
+    assert time.monotonic() - start >= 0.09
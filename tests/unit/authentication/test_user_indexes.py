@@ -0,0 +1,82 @@
+import pytest
+from django.contrib.auth import authenticate
+from django.db import IntegrityError
+
+from apps.authentication.models import AppUser
+from apps.authentication.utils.imports.importer import UserImporter
+
+
+@pytest.fixture
+def user() -> AppUser:
+    """
+    Creates a user with a mixed case email
+    """
+
+    return AppUser.objects.create_user(
+        username="username", email="User@Email.com", password="password"
+    )
+
+
+@pytest.mark.django_db
+def test_by_email_ignores_case(user: AppUser):
+    """
+    Tests the by_email method of the user manager with the email
+    in another case and checks if the user is found
+    """
+
+    assert AppUser.objects.by_email("user@email.COM").get() == user
+    assert not AppUser.objects.by_email("other@email.com").exists()
+
+
+@pytest.mark.django_db
+def test_by_email_uses_lower_email_index():
+    """
+    Tests the query of the by_email method of the user manager and
+    checks if it is answered from the unique lowercased email index
+    """
+
+    plan = AppUser.objects.by_email("user@email.com").explain()
+
+    assert "users_email_lower_uniq" in plan
+
+
+@pytest.mark.django_db
+def test_email_unique_ignores_case(user: AppUser):
+    """
+    Tests the creation of a user with the email of another user
+    in another case and checks if the database rejects it
+    """
+
+    with pytest.raises(IntegrityError):
+        AppUser.objects.create_user(username="other", email="user@email.com")
+
+
+@pytest.mark.django_db
+def test_email_backend_ignores_case(user: AppUser):
+    """
+    Tests the email backend with the email in another case
+    and checks if the user is authenticated
+    """
+
+    assert authenticate(None, email="USER@email.com", password="password") == user
+
+
+@pytest.mark.django_db
+def test_user_importer_email_taken_ignores_case(settings, user: AppUser):
+    """
+    Tests the user importer with the email of an existing user and
+    a duplicate of the chunk, both in another case, and checks if
+    both records are rejected as taken
+    """
+
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    result = UserImporter().import_chunk(
+        [
+            (0, {"username": "first", "email": "USER@email.com", "password": "x" * 12}),
+            (1, {"username": "second", "email": "new@email.com", "password": "y" * 12}),
+            (2, {"username": "third", "email": "NEW@email.com", "password": "z" * 12}),
+        ]
+    )
+
+    assert [user.username for user in result.created] == ["second"]
+    assert [record.position for record in result.rejected] == [0, 2]
@@ -0,0 +1,124 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.core.management import call_command
+
+from apps.emails.models import QueuedEmail
+from apps.emails.utils.queue import EmailQueue
+
+
+def build_message() -> EmailMultiAlternatives:
+    """
+    Builds an email message with an HTML alternative
+    """
+
+    message = EmailMultiAlternatives(
+        subject="Subject", body="Body", to=["user@email.com"]
+    )
+    message.attach_alternative("<p>Body</p>", "text/html")
+
+    return message
+
+
+@pytest.mark.django_db
+def test_email_queue_push():
+    """
+    Tests the push method of the EmailQueue class
+    and checks if the message is stored as pending
+    """
+
+    EmailQueue.push(build_message())
+
+    queued_email = QueuedEmail.objects.get()
+
+    assert queued_email.status == QueuedEmail.Status.PENDING
+    assert queued_email.to == ["user@email.com"]
+    assert queued_email.alternatives == [["<p>Body</p>", "text/html"]]
+
+
+@pytest.mark.django_db
+def test_email_queue_process_success():
+    """
+    Tests the process method of the EmailQueue class
+    and checks if the queued email is delivered and marked as sent
+    """
+
+    EmailQueue.push(build_message())
+
+    sent, failed = EmailQueue.process()
+    queued_email = QueuedEmail.objects.get()
+
+    assert (sent, failed) == (1, 0)
+    assert queued_email.status == QueuedEmail.Status.SENT
+    assert queued_email.attempts == 1
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].alternatives == [("<p>Body</p>", "text/html")]
+
+
+@pytest.mark.django_db
+def test_email_queue_process_retry():
+    """
+    Tests the process method of the EmailQueue class when the delivery
+    fails and checks if the email is rescheduled and not processed again
+    before the backoff expires
+    """
+
+    EmailQueue.push(build_message())
+
+    with patch.object(EmailMultiAlternatives, "send", side_effect=OSError("down")):
+        sent, failed = EmailQueue.process()
+
+    queued_email = QueuedEmail.objects.get()
+
+    assert (sent, failed) == (0, 1)
+    assert queued_email.status == QueuedEmail.Status.PENDING
+    assert queued_email.last_error == "down"
+    assert EmailQueue.process() == (0, 0)
+
+
+@pytest.mark.django_db
+def test_email_queue_process_max_attempts():
+    """
+    Tests the process method of the EmailQueue class when the
+    delivery fails on the last attempt and checks if the email is failed
+    """
+
+    EmailQueue.push(build_message())
+
+    with patch.object(EmailMultiAlternatives, "send", side_effect=OSError("down")):
+        EmailQueue.process(max_attempts=1)
+
+    assert QueuedEmail.objects.get().status == QueuedEmail.Status.FAILED
+
+
+# The worker closes connections outside of autocommit, like the one the
+# test transaction holds, so the test runs without it
+@pytest.mark.django_db(transaction=True)
+def test_process_email_queue_command_once():
+    """
+    Tests the process_email_queue command with the once option
+    and checks if the queued email is delivered
+    """
+
+    EmailQueue.push(build_message())
+
+    call_command("process_email_queue", "--once", stdout=StringIO())
+
+    assert QueuedEmail.objects.get().status == QueuedEmail.Status.SENT
+    assert len(mail.outbox) == 1
+
+
+@pytest.mark.django_db
+def test_email_queue_apush():
+    """
+    Tests the apush method of the EmailQueue class
+    and checks if the message is stored as pending
+    """
+
+    async_to_sync(EmailQueue.apush)(build_message())
+
+    assert QueuedEmail.objects.get().status == QueuedEmail.Status.PENDING
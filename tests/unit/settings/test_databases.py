@@ -0,0 +1,95 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.conf import settings
+from django.db.utils import ConnectionHandler
+
+
+def test_sqlite_profile_pragmas(tmp_path: Path, django_db_blocker):
+    """
+    Tests the sqlite database profile against a file database and
+    checks if the WAL journal, the synchronous level and the busy
+    timeout are applied to new connections
+    """
+
+    connections = ConnectionHandler(
+        {
+            "default": {
+                **settings.DATABASE_PROFILES["sqlite"],
+                "NAME": tmp_path / "db.sqlite3",
+            }
+        }
+    )
+    connection = connections["default"]
+
+    try:
+        with django_db_blocker.unblock(), connection.cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            journal_mode = cursor.fetchone()[0]
+            cursor.execute("PRAGMA synchronous")
+            synchronous = cursor.fetchone()[0]
+            cursor.execute("PRAGMA busy_timeout")
+            busy_timeout = cursor.fetchone()[0]
+    finally:
+        connections.close_all()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1
+    assert (
+        busy_timeout
+        == settings.DATABASE_PROFILES["sqlite"]["OPTIONS"]["timeout"] * 1000
+    )
+    assert connection.transaction_mode == "IMMEDIATE"
+
+
+def load_settings(**environ: str) -> subprocess.CompletedProcess:
+    """
+    Imports the settings in a new interpreter with the given environment
+    and prints the default database as JSON
+    """
+
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json; from dj_wc import settings; "
+            "print(json.dumps(settings.DATABASES['default'], default=str))",
+        ],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, **environ},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_postgresql_profile_pooling():
+    """
+    Tests the postgresql database profile with persistent connections
+    requested and checks if it is pooled and keeps CONN_MAX_AGE at 0,
+    which Django requires together with a pool
+    """
+
+    result = load_settings(DATABASE_PROFILE="postgresql", DATABASE_CONN_MAX_AGE="60")
+    database = json.loads(result.stdout)
+
+    assert database["ENGINE"] == "django.db.backends.postgresql"
+    assert set(database["OPTIONS"]["pool"]) == {"min_size", "max_size", "timeout"}
+    assert database["CONN_MAX_AGE"] == 0
+
+
+def test_unknown_database_profile():
+    """
+    Tests the settings with an unknown database profile and checks
+    if ImproperlyConfigured lists the available profiles
+    """
+
+    result = load_settings(DATABASE_PROFILE="mysql")
+
+    assert result.returncode != 0
+    assert (
+        "ImproperlyConfigured: DATABASE_PROFILE must be one of sqlite, postgresql, "
+        "not 'mysql'" in result.stderr
+    )
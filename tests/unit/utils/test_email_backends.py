@@ -0,0 +1,112 @@
+import smtplib
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.mail import EmailMessage
+
+from utils.email.backends.pool import SMTPConnectionPool, close_pools
+from utils.email.backends.pooled_smtp import PooledEmailBackend
+
+
+@pytest.fixture(autouse=True)
+def clean_pools():
+    """
+    Closes the pools created by each test
+    """
+
+    yield
+    close_pools()
+
+
+def build_backend() -> PooledEmailBackend:
+    """
+    Builds a pooled email backend for a fake local server
+    """
+
+    return PooledEmailBackend(
+        host="localhost", port=2525, username="", password="", use_tls=False
+    )
+
+
+def test_smtp_connection_pool_reuses_connection():
+    """
+    Tests the acquire and release methods of the SMTPConnectionPool
+    class and checks if a released connection is handed out again
+    """
+
+    pool = SMTPConnectionPool(size=1, max_idle=30)
+    connect = MagicMock()
+
+    connection = pool.acquire(connect)
+    pool.release(connection)
+
+    assert pool.acquire(connect) is connection
+    connect.assert_called_once()
+
+
+def test_smtp_connection_pool_replaces_stale_connection():
+    """
+    Tests the acquire method of the SMTPConnectionPool class with an
+    idle connection that no longer answers and checks if it is replaced
+    """
+
+    pool = SMTPConnectionPool(size=1, max_idle=0)
+    stale = MagicMock()
+    stale.noop.side_effect = smtplib.SMTPServerDisconnected
+    fresh = MagicMock()
+
+    pool.release(pool.acquire(lambda: stale))
+
+    assert pool.acquire(lambda: fresh) is fresh
+    stale.close.assert_called_once()
+
+
+def test_smtp_connection_pool_timeout():
+    """
+    Tests the acquire method of the SMTPConnectionPool class when every
+    connection is in use and checks if TimeoutError is raised
+    """
+
+    pool = SMTPConnectionPool(size=1, max_idle=30)
+    pool.acquire(MagicMock())
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(MagicMock(), timeout=0.01)
+
+
+def test_pooled_email_backend_reuses_connection():
+    """
+    Tests the send_messages method of the PooledEmailBackend class
+    and checks if consecutive sends share a single SMTP connection
+    """
+
+    with patch("smtplib.SMTP") as mock_smtp:
+        for _ in range(3):
+            build_backend().send_messages(
+                [EmailMessage(subject="Subject", body="Body", to=["user@email.com"])]
+            )
+
+    mock_smtp.assert_called_once()
+    assert mock_smtp.return_value.sendmail.call_count == 3
+    mock_smtp.return_value.quit.assert_not_called()
+
+
+def test_pooled_email_backend_reconnects_when_disconnected():
+    """
+    Tests the send_messages method of the PooledEmailBackend class when
+    the server dropped the connection and checks if the message is resent
+    over a new connection
+    """
+
+    dropped = MagicMock()
+    dropped.sendmail.side_effect = smtplib.SMTPServerDisconnected
+    fresh = MagicMock()
+
+    with patch("smtplib.SMTP", side_effect=[dropped, fresh]):
+        sent = build_backend().send_messages(
+            [EmailMessage(subject="Subject", body="Body", to=["user@email.com"])]
+        )
+
+    assert sent == 1
+    dropped.close.assert_called_once()
+    fresh.sendmail.assert_called_once()
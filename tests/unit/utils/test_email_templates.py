@@ -0,0 +1,46 @@
+from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+
+from utils.email.strategies.email_confirmation import TEMPLATE, TEMPLATE_FIELDS
+from utils.email.templates import get_email_template
+
+CONTEXT = {
+    "protocol": "https",
+    "domain": "example.com",
+    "token": "header.payload<&>.signature",
+}
+
+
+def test_compiled_email_template():
+    """
+    Tests the compiled activation template with a token holding HTML
+    characters and checks if the HTML is the one the template engine
+    produces and the plain text keeps the escaped activation link
+    """
+
+    html_message, text_message = get_email_template(TEMPLATE, TEMPLATE_FIELDS).render(
+        CONTEXT
+    )
+    expected = render_to_string(TEMPLATE, CONTEXT)
+
+    assert html_message == expected
+    assert text_message == strip_tags(expected).replace(
+        "link\n",
+        "link (https://example.com/activate-account"
+        "?token=header.payload&lt;&amp;&gt;.signature)\n",
+    )
+
+
+def test_compiled_email_template_cache(settings):
+    """
+    Tests the compiled template requested twice and after the template
+    settings change and checks if it is only compiled again after it
+    """
+
+    template = get_email_template(TEMPLATE, TEMPLATE_FIELDS)
+
+    assert get_email_template(TEMPLATE, TEMPLATE_FIELDS) is template
+
+    settings.TEMPLATES = [{**settings.TEMPLATES[0]}]
+
+    assert get_email_template(TEMPLATE, TEMPLATE_FIELDS) is not template
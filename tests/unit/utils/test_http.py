@@ -0,0 +1,48 @@
+from typing import Optional
+
+import pytest
+from django.test import RequestFactory, override_settings
+
+from utils.http.client import client_ip
+
+
+@override_settings(TRUSTED_PROXIES=["127.0.0.1", "10.0.0.0/8"])
+@pytest.mark.parametrize(
+    "remote_addr, forwarded_for, expected",
+    [
+        ("203.0.113.1", None, "203.0.113.1"),
+        ("203.0.113.1", "198.51.100.1", "203.0.113.1"),
+        ("127.0.0.1", None, "127.0.0.1"),
+        ("127.0.0.1", "198.51.100.1", "198.51.100.1"),
+        ("127.0.0.1", "192.0.2.1, 198.51.100.1, 10.0.0.2", "198.51.100.1"),
+        ("127.0.0.1", "10.0.0.3, 10.0.0.2", "10.0.0.3"),
+        ("127.0.0.1", "unknown", "unknown"),
+    ],
+)
+def test_client_ip(
+    rf: RequestFactory,
+    remote_addr: str,
+    forwarded_for: Optional[str],
+    expected: str,
+):
+    """
+    Tests the client_ip function with direct and proxied requests and
+    checks if the right-most X-Forwarded-For hop that is not a trusted
+    proxy is returned, and the header is ignored from other addresses
+    """
+
+    headers = {"HTTP_X_FORWARDED_FOR": forwarded_for} if forwarded_for else {}
+    request = rf.get("/", REMOTE_ADDR=remote_addr, **headers)
+
+    assert client_ip(request) == expected
+
+
+def test_client_ip_without_trusted_proxies(rf: RequestFactory):
+    """
+    Tests the client_ip function without trusted proxies and
+    checks if the X-Forwarded-For header is ignored
+    """
+
+    request = rf.get("/", REMOTE_ADDR="127.0.0.1", HTTP_X_FORWARDED_FOR="192.0.2.1")
+
+    assert client_ip(request) == "127.0.0.1"
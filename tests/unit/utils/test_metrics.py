@@ -0,0 +1,162 @@
+import pytest
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from apps.authentication.models import AppUser
+from utils.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_metrics_registry_render():
+    """
+    Tests the render method of the MetricsRegistry class with a counter
+    and a histogram and checks if the Prometheus text format is correct
+    """
+
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("requests", "Requests", labels=("route",)))
+    histogram = registry.register(
+        Histogram("latency", "Latency", labels=("route",), buckets=(0.1, 1))
+    )
+
+    counter.inc(route='sign-"in"')
+    histogram.observe(0.05, route="home")
+    histogram.observe(0.5, route="home")
+    histogram.observe(5, route="home")
+
+    assert registry.render().splitlines() == [
+        "# HELP requests Requests",
+        "# TYPE requests counter",
+        'requests{route="sign-\\"in\\""} 1',
+        "# HELP latency Latency",
+        "# TYPE latency histogram",
+        'latency_bucket{route="home",le="0.1"} 1',
+        'latency_bucket{route="home",le="1.0"} 2',
+        'latency_bucket{route="home",le="+Inf"} 3',
+        'latency_sum{route="home"} 5.55',
+        'latency_count{route="home"} 3',
+    ]
+
+
+def test_metrics_registry_render_gauge():
+    """
+    Tests the render method of the MetricsRegistry class with a gauge
+    and checks if it starts at 0 and goes up and down
+    """
+
+    registry = MetricsRegistry()
+    gauge = registry.register(Gauge("running", "Running"))
+
+    assert registry.render().splitlines()[-1] == "running 0"
+
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    assert registry.render().splitlines() == [
+        "# HELP running Running",
+        "# TYPE running gauge",
+        "running 1",
+    ]
+
+
+def test_metrics_registry_register_duplicate():
+    """
+    Tests the register method of the MetricsRegistry class with a
+    duplicated metric name and checks if ValueError is raised
+    """
+
+    registry = MetricsRegistry()
+    registry.register(Counter("requests", "Requests"))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter("requests", "Requests"))
+
+
+@pytest.mark.django_db
+@override_settings(METRICS_SERVER_TIMING=True)
+def test_metrics_middleware_server_timing(client: Client):
+    """
+    Tests the metrics middleware with a sign in and checks if the
+    Server-Timing header reports the queries and the hashing time
+    """
+
+    AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+
+    response = client.post(
+        reverse("sign-in"), {"email": "user@email.com", "password": "password"}
+    )
+    timing = response["Server-Timing"]
+
+    assert response.status_code == 204
+    assert timing.startswith("db;dur=")
+    assert " queries" in timing and '"0 queries"' not in timing
+    assert "hash;dur=" in timing
+    assert "total;dur=" in timing
+
+
+@override_settings(METRICS_SERVER_TIMING=False)
+def test_metrics_middleware_no_server_timing(client: Client):
+    """
+    Tests the metrics middleware with Server-Timing
+    disabled and checks if the header is not set
+    """
+
+    response = client.get(reverse("home"))
+
+    assert "Server-Timing" not in response
+
+
+@override_settings(METRICS_TOKEN="secret")
+def test_metrics_view(client: Client):
+    """
+    Tests the metrics view with the bearer token after a request and
+    checks if the request is reported by route and status
+    """
+
+    client.get(reverse("home"))
+
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+    body = response.content.decode()
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{route="home",status="200"}' in body
+    assert 'http_request_db_queries_bucket{route="home",le="0.0"}' in body
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"HTTP_AUTHORIZATION": "Bearer wrong"},
+        {"HTTP_X_FORWARDED_FOR": "10.0.0.1"},
+    ],
+)
+@override_settings(METRICS_TOKEN="secret", METRICS_ALLOWED_IPS=["10.0.0.1"])
+def test_metrics_view_not_allowed(client: Client, headers: dict[str, str]):
+    """
+    Tests the metrics view without the token, with a wrong one and with a
+    forwarded allowed address from an untrusted peer and checks if the
+    response status code is 404
+    """
+
+    response = client.get(reverse("metrics"), **headers)
+
+    assert response.status_code == 404
+
+
+@override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"], TRUSTED_PROXIES=["127.0.0.1"])
+def test_metrics_view_allowed_ip_behind_proxy(client: Client):
+    """
+    Tests the metrics view from an allowed address relayed by a
+    trusted proxy and checks if the metrics are served, while the
+    proxy itself is not allowed
+    """
+
+    allowed = client.get(reverse("metrics"), HTTP_X_FORWARDED_FOR="10.0.0.1")
+    proxied = client.get(reverse("metrics"), HTTP_X_FORWARDED_FOR="192.0.2.1")
+
+    assert allowed.status_code == 200
+    assert proxied.status_code == 404
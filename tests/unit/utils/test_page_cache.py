@@ -0,0 +1,131 @@
+import re
+
+import pytest
+from django.core.cache import caches
+from django.core.cache.backends.base import memcache_key_warnings
+from django.test import Client
+from django.test.signals import template_rendered
+
+from apps.authentication.models import AppUser
+from utils.cache.page import CSRF_PLACEHOLDER
+
+CSRF_TOKEN = re.compile(rb'csrf-token="([^"]+)"')
+
+
+class TemplateCounter:
+    """
+    Counts the templates rendered while it is connected
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, **kwargs) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "TemplateCounter":
+        template_rendered.connect(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        template_rendered.disconnect(self)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", ["/", "/sign-in", "/sign-up"])
+def test_anonymous_page_cache_hit(path: str, django_assert_num_queries):
+    """
+    Tests an anonymous page requested twice and checks if the second
+    response is served from the cache without queries or templates
+    """
+
+    first = Client().get(path)
+
+    with TemplateCounter() as templates, django_assert_num_queries(0):
+        second = Client().get(path)
+
+    assert templates.count == 0
+    assert second.status_code == 200
+    assert CSRF_PLACEHOLDER.encode() not in second.content
+    assert CSRF_TOKEN.sub(b"", first.content) == CSRF_TOKEN.sub(b"", second.content)
+
+
+@pytest.mark.django_db
+def test_anonymous_page_cache_csrf_token():
+    """
+    Tests a sign in form submitted with the token of a cached page
+    with CSRF checks enforced and checks if the token is accepted
+    """
+
+    Client().get("/sign-in")
+    client = Client(enforce_csrf_checks=True)
+
+    response = client.get("/sign-in")
+    token = CSRF_TOKEN.search(response.content).group(1).decode()
+    submitted = client.post(
+        "/sign-in",
+        {"email": "user@email.com", "password": "password"},
+        HTTP_X_CSRFTOKEN=token,
+    )
+
+    assert token != CSRF_PLACEHOLDER
+    assert "csrftoken" in response.cookies
+    assert response["Cache-Control"].startswith("max-age=0")
+    assert submitted.status_code == 401
+
+
+@pytest.mark.django_db
+def test_anonymous_page_cache_query_params():
+    """
+    Tests the sign in page with different next and other query
+    parameters and checks if only the next parameter is cached apart
+    """
+
+    Client().get("/sign-in")
+    Client().get("/sign-in?next=/user")
+
+    with TemplateCounter() as templates:
+        redirected = Client().get("/sign-in?next=/user&utm_source=email")
+        plain = Client().get("/sign-in?utm_source=email")
+
+    assert templates.count == 0
+    assert b"use-toast" in redirected.content
+    assert b"use-toast" not in plain.content
+
+
+@pytest.mark.django_db
+def test_anonymous_page_cache_authenticated():
+    """
+    Tests a cached page requested by a signed in user
+    and checks if the view runs and redirects the user
+    """
+
+    user = AppUser.objects.create_user(
+        username="username", email="user@email.com", password="password"
+    )
+    client = Client()
+
+    Client().get("/sign-in")
+    client.force_login(user)
+
+    response = client.get("/sign-in")
+
+    assert response.status_code == 302
+    assert response.url == "/user"
+
+
+@pytest.mark.django_db
+def test_anonymous_page_cache_key():
+    """
+    Tests the sign in page with a long next parameter holding spaces and
+    checks if it is cached apart from the default cache under a key
+    memcached accepts
+    """
+
+    Client().get("/sign-in?next=" + "/a b" * 100)
+
+    keys = list(caches["pages"]._cache)
+
+    assert len(keys) == 1
+    assert not list(memcache_key_warnings(keys[0]))
+    assert not any("page-cache" in key for key in caches["default"]._cache)
@@ -0,0 +1,174 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from utils.ratelimit.limiter import RateLimiter
+from utils.ratelimit.stores.cache import CacheStore
+from utils.ratelimit.stores.local_memory import LocalMemoryStore
+
+RATELIMITS = {
+    "sign-in": [
+        {"key": "ip", "limit": 3, "window": 60},
+        {"key": "email", "limit": 2, "window": 60},
+    ]
+}
+
+
+@pytest.mark.parametrize("store", [LocalMemoryStore, CacheStore])
+def test_rate_limiter_hit(store):
+    """
+    Tests the hit method of the RateLimiter class over the limit
+    and checks if the remaining quota decreases and the hit
+    after the limit is rejected
+    """
+
+    store().clear()
+    limiter = RateLimiter(store=store())
+
+    with patch("utils.ratelimit.limiter.time.time", return_value=600):
+        results = [limiter.hit("key", limit=2, window=60) for _ in range(3)]
+
+    assert [result.allowed for result in results] == [True, True, False]
+    assert [result.remaining for result in results] == [1, 0, 0]
+    assert results[0].reset == 60
+
+
+def test_rate_limiter_sliding_window():
+    """
+    Tests the hit method of the RateLimiter class in the next window
+    and checks if the previous window still counts by its overlap
+    """
+
+    limiter = RateLimiter(store=LocalMemoryStore())
+
+    with patch("utils.ratelimit.limiter.time.time", return_value=600):
+        for _ in range(4):
+            limiter.hit("key", limit=4, window=60)
+
+    with patch("utils.ratelimit.limiter.time.time", return_value=690):
+        first = limiter.hit("key", limit=4, window=60)
+        second = limiter.hit("key", limit=4, window=60)
+        third = limiter.hit("key", limit=4, window=60)
+
+    assert (first.allowed, first.remaining) == (True, 1)
+    assert second.allowed is True
+    assert third.allowed is False
+
+
+def test_local_memory_store_expiry_and_prune():
+    """
+    Tests the LocalMemoryStore class with expired counters and
+    checks if they restart and are pruned, then the oldest
+    counters are dropped above the entry limit
+    """
+
+    store = LocalMemoryStore(max_entries=2)
+
+    with patch("utils.ratelimit.stores.local_memory.time.monotonic", return_value=0):
+        store.incr("first", timeout=10)
+
+    with patch("utils.ratelimit.stores.local_memory.time.monotonic", return_value=20):
+        assert store.get("first") == 0
+        assert store.incr("second", timeout=10) == 1
+        assert list(store._counters) == ["second"]
+        assert store.incr("third", timeout=10) == 1
+        assert store.incr("second", timeout=10) == 2
+        assert store.incr("fourth", timeout=10) == 1
+
+    assert list(store._counters) == ["third", "fourth"]
+
+
+def test_cache_store_clear():
+    """
+    Tests the clear method of the CacheStore class and checks
+    if the counters are deleted and the default cache is kept
+    """
+
+    store = CacheStore()
+    store.incr("key", timeout=60)
+    cache.set("session", "value")
+
+    store.clear()
+
+    assert store.get("key") == 0
+    assert cache.get("session") == "value"
+
+
+@pytest.mark.django_db
+@override_settings(RATELIMITS=RATELIMITS)
+def test_rate_limit_middleware_email(client: Client):
+    """
+    Tests the rate limit middleware with repeated sign in attempts for
+    one email and checks if the request over the limit is rejected
+    with a 429 before the password is checked
+    """
+
+    data = {"email": "user@email.com", "password": "password"}
+
+    responses = [client.post(reverse("sign-in"), data) for _ in range(2)]
+
+    with patch("apps.authentication.views.SignIn") as sign_in:
+        response = client.post(reverse("sign-in"), data)
+
+    assert [r.status_code for r in responses] == [401, 401]
+    assert responses[0]["X-RateLimit-Remaining"] == "1"
+    assert response.status_code == 429
+    assert response["X-RateLimit-Remaining"] == "0"
+    assert int(response["Retry-After"]) > 0
+    assert sign_in.called is False
+
+
+@pytest.mark.django_db
+@override_settings(RATELIMITS=RATELIMITS)
+def test_rate_limit_middleware_ip(client: Client):
+    """
+    Tests the rate limit middleware with sign in attempts for different
+    emails from one address and checks if the address limit applies
+    """
+
+    statuses = [
+        client.post(
+            reverse("sign-in"), {"email": f"user{i}@email.com", "password": "x"}
+        ).status_code
+        for i in range(4)
+    ]
+
+    assert statuses == [401, 401, 401, 429]
+
+
+@pytest.mark.django_db
+@override_settings(RATELIMITS=RATELIMITS, TRUSTED_PROXIES=["127.0.0.1"])
+def test_rate_limit_middleware_ip_behind_proxy(client: Client):
+    """
+    Tests the rate limit middleware with sign in attempts relayed by a
+    trusted proxy and checks if each forwarded client has its own limit
+    """
+
+    statuses = [
+        client.post(
+            reverse("sign-in"),
+            {"email": f"user{i}@email.com", "password": "x"},
+            REMOTE_ADDR="127.0.0.1",
+            HTTP_X_FORWARDED_FOR=f"192.0.2.{i % 2}",
+        ).status_code
+        for i in range(6)
+    ]
+
+    assert statuses == [401, 401, 401, 401, 401, 401]
+
+
+@override_settings(RATELIMITS=RATELIMITS)
+def test_rate_limit_middleware_other_methods(client: Client):
+    """
+    Tests the rate limit middleware with GET requests to a rate limited
+    route and checks if they are neither counted nor reported
+    """
+
+    for _ in range(5):
+        response = client.get(reverse("sign-in"))
+
+    assert response.status_code == 200
+    assert "X-RateLimit-Limit" not in response
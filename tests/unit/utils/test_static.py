@@ -0,0 +1,184 @@
+import gzip
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import caches
+from django.core.cache.utils import make_template_fragment_key
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from utils.static.checks import check_manifest
+from utils.static.context_processors import assets
+from utils.static.middleware import StaticFilesMiddleware
+
+SCRIPT = "console.log('bundle');\n" * 50
+
+
+@pytest.fixture
+def collected(settings, tmp_path: Path) -> Path:
+    """
+    Collects a bundle and a stylesheet with the compressed manifest storage
+    """
+
+    source = tmp_path / "static"
+    (source / "js").mkdir(parents=True)
+    (source / "css").mkdir()
+    (source / "js" / "bundle.js").write_text(SCRIPT)
+    (source / "css" / "styles.css").write_text("body { margin: 0; }\n")
+
+    settings.DEBUG = False
+    settings.STATIC_ROOT = tmp_path / "staticfiles"
+    settings.STATICFILES_DIRS = [source]
+    settings.STATICFILES_FINDERS = [
+        "django.contrib.staticfiles.finders.FileSystemFinder"
+    ]
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "utils.static.storage.CompressedManifestStaticFilesStorage"
+        },
+    }
+
+    call_command("collectstatic", interactive=False, verbosity=0)
+
+    return tmp_path
+
+
+def get_response(request) -> HttpResponse:
+    """
+    The handler behind the middleware
+    """
+
+    return HttpResponse(status=404)
+
+
+def test_compressed_manifest_storage(collected: Path):
+    """
+    Tests the collectstatic command with the compressed manifest storage
+    and checks if the hashed bundle gets a gzip variant while files too
+    small to gain from it do not
+    """
+
+    hashed = staticfiles_storage.stored_name("js/bundle.js")
+    root = collected / "staticfiles"
+
+    assert hashed != "js/bundle.js"
+    assert gzip.decompress((root / f"{hashed}.gz").read_bytes()).decode() == SCRIPT
+    assert not (
+        root / f"{staticfiles_storage.stored_name('css/styles.css')}.gz"
+    ).exists()
+
+
+def test_check_manifest(collected: Path):
+    """
+    Tests the check_manifest check before and after a new static file
+    is added and checks if the missing file is reported
+    """
+
+    assert check_manifest(None) == []
+
+    (collected / "static" / "js" / "new.js").write_text(SCRIPT)
+
+    assert [error.id for error in check_manifest(None)] == ["static_assets.E002"]
+
+
+def test_check_manifest_missing(settings, tmp_path: Path):
+    """
+    Tests the check_manifest check without collected
+    files and checks if the missing manifest is reported
+    """
+
+    settings.DEBUG = False
+    settings.STATIC_ROOT = tmp_path
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "utils.static.storage.CompressedManifestStaticFilesStorage"
+        },
+    }
+
+    assert [error.id for error in check_manifest(None)] == ["static_assets.E001"]
+
+
+def test_static_files_middleware_hashed(collected: Path, rf: RequestFactory):
+    """
+    Tests the static files middleware with a hashed file and a client
+    accepting gzip and checks if the gzip variant is served immutable
+    """
+
+    middleware = StaticFilesMiddleware(get_response)
+    url = staticfiles_storage.url("js/bundle.js")
+
+    response = middleware(rf.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate, br;q=0"))
+
+    assert response.status_code == 200
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Content-Type"].startswith("text/javascript")
+    assert response["Vary"] == "Accept-Encoding"
+    assert "immutable" in response["Cache-Control"]
+    assert gzip.decompress(b"".join(response.streaming_content)).decode() == SCRIPT
+
+
+def test_static_files_middleware_unhashed(collected: Path, rf: RequestFactory):
+    """
+    Tests the static files middleware with an unhashed name, a not
+    modified request and an unknown file and checks if they get a short
+    cache, a 304 and fall through to the rest of the stack
+    """
+
+    middleware = StaticFilesMiddleware(get_response)
+
+    response = middleware(rf.get("/static/js/bundle.js"))
+    not_modified = middleware(
+        rf.get("/static/js/bundle.js", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+    )
+
+    assert "Content-Encoding" not in response
+    assert response["Cache-Control"] == "public, max-age=60"
+    assert not_modified.status_code == 304
+    assert middleware(rf.get("/static/js/unknown.js")).status_code == 404
+
+
+def test_static_files_middleware_debug(settings):
+    """
+    Tests the static files middleware with DEBUG
+    and checks if it removes itself from the stack
+    """
+
+    settings.DEBUG = True
+
+    with pytest.raises(MiddlewareNotUsed):
+        StaticFilesMiddleware(get_response)
+
+
+def test_assets_context_processor(collected: Path, rf: RequestFactory):
+    """
+    Tests the assets context processor with collected
+    files and checks if the manifest hash is returned
+    """
+
+    assert assets(rf.get("/")) == {"assets_version": staticfiles_storage.manifest_hash}
+    assert staticfiles_storage.manifest_hash
+
+
+def test_page_assets_fragment(rf: RequestFactory):
+    """
+    Tests the page template and checks if the asset tags are rendered
+    from the fragment cache, keyed by the assets version
+    """
+
+    caches["template_fragments"].clear()
+    request = rf.get("/")
+    request.user = AnonymousUser()
+
+    first = render_to_string("base/home.html", request=request)
+    second = render_to_string("base/home.html", request=request)
+    key = make_template_fragment_key("page-assets", [""])
+
+    assert first == second
+    assert "js/bundle.js" in caches["template_fragments"].get(key)
@@ -0,0 +1,144 @@
+import datetime
+
+import jwt
+import pytest
+from django.conf import settings
+from django.test import override_settings
+
+from utils.tokens.exceptions import TokenValidationError
+from utils.tokens.tokens import Tokens, TokenService
+
+
+def test_tokens_generate_and_validate_token():
+    """
+    Tests the generate_token and validate_token methods of the Tokens
+    class and checks if the data is returned and the key id is set
+    """
+
+    token = Tokens.generate_token(data={"user_id": 1})
+
+    assert jwt.get_unverified_header(token)["kid"] == settings.TOKEN_SIGNING_KEY_ID
+    assert Tokens.validate_token(token=token)["user_id"] == 1
+
+
+def test_tokens_generate_token_expiration_days():
+    """
+    Tests the generate_token method of the Tokens class with
+    expiration days and checks if the expiration is applied
+    """
+
+    token = Tokens.generate_token(expiration_days=1)
+    expires_at = Tokens.validate_token(token=token)["exp"]
+    tomorrow = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+        days=1
+    )
+
+    assert abs(expires_at - tomorrow.timestamp()) < 5
+
+
+def test_tokens_generate_tokens():
+    """
+    Tests the generate_tokens method of the Tokens class and checks
+    if every token holds its data, a unique id and a shared expiration
+    """
+
+    payloads = [
+        Tokens.validate_token(token)
+        for token in Tokens.generate_tokens([{"user_id": 1}, {"user_id": 2}])
+    ]
+
+    assert [payload["user_id"] for payload in payloads] == [1, 2]
+    assert payloads[0]["jti"] != payloads[1]["jti"]
+    assert payloads[0]["exp"] == payloads[1]["exp"]
+
+
+def test_tokens_validate_token_compatible_with_pyjwt():
+    """
+    Tests the validate_token method of the Tokens class with a token
+    signed by PyJWT without a key id and checks if it is accepted
+    """
+
+    token = jwt.encode(
+        {"user_id": 1, "exp": 4102444800}, settings.SECRET_KEY, algorithm="HS256"
+    )
+
+    assert Tokens.validate_token(token=token) == {"user_id": 1, "exp": 4102444800}
+    assert (
+        jwt.decode(
+            Tokens.generate_token(data={"user_id": 1}),
+            settings.SECRET_KEY,
+            algorithms=["HS256"],
+        )["user_id"]
+        == 1
+    )
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "invalid_token",
+        jwt.encode({"user_id": 1}, "another-secret-key-long-enough", algorithm="HS256"),
+        jwt.encode(
+            {"user_id": 1, "exp": datetime.datetime(2000, 1, 1)},
+            settings.SECRET_KEY,
+            algorithm="HS256",
+        ),
+        jwt.encode(
+            {"user_id": 1, "exp": 4102444800}, settings.SECRET_KEY, algorithm="HS512"
+        ),
+        jwt.encode({"user_id": 1}, settings.SECRET_KEY, algorithm="HS256"),
+        jwt.encode(
+            {"user_id": 1, "exp": 4102444800},
+            settings.SECRET_KEY,
+            algorithm="HS256",
+            headers={"kid": "unknown"},
+        ),
+    ],
+)
+def test_tokens_validate_token_invalid(token: str):
+    """
+    Tests the validate_token method of the Tokens class with malformed,
+    forged, expired, wrong algorithm, unexpiring and unknown key tokens
+    and checks if TokenValidationError is raised
+    """
+
+    with pytest.raises(TokenValidationError):
+        Tokens.validate_token(token=token)
+
+
+def test_tokens_key_rotation():
+    """
+    Tests the Tokens class across a key rotation and checks if tokens
+    signed with a retired key are valid while the key is kept
+    and rejected once it is removed
+    """
+
+    with override_settings(
+        TOKEN_SIGNING_KEYS={"old": "old-key"}, TOKEN_SIGNING_KEY_ID="old"
+    ):
+        token = Tokens.generate_token(data={"user_id": 1})
+
+    with override_settings(
+        TOKEN_SIGNING_KEYS={"old": "old-key", "new": "new-key"},
+        TOKEN_SIGNING_KEY_ID="new",
+    ):
+        assert Tokens.validate_token(token=token)["user_id"] == 1
+        assert jwt.get_unverified_header(Tokens.generate_token())["kid"] == "new"
+
+    with override_settings(
+        TOKEN_SIGNING_KEYS={"new": "new-key"}, TOKEN_SIGNING_KEY_ID="new"
+    ):
+        with pytest.raises(TokenValidationError):
+            Tokens.validate_token(token=token)
+
+
+def test_token_service_rejects_non_hmac_algorithm():
+    """
+    Tests the TokenService class with an asymmetric
+    algorithm and checks if ValueError is raised
+    """
+
+    with pytest.raises(ValueError):
+        TokenService(
+            keys={"default": "key"}, signing_key_id="default", algorithm="none"
+        )
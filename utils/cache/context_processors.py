@@ -0,0 +1,25 @@
+from django.core.handlers.wsgi import WSGIRequest
+
+from utils.cache.page import CSRF_PLACEHOLDER
+
+
+def page_cache_csrf(request: WSGIRequest) -> dict[str, str]:
+    """
+    Renders a placeholder instead of the CSRF token while a page is
+    rendered for the page cache, the token is filled in per visitor
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    dict[str, str]
+        The placeholder as the CSRF token, or nothing
+    """
+
+    if getattr(request, "page_cache_csrf", False):
+        return {"csrf_token": CSRF_PLACEHOLDER}
+
+    return {}
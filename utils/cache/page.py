@@ -0,0 +1,228 @@
+import functools
+import hashlib
+from typing import Callable, Optional
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import caches
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+
+CSRF_PLACEHOLDER = "__page_cache_csrf_token__"
+CACHEABLE_METHODS = ("GET", "HEAD")
+STORED_HEADERS = ("Content-Type", "Cache-Control", "Expires")
+
+
+def anonymous_page_cache(
+    timeout: Optional[int] = None, query_params: tuple[str, ...] = ()
+) -> Callable:
+    """
+    Caches the pages a view renders for anonymous visitors. Visitors
+    with a session are checked and served by the view when signed in.
+    The page is stored with a placeholder for the CSRF token, which is
+    replaced by the token of each visitor, so the view can keep its
+    never cache headers for the browser and proxies
+
+    Parameters
+    ----------
+    timeout : Optional[int]
+        Seconds pages are cached for, defaults to PAGE_CACHE_TIMEOUT
+    query_params : tuple[str, ...]
+        The query parameters the page depends on, the others are
+        ignored so they cannot be used to bypass the cache. Each value
+        is a cache entry, the PAGE_CACHE_ALIAS cache has to be bounded
+
+    Returns
+    -------
+    Callable
+        The view decorator
+    """
+
+    def decorator(view: Callable) -> Callable:
+        def cache_key(request: WSGIRequest) -> str:
+            # Hashed so any parameter value gives a short, valid cache key
+            params = hashlib.sha256(
+                urlencode(
+                    [(name, request.GET.get(name, "")) for name in query_params]
+                ).encode()
+            ).hexdigest()
+            version = getattr(staticfiles_storage, "manifest_hash", "")
+
+            return f"page-cache:{request.path}:{params}:{version}"
+
+        def cache_timeout() -> int:
+            return timeout if timeout is not None else settings.PAGE_CACHE_TIMEOUT
+
+        if iscoroutinefunction(view):
+
+            @functools.wraps(view)
+            async def cached_view(request: WSGIRequest, *args, **kwargs):
+                if request.method not in CACHEABLE_METHODS or (
+                    has_session(request) and (await request.auser()).is_authenticated
+                ):
+                    return await view(request, *args, **kwargs)
+
+                cache = caches[settings.PAGE_CACHE_ALIAS]
+                key = cache_key(request)
+                stored = await cache.aget(key)
+
+                if stored is not None:
+                    return from_cache(request, stored)
+
+                request.page_cache_csrf = True
+                response = await view(request, *args, **kwargs)
+                request.page_cache_csrf = False
+
+                if is_cacheable(response):
+                    await cache.aset(key, to_cache(response), cache_timeout())
+
+                return fill_csrf_token(request, response)
+
+        else:
+
+            @functools.wraps(view)
+            def cached_view(request: WSGIRequest, *args, **kwargs):
+                if request.method not in CACHEABLE_METHODS or (
+                    has_session(request) and request.user.is_authenticated
+                ):
+                    return view(request, *args, **kwargs)
+
+                cache = caches[settings.PAGE_CACHE_ALIAS]
+                key = cache_key(request)
+                stored = cache.get(key)
+
+                if stored is not None:
+                    return from_cache(request, stored)
+
+                request.page_cache_csrf = True
+                response = view(request, *args, **kwargs)
+                request.page_cache_csrf = False
+
+                if is_cacheable(response):
+                    cache.set(key, to_cache(response), cache_timeout())
+
+                return fill_csrf_token(request, response)
+
+        return cached_view
+
+    return decorator
+
+
+def has_session(request: WSGIRequest) -> bool:
+    """
+    Checks if the request carries a session cookie, without one
+    the visitor is anonymous and the session is not loaded
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    bool
+        Whether the session cookie is set
+    """
+
+    return settings.SESSION_COOKIE_NAME in request.COOKIES
+
+
+def is_cacheable(response: HttpResponse) -> bool:
+    """
+    Checks if a response can be shared between anonymous visitors
+
+    Parameters
+    ----------
+    response : HttpResponse
+        The response object
+
+    Returns
+    -------
+    bool
+        Whether the response can be cached
+    """
+
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not response.has_header("Vary")
+    )
+
+
+def to_cache(response: HttpResponse) -> tuple[bytes, dict[str, str]]:
+    """
+    Extracts what is stored of a response
+
+    Parameters
+    ----------
+    response : HttpResponse
+        The response object
+
+    Returns
+    -------
+    tuple[bytes, dict[str, str]]
+        The content and headers
+    """
+
+    return response.content, {
+        header: response[header]
+        for header in STORED_HEADERS
+        if response.has_header(header)
+    }
+
+
+def from_cache(
+    request: WSGIRequest, stored: tuple[bytes, dict[str, str]]
+) -> HttpResponse:
+    """
+    Builds the response of a cached page for the visitor
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+    stored : tuple[bytes, dict[str, str]]
+        The cached content and headers
+
+    Returns
+    -------
+    HttpResponse
+        The response object
+    """
+
+    content, headers = stored
+    response = HttpResponse(content, headers=headers)
+
+    return fill_csrf_token(request, response)
+
+
+def fill_csrf_token(request: WSGIRequest, response: HttpResponse) -> HttpResponse:
+    """
+    Replaces the CSRF token placeholder with the token of the
+    visitor, which also makes the CSRF middleware set its cookie
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+    response : HttpResponse
+        The response object
+
+    Returns
+    -------
+    HttpResponse
+        The response object
+    """
+
+    placeholder = CSRF_PLACEHOLDER.encode()
+
+    if not response.streaming and placeholder in response.content:
+        response.content = response.content.replace(
+            placeholder, get_token(request).encode()
+        )
+
+    return response
@@ -0,0 +1,202 @@
+import os
+import smtplib
+import threading
+import time
+from typing import Callable, Optional
+
+_pools: dict[tuple, "SMTPConnectionPool"] = {}
+_pools_lock = threading.Lock()
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of authenticated SMTP connections
+
+    Attributes
+    ----------
+    size : int
+        The maximum number of connections handed out at the same time
+    max_idle : float
+        Seconds after which an idle connection is checked before reuse
+    """
+
+    def __init__(self, size: int, max_idle: float) -> None:
+        """
+        Initializes the connection pool
+
+        Parameters
+        ----------
+        size : int
+            The maximum number of connections handed out at the same time
+        max_idle : float
+            Seconds after which an idle connection is checked before reuse
+        """
+
+        self.size = size
+        self.max_idle = max_idle
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, connect: Callable[[], smtplib.SMTP], timeout: Optional[float] = None
+    ) -> smtplib.SMTP:
+        """
+        Returns an idle connection that is still alive
+        or a new one if there is none
+
+        Parameters
+        ----------
+        connect : Callable[[], smtplib.SMTP]
+            Opens and authenticates a new connection
+        timeout : Optional[float]
+            Seconds to wait for a free slot, waits forever if None
+
+        Returns
+        -------
+        smtplib.SMTP
+            The connection
+
+        Raises
+        ------
+        TimeoutError
+            If no slot is released before the timeout
+        """
+
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No SMTP connection available in the pool")
+
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+
+                    connection, released_at = self._idle.pop()
+
+                if self._is_alive(connection, released_at):
+                    return connection
+
+                self._discard(connection)
+
+            return connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: smtplib.SMTP, reusable: bool = True) -> None:
+        """
+        Gives the connection back to the pool
+
+        Parameters
+        ----------
+        connection : smtplib.SMTP
+            The connection
+        reusable : bool
+            Whether the connection can be handed out again
+        """
+
+        if reusable:
+            with self._lock:
+                self._idle.append((connection, time.monotonic()))
+        else:
+            self._discard(connection)
+
+        self._slots.release()
+
+    def close(self) -> None:
+        """
+        Closes every idle connection
+        """
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for connection, _ in idle:
+            try:
+                connection.quit()
+            except (smtplib.SMTPException, OSError):
+                self._discard(connection)
+
+    def _is_alive(self, connection: smtplib.SMTP, released_at: float) -> bool:
+        """
+        Checks whether the connection can be reused, connections idle
+        for longer than max_idle are probed with a NOOP command
+
+        Parameters
+        ----------
+        connection : smtplib.SMTP
+            The connection
+        released_at : float
+            The monotonic time when the connection was released
+
+        Returns
+        -------
+        bool
+            Whether the connection is alive
+        """
+
+        if time.monotonic() - released_at < self.max_idle:
+            return True
+
+        try:
+            return connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _discard(connection: smtplib.SMTP) -> None:
+        """
+        Closes the connection socket without talking to the server
+
+        Parameters
+        ----------
+        connection : smtplib.SMTP
+            The connection
+        """
+
+        try:
+            connection.close()
+        except OSError:
+            pass
+
+
+def get_pool(key: tuple, size: int, max_idle: float) -> SMTPConnectionPool:
+    """
+    Returns the pool of the current process for the given server and credentials
+
+    Parameters
+    ----------
+    key : tuple
+        The server and credentials the connections are opened with
+    size : int
+        The pool size used if the pool does not exist yet
+    max_idle : float
+        The maximum idle time used if the pool does not exist yet
+
+    Returns
+    -------
+    SMTPConnectionPool
+        The connection pool
+    """
+
+    key = (os.getpid(), *key)
+
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = SMTPConnectionPool(size=size, max_idle=max_idle)
+
+        return _pools[key]
+
+
+def close_pools() -> None:
+    """
+    Closes the idle connections of every pool
+    """
+
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close()
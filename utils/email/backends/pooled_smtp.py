@@ -0,0 +1,175 @@
+import smtplib
+from typing import Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.core.mail.backends.smtp import EmailBackend
+from django.core.mail.utils import DNS_NAME
+
+from utils.email.backends.pool import SMTPConnectionPool, get_pool
+from utils.metrics.recorders import timed
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_MAX_IDLE = 30
+
+
+class PooledEmailBackend(EmailBackend):
+    """
+    SMTP email backend that borrows its connection from a process wide
+    pool instead of opening and closing one for every send
+    """
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        pool_max_idle: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initializes the email backend
+
+        Parameters
+        ----------
+        pool_size : Optional[int]
+            The maximum number of connections, defaults to EMAIL_POOL_SIZE
+        pool_max_idle : Optional[float]
+            Seconds after which an idle connection is probed before reuse,
+            defaults to EMAIL_POOL_MAX_IDLE
+        **kwargs : dict
+            The SMTP email backend arguments
+        """
+
+        super().__init__(**kwargs)
+
+        self.pool_size = pool_size or getattr(
+            settings, "EMAIL_POOL_SIZE", DEFAULT_POOL_SIZE
+        )
+        self.pool_max_idle = pool_max_idle or getattr(
+            settings, "EMAIL_POOL_MAX_IDLE", DEFAULT_POOL_MAX_IDLE
+        )
+
+    @property
+    def pool(self) -> SMTPConnectionPool:
+        """
+        The pool for the configured server and credentials
+
+        Returns
+        -------
+        SMTPConnectionPool
+            The connection pool
+        """
+
+        return get_pool(
+            key=(self.host, self.port, self.username, self.use_tls, self.use_ssl),
+            size=self.pool_size,
+            max_idle=self.pool_max_idle,
+        )
+
+    def open(self) -> Optional[bool]:
+        """
+        Borrows a connection from the pool
+
+        Returns
+        -------
+        Optional[bool]
+            Whether a connection was borrowed, False if the backend already
+            holds one or None if an exception passed silently
+        """
+
+        if self.connection:
+            return False
+
+        try:
+            self.connection = self.pool.acquire(self._connect, timeout=self.timeout)
+            return True
+        except OSError:
+            if not self.fail_silently:
+                raise
+
+    def close(self) -> None:
+        """
+        Gives the connection back to the pool
+        """
+
+        if self.connection is None:
+            return
+
+        connection, self.connection = self.connection, None
+        self.pool.release(connection)
+
+    def send_messages(self, email_messages: list[EmailMessage]) -> int:
+        """
+        Sends the messages, timing the delivery
+
+        Parameters
+        ----------
+        email_messages : list[EmailMessage]
+            The email messages
+
+        Returns
+        -------
+        int
+            The number of messages sent
+        """
+
+        with timed("smtp"):
+            return super().send_messages(email_messages)
+
+    def _send(self, email_message: EmailMessage) -> bool:
+        """
+        Sends the message, reconnecting once if
+        the server dropped the pooled connection
+
+        Parameters
+        ----------
+        email_message : EmailMessage
+            The email message
+
+        Returns
+        -------
+        bool
+            Whether the message was sent
+        """
+
+        try:
+            return super()._send(email_message)
+        except smtplib.SMTPServerDisconnected:
+            connection, self.connection = self.connection, None
+            self.pool.release(connection, reusable=False)
+
+            if not self.open():
+                return False
+
+            return super()._send(email_message)
+
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Opens and authenticates a new connection
+
+        Returns
+        -------
+        smtplib.SMTP
+            The connection
+        """
+
+        connection_params = {"local_hostname": DNS_NAME.get_fqdn()}
+
+        if self.timeout is not None:
+            connection_params["timeout"] = self.timeout
+
+        if self.use_ssl:
+            connection_params["context"] = self.ssl_context
+
+        connection = self.connection_class(self.host, self.port, **connection_params)
+
+        try:
+            if not self.use_ssl and self.use_tls:
+                connection.starttls(context=self.ssl_context)
+
+            if self.username and self.password:
+                connection.login(self.username, self.password)
+        except BaseException:
+            connection.close()
+            raise
+
+        return connection
@@ -1,4 +1,10 @@
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+
+from utils.email.queues.abstract import EmailQueueAbstract
 from utils.email.strategies.abstract import EmailStrategyAbstract
+from utils.metrics.recorders import timed
 
 
 class EmailContext:
@@ -6,7 +12,11 @@ class EmailContext:
     Email context
     """
 
-    def __init__(self, strategy: EmailStrategyAbstract) -> None:
+    def __init__(
+        self,
+        strategy: EmailStrategyAbstract,
+        queue: Optional[EmailQueueAbstract] = None,
+    ) -> None:
         """
         Initializes the email context
 
@@ -14,9 +24,12 @@ class EmailContext:
         ----------
         strategy : EmailStrategyAbstract
             The email strategy
+        queue : Optional[EmailQueueAbstract]
+            The queue used to deliver emails outside of the request
         """
 
         self._strategy = strategy
+        self._queue = queue
 
     def send(self, to: str, **kwargs) -> None:
         """
@@ -30,4 +43,44 @@ class EmailContext:
             Arbitrary keyword arguments
         """
 
-        self._strategy.send(to=to, **kwargs)
+        with timed("email"):
+            self._strategy.send(to=to, **kwargs)
+
+    def enqueue(self, to: str, **kwargs) -> None:
+        """
+        Builds the email and pushes it to the queue,
+        sends it right away if no queue is configured
+
+        Parameters
+        ----------
+        to : str
+            The email recipient
+        **kwargs : dict
+            Arbitrary keyword arguments
+        """
+
+        if self._queue is None:
+            self.send(to=to, **kwargs)
+            return
+
+        with timed("email"):
+            self._queue.push(self._strategy.build_message(to=to, **kwargs))
+
+    async def aenqueue(self, to: str, **kwargs) -> None:
+        """
+        Async version of enqueue
+
+        Parameters
+        ----------
+        to : str
+            The email recipient
+        **kwargs : dict
+            Arbitrary keyword arguments
+        """
+
+        if self._queue is None:
+            await sync_to_async(self.send)(to=to, **kwargs)
+            return
+
+        with timed("email"):
+            await self._queue.apush(self._strategy.build_message(to=to, **kwargs))
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+
+from asgiref.sync import sync_to_async
+from django.core.mail import EmailMessage
+
+
+class EmailQueueAbstract(ABC):
+    """
+    Email queue abstract class
+    """
+
+    @abstractmethod
+    def push(self, message: EmailMessage) -> None:
+        """
+        Push abstract method
+
+        Parameters
+        ----------
+        message : EmailMessage
+            The email message to deliver later
+        """
+
+        pass
+
+    async def apush(self, message: EmailMessage) -> None:
+        """
+        Async version of push, runs it in
+        a thread unless it is overridden
+
+        Parameters
+        ----------
+        message : EmailMessage
+            The email message to deliver later
+        """
+
+        await sync_to_async(self.push)(message)
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from django.core.mail import EmailMessage
+
 
 class EmailStrategyAbstract(ABC):
     """
@@ -7,9 +9,9 @@ class EmailStrategyAbstract(ABC):
     """
 
     @abstractmethod
-    def send(self, to: str, **kwargs) -> None:
+    def build_message(self, to: str, **kwargs) -> EmailMessage:
         """
-        Send abstract method
+        Build message abstract method
 
         Parameters
         ----------
@@ -17,6 +19,26 @@ class EmailStrategyAbstract(ABC):
             The email recipient
         **kwargs : dict
             Arbitrary keyword arguments
+
+        Returns
+        -------
+        EmailMessage
+            The email message ready to be sent
         """
 
         pass
+
+    @classmethod
+    def send(cls, to: str, **kwargs) -> None:
+        """
+        Builds the email message and sends it
+
+        Parameters
+        ----------
+        to : str
+            The email recipient
+        **kwargs : dict
+            Arbitrary keyword arguments
+        """
+
+        cls.build_message(to=to, **kwargs).send()
@@ -1,13 +1,16 @@
+from typing import Optional
+
+from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.handlers.wsgi import WSGIRequest
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 
 from utils.email.strategies.abstract import EmailStrategyAbstract
+from utils.email.templates import get_email_template
 from utils.tokens.tokens import Tokens
 
 TEMPLATE = "authentication/activate-your-account.html"
+TEMPLATE_FIELDS = ("protocol", "domain", "token")
 SUBJECT = "Activate your account!"
 
 
@@ -17,9 +20,9 @@ class EmailConfirmationStrategy(EmailStrategyAbstract):
     """
 
     @staticmethod
-    def send(to: str, **kwargs) -> None:
+    def build_message(to: str, **kwargs) -> EmailMultiAlternatives:
         """
-        Sends an email to the user with a
+        Builds an email to the user with a
         link to activate their account
 
         Parameters
@@ -28,21 +31,37 @@ class EmailConfirmationStrategy(EmailStrategyAbstract):
             The recipient's email address
         **kwargs : dict
             Arbitrary keyword arguments. May include:
-            - request (WSGIRequest) : The request object
+            - request (WSGIRequest) : The request the link is built from
+            - protocol (str) : The link protocol without a request,
+              defaults to SITE_PROTOCOL
+            - domain (str) : The link domain without a request,
+              defaults to SITE_DOMAIN
             - user_id (int) : The user id
+            - token (str) : A token already generated for the user
+
+        Returns
+        -------
+        EmailMultiAlternatives
+            The email confirmation message
         """
 
-        request: WSGIRequest = kwargs["request"]
+        request: Optional[WSGIRequest] = kwargs.get("request")
         user_id: int = kwargs["user_id"]
 
-        view_context = {
-            "protocol": "https" if request.is_secure() else "http",
-            "domain": get_current_site(request).domain,
-            "token": Tokens.generate_token(data={"user_id": user_id}),
-        }
+        if request is not None:
+            protocol = "https" if request.is_secure() else "http"
+            domain = get_current_site(request).domain
+        else:
+            protocol = kwargs.get("protocol") or settings.SITE_PROTOCOL
+            domain = kwargs.get("domain") or settings.SITE_DOMAIN
+
+        token = kwargs.get("token") or Tokens.generate_token(data={"user_id": user_id})
+
+        view_context = {"protocol": protocol, "domain": domain, "token": token}
 
-        html_message = render_to_string(TEMPLATE, view_context)
-        text_message = strip_tags(html_message)
+        html_message, text_message = get_email_template(
+            TEMPLATE, TEMPLATE_FIELDS
+        ).render(view_context)
 
         email = EmailMultiAlternatives(
             subject=SUBJECT,
@@ -52,4 +71,4 @@ class EmailConfirmationStrategy(EmailStrategyAbstract):
 
         email.attach_alternative(html_message, "text/html")
 
-        email.send()
+        return email
@@ -0,0 +1,155 @@
+import functools
+import re
+from pathlib import Path
+from typing import Any
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import render_to_string
+from django.utils.autoreload import file_changed
+from django.utils.html import conditional_escape, strip_tags
+
+FIELD_PATTERN = re.compile(r"__email_field_(\w+)__")
+LINK_PATTERN = re.compile(r"<a\s[^>]*?href=\"([^\"]*)\"[^>]*>(.*?)</a>", re.DOTALL)
+
+
+class CompiledEmailTemplate:
+    """
+    Email template rendered once with placeholders, the HTML and the
+    stripped plain text skeletons are filled with the field values
+    of every message by joining strings. Links keep their URL in the
+    plain text, after the link text
+
+    Only templates that output their fields verbatim can be compiled,
+    fields used in tags or filters would see the placeholders
+
+    Attributes
+    ----------
+    template_name : str
+        The name of the template
+    fields : tuple[str, ...]
+        The context variables of the template
+    """
+
+    def __init__(self, template_name: str, fields: tuple[str, ...]) -> None:
+        """
+        Initializes the compiled template
+
+        Parameters
+        ----------
+        template_name : str
+            The name of the template
+        fields : tuple[str, ...]
+            The context variables of the template
+        """
+
+        self.template_name = template_name
+        self.fields = fields
+
+        html_message = render_to_string(
+            template_name, {field: f"__email_field_{field}__" for field in fields}
+        )
+
+        self._html_parts = FIELD_PATTERN.split(html_message)
+        self._text_parts = FIELD_PATTERN.split(
+            strip_tags(LINK_PATTERN.sub(r"\2 (\1)", html_message))
+        )
+
+    @staticmethod
+    def _join(parts: list[str], values: dict[str, str]) -> str:
+        """
+        Joins the skeleton parts, the odd ones are field names
+
+        Parameters
+        ----------
+        parts : list[str]
+            The skeleton split on the placeholders
+        values : dict[str, str]
+            The escaped field values
+
+        Returns
+        -------
+        str
+            The rendered message
+        """
+
+        rendered = parts.copy()
+        rendered[1::2] = [values[field] for field in parts[1::2]]
+
+        return "".join(rendered)
+
+    def render(self, context: dict[str, Any]) -> tuple[str, str]:
+        """
+        Renders the HTML and plain text messages
+
+        Parameters
+        ----------
+        context : dict[str, Any]
+            The field values
+
+        Returns
+        -------
+        tuple[str, str]
+            The HTML and plain text messages, the values are escaped
+            in both like the template engine does before stripping tags
+        """
+
+        values = {field: conditional_escape(context[field]) for field in self.fields}
+
+        return self._join(self._html_parts, values), self._join(
+            self._text_parts, values
+        )
+
+
+@functools.cache
+def get_email_template(
+    template_name: str, fields: tuple[str, ...]
+) -> CompiledEmailTemplate:
+    """
+    Returns the compiled email template, compiling it on first use
+
+    Parameters
+    ----------
+    template_name : str
+        The name of the template
+    fields : tuple[str, ...]
+        The context variables of the template
+
+    Returns
+    -------
+    CompiledEmailTemplate
+        The compiled template
+    """
+
+    return CompiledEmailTemplate(template_name, fields)
+
+
+@receiver(setting_changed)
+def reset_email_templates(setting: str, **kwargs) -> None:
+    """
+    Compiles the templates again when the template settings are overridden
+
+    Parameters
+    ----------
+    setting : str
+        The name of the changed setting
+    """
+
+    if setting == "TEMPLATES":
+        get_email_template.cache_clear()
+
+
+@receiver(file_changed)
+def email_template_changed(file_path: Path, **kwargs) -> None:
+    """
+    Compiles the templates again when the development server
+    reloads a template instead of restarting
+
+    Parameters
+    ----------
+    file_path : Path
+        The path of the changed file
+    """
+
+    if file_path.suffix == ".html":
+        get_email_template.cache_clear()
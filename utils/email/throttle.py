@@ -0,0 +1,44 @@
+import threading
+import time
+
+
+class Throttle:
+    """
+    Spaces out calls shared by several threads so they
+    never exceed a rate, sleeping until the next slot
+
+    Attributes
+    ----------
+    rate : float
+        The maximum number of calls per second, unlimited with 0
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Initializes the throttle
+
+        Parameters
+        ----------
+        rate : float
+            The maximum number of calls per second, unlimited with 0
+        """
+
+        self.rate = rate
+        self._interval = 1 / rate if rate > 0 else 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """
+        Reserves the next slot and sleeps until it comes
+        """
+
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self._interval
+
+        time.sleep(slot - now)
@@ -0,0 +1,112 @@
+import functools
+import ipaddress
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+@functools.cache
+def get_trusted_proxies() -> tuple[Network, ...]:
+    """
+    Returns the networks of the reverse proxies configured in the settings
+
+    Returns
+    -------
+    tuple[Network, ...]
+        The trusted proxy networks
+
+    Raises
+    ------
+    ImproperlyConfigured
+        If an entry is not an address or a network
+    """
+
+    try:
+        return tuple(
+            ipaddress.ip_network(proxy.strip(), strict=False)
+            for proxy in settings.TRUSTED_PROXIES
+            if proxy.strip()
+        )
+    except ValueError as e:
+        raise ImproperlyConfigured(f"TRUSTED_PROXIES: {e}")
+
+
+@receiver(setting_changed)
+def reset_trusted_proxies(setting: str, **kwargs) -> None:
+    """
+    Parses the trusted proxies again when the setting is overridden
+
+    Parameters
+    ----------
+    setting : str
+        The name of the changed setting
+    """
+
+    if setting == "TRUSTED_PROXIES":
+        get_trusted_proxies.cache_clear()
+
+
+def is_trusted_proxy(address: str) -> bool:
+    """
+    Checks if an address belongs to a trusted proxy
+
+    Parameters
+    ----------
+    address : str
+        The address
+
+    Returns
+    -------
+    bool
+        Whether the address is in a trusted proxy network, False if it is
+        not an address
+    """
+
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+
+    return any(ip in network for network in get_trusted_proxies())
+
+
+def client_ip(request: WSGIRequest) -> Optional[str]:
+    """
+    Returns the client address. Behind trusted proxies it is the right-most
+    X-Forwarded-For hop that is not a trusted proxy, since the hops left of
+    it were sent by the client and can be forged
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    Optional[str]
+        The client address
+    """
+
+    address = request.META.get("REMOTE_ADDR")
+
+    if not address or not is_trusted_proxy(address):
+        return address
+
+    hops = [
+        hop.strip()
+        for hop in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+        if hop.strip()
+    ]
+
+    for hop in reversed(hops):
+        if not is_trusted_proxy(hop):
+            return hop
+
+    # Every hop is a proxy, the request started inside the trusted network
+    return hops[0] if hops else address
@@ -0,0 +1,114 @@
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+from utils.metrics.recorders import (
+    REQUEST_DB_DURATION,
+    REQUEST_DURATION,
+    REQUEST_QUERIES,
+    REQUESTS_TOTAL,
+    RequestMetrics,
+    finish_request,
+    instrument_connection,
+    start_request,
+)
+
+
+class MetricsMiddleware(MiddlewareMixin):
+    """
+    Records the latency, SQL queries and phase timings of every request
+    by route and, with METRICS_SERVER_TIMING, reports them to the client
+    in a Server-Timing header. It should be the first middleware so the
+    latency covers the rest of the stack
+    """
+
+    def process_request(self, request: WSGIRequest) -> None:
+        """
+        Starts collecting the request costs
+
+        Parameters
+        ----------
+        request : WSGIRequest
+            The request object
+        """
+
+        for connection in connections.all(initialized_only=True):
+            instrument_connection(connection)
+
+        request.metrics = start_request()
+
+    def process_response(
+        self, request: WSGIRequest, response: HttpResponse
+    ) -> HttpResponse:
+        """
+        Records the request costs
+
+        Parameters
+        ----------
+        request : WSGIRequest
+            The request object
+        response : HttpResponse
+            The response object
+
+        Returns
+        -------
+        HttpResponse
+            The response object
+        """
+
+        metrics: RequestMetrics = getattr(request, "metrics", None)
+
+        if metrics is None:
+            return response
+
+        finish_request()
+
+        elapsed = time.perf_counter() - metrics.started_at
+        match = getattr(request, "resolver_match", None)
+        route = (match.url_name or match.view_name) if match else "unmatched"
+
+        REQUEST_DURATION.observe(
+            elapsed, route=route, method=request.method, status=response.status_code
+        )
+        REQUEST_QUERIES.observe(metrics.queries, route=route)
+        REQUEST_DB_DURATION.observe(metrics.phases.get("db", 0), route=route)
+        REQUESTS_TOTAL.inc(route=route, status=response.status_code)
+
+        if getattr(settings, "METRICS_SERVER_TIMING", False):
+            response["Server-Timing"] = server_timing(metrics, elapsed)
+
+        return response
+
+
+def server_timing(metrics: RequestMetrics, elapsed: float) -> str:
+    """
+    Builds the Server-Timing header of a request
+
+    Parameters
+    ----------
+    metrics : RequestMetrics
+        The request metrics
+    elapsed : float
+        The request latency in seconds
+
+    Returns
+    -------
+    str
+        The header value, durations in milliseconds
+    """
+
+    entries = [
+        f'db;dur={metrics.phases.get("db", 0) * 1000:.1f};desc="{metrics.queries} queries"'
+    ]
+    entries.extend(
+        f"{phase};dur={seconds * 1000:.1f}"
+        for phase, seconds in metrics.phases.items()
+        if phase != "db"
+    )
+    entries.append(f"total;dur={elapsed * 1000:.1f}")
+
+    return ", ".join(entries)
@@ -0,0 +1,229 @@
+import contextlib
+import contextvars
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from utils.metrics.registry import Counter, Gauge, Histogram, registry
+
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Request latency by route",
+        labels=("route", "method", "status"),
+    )
+)
+REQUEST_QUERIES = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL queries per request by route",
+        labels=("route",),
+        buckets=QUERY_BUCKETS,
+    )
+)
+REQUEST_DB_DURATION = registry.register(
+    Histogram(
+        "http_request_db_duration_seconds",
+        "Time spent in SQL queries per request by route",
+        labels=("route",),
+    )
+)
+PHASE_DURATION = registry.register(
+    Histogram(
+        "app_phase_duration_seconds",
+        "Time spent in sign up validation, password hashing, email dispatch "
+        "and SMTP delivery",
+        labels=("phase",),
+    )
+)
+REQUESTS_TOTAL = registry.register(
+    Counter("http_requests_total", "Requests by route", labels=("route", "status"))
+)
+HASHING_RUNNING = registry.register(
+    Gauge("password_hashing_running", "Password hashes being computed")
+)
+HASHING_QUEUED = registry.register(
+    Gauge("password_hashing_queued", "Password hashes waiting for a free worker")
+)
+HASHING_REJECTED = registry.register(
+    Counter(
+        "password_hashing_rejected_total",
+        "Password hashes rejected because the hashing pool was saturated",
+    )
+)
+
+_current: contextvars.ContextVar[Optional["RequestMetrics"]] = contextvars.ContextVar(
+    "request_metrics", default=None
+)
+
+
+class RequestMetrics:
+    """
+    The costs collected while one request is handled
+
+    Attributes
+    ----------
+    started_at : float
+        The performance counter when the request started
+    queries : int
+        The number of SQL queries
+    phases : dict[str, float]
+        The seconds spent in each phase, the database included
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the request metrics
+        """
+
+        self.started_at = time.perf_counter()
+        self.queries = 0
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Adds time to a phase
+
+        Parameters
+        ----------
+        phase : str
+            The phase name
+        seconds : float
+            The seconds spent
+        """
+
+        self.phases[phase] = self.phases.get(phase, 0) + seconds
+
+
+def start_request() -> RequestMetrics:
+    """
+    Starts collecting the costs of the current request
+
+    Returns
+    -------
+    RequestMetrics
+        The request metrics
+    """
+
+    metrics = RequestMetrics()
+    _current.set(metrics)
+
+    return metrics
+
+
+def finish_request() -> None:
+    """
+    Stops collecting the costs of the current request
+    """
+
+    _current.set(None)
+
+
+def record(phase: str, seconds: float) -> None:
+    """
+    Records the time spent in a phase, in the phase histogram
+    and in the metrics of the current request if there is one
+
+    Parameters
+    ----------
+    phase : str
+        The phase name
+    seconds : float
+        The seconds spent
+    """
+
+    PHASE_DURATION.observe(seconds, phase=phase)
+    metrics = _current.get()
+
+    if metrics is not None:
+        metrics.add(phase, seconds)
+
+
+@contextlib.contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Records the time spent in the block as a phase
+
+    Parameters
+    ----------
+    phase : str
+        The phase name
+    """
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+def record_query(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool, context: dict
+) -> Any:
+    """
+    Database execute wrapper that adds the query to the current request
+
+    Parameters
+    ----------
+    execute : Callable[..., Any]
+        The next execute function
+    sql : str
+        The SQL
+    params : Any
+        The SQL parameters
+    many : bool
+        Whether it is an executemany call
+    context : dict
+        The connection and cursor
+
+    Returns
+    -------
+    Any
+        The execute result
+    """
+
+    metrics = _current.get()
+
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.add("db", time.perf_counter() - start)
+
+
+def instrument_connection(connection) -> None:
+    """
+    Installs the query recorder on a database connection once
+
+    Parameters
+    ----------
+    connection : BaseDatabaseWrapper
+        The database connection
+    """
+
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@receiver(connection_created)
+def instrument_new_connection(connection, **kwargs) -> None:
+    """
+    Installs the query recorder on every new database connection
+
+    Parameters
+    ----------
+    connection : BaseDatabaseWrapper
+        The database connection
+    """
+
+    instrument_connection(connection)
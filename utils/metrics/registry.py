@@ -0,0 +1,324 @@
+import bisect
+import math
+import threading
+from typing import Iterator
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...], **extra) -> str:
+    """
+    Formats a label set in the Prometheus text format
+
+    Parameters
+    ----------
+    names : tuple[str, ...]
+        The label names
+    values : tuple[str, ...]
+        The label values
+    **extra : dict
+        Additional labels, such as the bucket bound
+
+    Returns
+    -------
+    str
+        The label set, empty if there are no labels
+    """
+
+    pairs = list(zip(names, values)) + list(extra.items())
+
+    if not pairs:
+        return ""
+
+    escaped = (
+        (name, str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n"))
+        for name, value in pairs
+    )
+
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class Counter:
+    """
+    Monotonic counter by label values
+
+    Attributes
+    ----------
+    name : str
+        The metric name
+    documentation : str
+        The metric help text
+    labels : tuple[str, ...]
+        The label names
+    """
+
+    type = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        """
+        Initializes the counter
+
+        Parameters
+        ----------
+        name : str
+            The metric name
+        documentation : str
+            The metric help text
+        labels : tuple[str, ...]
+            The label names
+        """
+
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """
+        Increments the counter
+
+        Parameters
+        ----------
+        amount : float
+            The amount to add
+        **labels : dict
+            The label values
+        """
+
+        key = tuple(str(labels[name]) for name in self.labels)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self) -> Iterator[str]:
+        """
+        Yields the samples in the Prometheus text format
+
+        Returns
+        -------
+        Iterator[str]
+            The sample lines
+        """
+
+        with self._lock:
+            values = dict(self._values)
+
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{format_labels(self.labels, key)} {value}"
+
+
+class Gauge(Counter):
+    """
+    Value that goes up and down by label values, starting at 0
+
+    Attributes
+    ----------
+    name : str
+        The metric name
+    documentation : str
+        The metric help text
+    labels : tuple[str, ...]
+        The label names
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        """
+        Initializes the gauge
+
+        Parameters
+        ----------
+        name : str
+            The metric name
+        documentation : str
+            The metric help text
+        labels : tuple[str, ...]
+            The label names
+        """
+
+        super().__init__(name, documentation, labels)
+
+        if not labels:
+            self._values[()] = 0
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        """
+        Decrements the gauge
+
+        Parameters
+        ----------
+        amount : float
+            The amount to subtract
+        **labels : dict
+            The label values
+        """
+
+        self.inc(-amount, **labels)
+
+
+class Histogram:
+    """
+    Cumulative histogram by label values
+
+    Attributes
+    ----------
+    name : str
+        The metric name
+    documentation : str
+        The metric help text
+    labels : tuple[str, ...]
+        The label names
+    buckets : tuple[float, ...]
+        The upper bounds of the buckets
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Initializes the histogram
+
+        Parameters
+        ----------
+        name : str
+            The metric name
+        documentation : str
+            The metric help text
+        labels : tuple[str, ...]
+            The label names
+        buckets : tuple[float, ...]
+            The upper bounds of the buckets, +Inf is added
+        """
+
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: dict[tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        """
+        Records a value
+
+        Parameters
+        ----------
+        value : float
+            The value
+        **labels : dict
+            The label values
+        """
+
+        key = tuple(str(labels[name]) for name in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            counts, total = self._values.setdefault(key, [[0] * len(self.buckets), 0.0])
+            counts[index] += 1
+            self._values[key][1] = total + value
+
+    def collect(self) -> Iterator[str]:
+        """
+        Yields the samples in the Prometheus text format
+
+        Returns
+        -------
+        Iterator[str]
+            The sample lines
+        """
+
+        with self._lock:
+            values = {
+                key: (list(counts), total)
+                for key, (counts, total) in self._values.items()
+            }
+
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(float(bound))
+                yield (
+                    f"{self.name}_bucket{format_labels(self.labels, key, le=le)} "
+                    f"{cumulative}"
+                )
+
+            yield f"{self.name}_sum{format_labels(self.labels, key)} {total}"
+            yield f"{self.name}_count{format_labels(self.labels, key)} {cumulative}"
+
+
+class MetricsRegistry:
+    """
+    Process wide collection of metrics rendered for Prometheus
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the registry
+        """
+
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+
+    def register(
+        self, metric: Counter | Gauge | Histogram
+    ) -> Counter | Gauge | Histogram:
+        """
+        Adds a metric to the registry
+
+        Parameters
+        ----------
+        metric : Counter | Gauge | Histogram
+            The metric
+
+        Returns
+        -------
+        Counter | Gauge | Histogram
+            The metric
+
+        Raises
+        ------
+        ValueError
+            If a metric with the same name is already registered
+        """
+
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+
+        self._metrics[metric.name] = metric
+
+        return metric
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text format
+
+        Returns
+        -------
+        str
+            The exposition text
+        """
+
+        lines = []
+
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.collect())
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
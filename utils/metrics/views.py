@@ -0,0 +1,64 @@
+import hmac
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import Http404, HttpResponse
+
+from utils.http.client import client_ip
+from utils.metrics.registry import registry
+
+
+def is_allowed(request: WSGIRequest) -> bool:
+    """
+    Checks if the request may read the metrics, with the METRICS_TOKEN
+    bearer token or from one of the METRICS_ALLOWED_IPS, the client
+    address being resolved behind TRUSTED_PROXIES
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    bool
+        Whether the metrics are served
+    """
+
+    if settings.METRICS_TOKEN:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+
+        if scheme.lower() == "bearer" and hmac.compare_digest(
+            token.encode(), settings.METRICS_TOKEN.encode()
+        ):
+            return True
+
+    return client_ip(request) in settings.METRICS_ALLOWED_IPS
+
+
+def metrics(request: WSGIRequest) -> HttpResponse:
+    """
+    The Prometheus metrics view, only served to allowed scrapers
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    HttpResponse
+        The metrics of this process in the Prometheus text format
+
+    Raises
+    ------
+    Http404
+        If the scraper is not allowed
+    """
+
+    if not is_allowed(request):
+        raise Http404
+
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,115 @@
+import functools
+import math
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from utils.ratelimit.stores.abstract import RateLimitStoreAbstract
+
+
+class RateLimitResult(NamedTuple):
+    """
+    The outcome of a rate limited hit
+
+    Attributes
+    ----------
+    allowed : bool
+        Whether the hit is within the limit
+    limit : int
+        The number of hits allowed per window
+    remaining : int
+        The hits left in the current window
+    reset : int
+        Seconds until the current window ends
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: int
+
+
+class RateLimiter:
+    """
+    Sliding window rate limiter. It keeps a counter per fixed window
+    and weights the previous one by how much of it still overlaps the
+    sliding window, so bursts at window edges are not let through
+    """
+
+    def __init__(self, store: RateLimitStoreAbstract) -> None:
+        """
+        Initializes the rate limiter
+
+        Parameters
+        ----------
+        store : RateLimitStoreAbstract
+            The store that keeps the counters
+        """
+
+        self.store = store
+
+    def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """
+        Counts a hit, rejected hits included so a
+        client that keeps retrying stays limited
+
+        Parameters
+        ----------
+        key : str
+            The key the hits are counted by
+        limit : int
+            The number of hits allowed per window
+        window : int
+            The window length in seconds
+
+        Returns
+        -------
+        RateLimitResult
+            The outcome of the hit
+        """
+
+        now = time.time()
+        bucket, offset = divmod(now, window)
+        current = self.store.incr(f"{key}:{int(bucket)}", timeout=window * 2)
+        previous = self.store.get(f"{key}:{int(bucket) - 1}")
+        estimated = previous * (1 - offset / window) + current
+
+        return RateLimitResult(
+            allowed=estimated <= limit,
+            limit=limit,
+            remaining=max(0, math.floor(limit - estimated)),
+            reset=math.ceil(window - offset),
+        )
+
+
+@functools.cache
+def get_rate_limiter() -> RateLimiter:
+    """
+    Returns the rate limiter on the store configured in the settings
+
+    Returns
+    -------
+    RateLimiter
+        The rate limiter
+    """
+
+    return RateLimiter(store=import_string(settings.RATELIMIT_STORE)())
+
+
+@receiver(setting_changed)
+def reset_rate_limiter(setting: str, **kwargs) -> None:
+    """
+    Rebuilds the rate limiter when the store settings are overridden
+
+    Parameters
+    ----------
+    setting : str
+        The name of the changed setting
+    """
+
+    if setting in {"RATELIMIT_STORE", "RATELIMIT_CACHE_ALIAS"}:
+        get_rate_limiter.cache_clear()
@@ -0,0 +1,137 @@
+import hashlib
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpResponse, JsonResponse
+from django.utils.deprecation import MiddlewareMixin
+
+from utils.http.client import client_ip
+from utils.ratelimit.limiter import RateLimitResult, get_rate_limiter
+
+DEFAULT_METHODS = ("POST",)
+
+
+def submitted_email(request: WSGIRequest) -> Optional[str]:
+    """
+    Identifies the request by a digest of the submitted email,
+    so addresses are not stored in the clear in the counter keys
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    Optional[str]
+        The email digest, None if no email was submitted
+    """
+
+    email = request.POST.get("email", "").strip().lower()
+
+    if not email:
+        return None
+
+    return hashlib.sha256(email.encode()).hexdigest()[:32]
+
+
+IDENTIFIERS: dict[str, Callable[[WSGIRequest], Optional[str]]] = {
+    "ip": client_ip,
+    "email": submitted_email,
+}
+
+
+class RateLimitMiddleware(MiddlewareMixin):
+    """
+    Applies the RATELIMITS rules of the resolved route before the view
+    runs, so throttled requests never reach password hashing or email
+    """
+
+    def process_view(
+        self, request: WSGIRequest, view_func, view_args, view_kwargs
+    ) -> Optional[JsonResponse]:
+        """
+        Counts the request against the rules of its route
+
+        Parameters
+        ----------
+        request : WSGIRequest
+            The request object
+        view_func : Callable
+            The resolved view
+        view_args : tuple
+            The view positional arguments
+        view_kwargs : dict
+            The view keyword arguments
+
+        Returns
+        -------
+        Optional[JsonResponse]
+            A JSON response with a 429 status code if
+            any rule is exceeded, otherwise None
+        """
+
+        route = request.resolver_match.url_name
+        rules = settings.RATELIMITS.get(route, ())
+        limiter = get_rate_limiter()
+        results = []
+
+        for rule in rules:
+            if request.method not in rule.get("methods", DEFAULT_METHODS):
+                continue
+
+            identity = IDENTIFIERS[rule["key"]](request)
+
+            if identity:
+                results.append(
+                    limiter.hit(
+                        f"{route}:{rule['key']}:{identity}",
+                        limit=rule["limit"],
+                        window=rule["window"],
+                    )
+                )
+
+        if not results:
+            return None
+
+        request.rate_limit = min(
+            results, key=lambda result: (result.allowed, result.remaining)
+        )
+
+        if not request.rate_limit.allowed:
+            response = JsonResponse(
+                {"errors": ["Too many requests, please try again later."]},
+                status=429,
+            )
+            response["Retry-After"] = str(request.rate_limit.reset)
+
+            return response
+
+    def process_response(
+        self, request: WSGIRequest, response: HttpResponse
+    ) -> HttpResponse:
+        """
+        Reports the quota of the tightest rule in the response headers
+
+        Parameters
+        ----------
+        request : WSGIRequest
+            The request object
+        response : HttpResponse
+            The response object
+
+        Returns
+        -------
+        HttpResponse
+            The response object
+        """
+
+        result: Optional[RateLimitResult] = getattr(request, "rate_limit", None)
+
+        if result is not None:
+            response["X-RateLimit-Limit"] = str(result.limit)
+            response["X-RateLimit-Remaining"] = str(result.remaining)
+            response["X-RateLimit-Reset"] = str(result.reset)
+
+        return response
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+
+
+class RateLimitStoreAbstract(ABC):
+    """
+    Rate limit store abstract class
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> int:
+        """
+        Get abstract method
+
+        Parameters
+        ----------
+        key : str
+            The counter key
+
+        Returns
+        -------
+        int
+            The counter value, 0 if it does not exist or has expired
+        """
+
+        pass
+
+    @abstractmethod
+    def incr(self, key: str, timeout: float) -> int:
+        """
+        Incr abstract method, creates the counter if it does not exist
+
+        Parameters
+        ----------
+        key : str
+            The counter key
+        timeout : float
+            Seconds the counter lives for once created
+
+        Returns
+        -------
+        int
+            The incremented counter value
+        """
+
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Clear abstract method, deletes every counter
+        """
+
+        pass
@@ -0,0 +1,80 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from utils.ratelimit.stores.abstract import RateLimitStoreAbstract
+
+KEY_PREFIX = "ratelimit:"
+
+
+class CacheStore(RateLimitStoreAbstract):
+    """
+    Rate limit store on a Django cache, shared by every process
+    when the cache is (Redis, Memcached, database...)
+    """
+
+    def __init__(self, alias: Optional[str] = None) -> None:
+        """
+        Initializes the store
+
+        Parameters
+        ----------
+        alias : Optional[str]
+            The cache alias, RATELIMIT_CACHE_ALIAS when it is None
+        """
+
+        self.cache = caches[alias or settings.RATELIMIT_CACHE_ALIAS]
+
+    def get(self, key: str) -> int:
+        """
+        Returns the counter value
+
+        Parameters
+        ----------
+        key : str
+            The counter key
+
+        Returns
+        -------
+        int
+            The counter value, 0 if it does not exist or has expired
+        """
+
+        return self.cache.get(f"{KEY_PREFIX}{key}", 0)
+
+    def incr(self, key: str, timeout: float) -> int:
+        """
+        Increments the counter atomically where the cache supports it
+
+        Parameters
+        ----------
+        key : str
+            The counter key
+        timeout : float
+            Seconds the counter lives for once created
+
+        Returns
+        -------
+        int
+            The incremented counter value
+        """
+
+        key = f"{KEY_PREFIX}{key}"
+
+        if self.cache.add(key, 1, timeout=timeout):
+            return 1
+
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # The counter expired between add and incr
+            self.cache.set(key, 1, timeout=timeout)
+            return 1
+
+    def clear(self) -> None:
+        """
+        Deletes every counter, the cache holds nothing else
+        """
+
+        self.cache.clear()
@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import OrderedDict
+
+from utils.ratelimit.stores.abstract import RateLimitStoreAbstract
+
+MAX_ENTRIES = 10000
+
+
+class LocalMemoryStore(RateLimitStoreAbstract):
+    """
+    Process local rate limit store, for a single process deployment,
+    holding at most max_entries counters in the order they were started
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        """
+        Initializes the store
+
+        Parameters
+        ----------
+        max_entries : int
+            The number of counters kept, the oldest are dropped above it
+        """
+
+        self.max_entries = max_entries
+        self._counters: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> int:
+        """
+        Returns the counter value
+
+        Parameters
+        ----------
+        key : str
+            The counter key
+
+        Returns
+        -------
+        int
+            The counter value, 0 if it does not exist or has expired
+        """
+
+        value, expires_at = self._counters.get(key, (0, 0))
+
+        return value if expires_at > time.monotonic() else 0
+
+    def incr(self, key: str, timeout: float) -> int:
+        """
+        Increments the counter
+
+        Parameters
+        ----------
+        key : str
+            The counter key
+        timeout : float
+            Seconds the counter lives for once created
+
+        Returns
+        -------
+        int
+            The incremented counter value
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            value, expires_at = self._counters.get(key, (0, 0))
+
+            if expires_at <= now:
+                value, expires_at = 0, now + timeout
+                self._counters.pop(key, None)
+
+            self._counters[key] = (value + 1, expires_at)
+            self._prune(now)
+
+        return value + 1
+
+    def clear(self) -> None:
+        """
+        Deletes every counter
+        """
+
+        with self._lock:
+            self._counters.clear()
+
+    def _prune(self, now: float) -> None:
+        """
+        Drops the oldest counters while they have expired or there are
+        more than max_entries, the lock must be held
+
+        Parameters
+        ----------
+        now : float
+            The current monotonic time
+        """
+
+        while self._counters:
+            _, expires_at = next(iter(self._counters.values()))
+
+            if expires_at > now and len(self._counters) <= self.max_entries:
+                break
+
+            self._counters.popitem(last=False)
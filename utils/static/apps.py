@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+
+
+class StaticConfig(AppConfig):
+    """
+    Static assets configuration
+    """
+
+    name = "utils.static"
+    label = "static_assets"
+
+    def ready(self) -> None:
+        """
+        Registers the static assets checks
+        """
+
+        from utils.static import checks  # noqa: F401
@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.contrib.staticfiles.finders import get_finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.checks import Error, register
+
+
+# Not tagged staticfiles, since collectstatic runs those checks
+# before it writes the manifest
+@register("static_assets")
+def check_manifest(app_configs, **kwargs) -> list[Error]:
+    """
+    Checks that collectstatic ran with the current static files, so no
+    template falls back to a name that is not cached or not collected
+
+    Parameters
+    ----------
+    app_configs : Optional[list[AppConfig]]
+        The apps to check
+
+    Returns
+    -------
+    list[Error]
+        The errors
+    """
+
+    if settings.DEBUG or not hasattr(staticfiles_storage, "hashed_files"):
+        return []
+
+    hashed_files, _ = staticfiles_storage.load_manifest()
+
+    if not hashed_files:
+        return [
+            Error(
+                "The static files manifest is missing or empty.",
+                hint="Run python manage.py collectstatic.",
+                id="static_assets.E001",
+            )
+        ]
+
+    missing = sorted(
+        path
+        for finder in get_finders()
+        for path, _ in finder.list([])
+        if staticfiles_storage.hash_key(path.replace("\\", "/")) not in hashed_files
+    )
+
+    if missing:
+        return [
+            Error(
+                f"The static files manifest lacks {len(missing)} files, "
+                f"such as {', '.join(missing[:3])}.",
+                hint="Run python manage.py collectstatic.",
+                id="static_assets.E002",
+            )
+        ]
+
+    return []
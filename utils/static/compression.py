@@ -0,0 +1,51 @@
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".json", ".map", ".svg", ".txt", ".xml")
+MIN_SIZE = 256
+
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+
+def compress_file(path: str) -> list[str]:
+    """
+    Writes the gzip and, if the brotli package is installed, brotli
+    variants of a static file next to it, when they are smaller
+
+    Parameters
+    ----------
+    path : str
+        The static file path
+
+    Returns
+    -------
+    list[str]
+        The paths of the written variants
+    """
+
+    if not path.endswith(COMPRESSIBLE_EXTENSIONS) or os.path.getsize(path) < MIN_SIZE:
+        return []
+
+    with open(path, "rb") as file:
+        content = file.read()
+
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content)
+
+    written = []
+
+    for extension, compressed in variants.items():
+        if len(compressed) < len(content):
+            with open(path + extension, "wb") as file:
+                file.write(compressed)
+
+            written.append(path + extension)
+
+    return written
@@ -0,0 +1,21 @@
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.handlers.wsgi import WSGIRequest
+
+
+def assets(request: WSGIRequest) -> dict[str, str]:
+    """
+    Adds the version of the collected static files to the context,
+    so fragments holding asset URLs are cached per deploy
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    dict[str, str]
+        The manifest hash, empty if the storage has no manifest
+    """
+
+    return {"assets_version": getattr(staticfiles_storage, "manifest_hash", "")}
@@ -0,0 +1,209 @@
+import mimetypes
+import os
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+from utils.static.checks import check_manifest
+from utils.static.compression import ENCODINGS
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MUTABLE_CACHE_CONTROL = "public, max-age=60"
+
+
+class StaticAsset(NamedTuple):
+    """
+    A collected static file and its precompressed variants
+
+    Attributes
+    ----------
+    path : str
+        The file path
+    content_type : str
+        The content type
+    immutable : bool
+        Whether the name carries the content hash
+    modified_at : float
+        The modification time
+    variants : dict[str, str]
+        The variant paths by content encoding
+    """
+
+    path: str
+    content_type: str
+    immutable: bool
+    modified_at: float
+    variants: dict[str, str]
+
+
+def build_index(root: str, prefix: str, hashed_names: set[str]) -> dict:
+    """
+    Indexes the collected static files by URL path
+
+    Parameters
+    ----------
+    root : str
+        The STATIC_ROOT directory
+    prefix : str
+        The STATIC_URL path
+    hashed_names : set[str]
+        The hashed names of the manifest
+
+    Returns
+    -------
+    dict[str, StaticAsset]
+        The static files by URL path
+    """
+
+    index = {}
+    compressed = tuple(ENCODINGS.values())
+
+    for directory, _, files in os.walk(root):
+        for filename in files:
+            if filename.endswith(compressed):
+                continue
+
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root).replace(os.sep, "/")
+            content_type, _ = mimetypes.guess_type(filename)
+
+            index[prefix + name] = StaticAsset(
+                path=path,
+                content_type=content_type or "application/octet-stream",
+                immutable=name in hashed_names,
+                modified_at=os.stat(path).st_mtime,
+                variants={
+                    encoding: path + extension
+                    for encoding, extension in ENCODINGS.items()
+                    if os.path.exists(path + extension)
+                },
+            )
+
+    return index
+
+
+def accepted_encodings(request: WSGIRequest) -> set[str]:
+    """
+    Parses the encodings the client accepts
+
+    Parameters
+    ----------
+    request : WSGIRequest
+        The request object
+
+    Returns
+    -------
+    set[str]
+        The accepted encodings
+    """
+
+    encodings = set()
+
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        encoding, _, params = part.strip().partition(";")
+
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            encodings.add(encoding.strip().lower())
+
+    return encodings
+
+
+class StaticFilesMiddleware(MiddlewareMixin):
+    """
+    Serves the collected static files from an index built at startup.
+    Hashed names are cached forever and precompressed variants are
+    picked by the Accept-Encoding header. Not used with DEBUG, where
+    runserver serves the static files itself
+    """
+
+    def __init__(self, get_response) -> None:
+        """
+        Initializes the middleware
+
+        Parameters
+        ----------
+        get_response : Callable
+            The next handler
+
+        Raises
+        ------
+        MiddlewareNotUsed
+            If DEBUG is on or the static files have not been collected
+        ImproperlyConfigured
+            If the manifest is incomplete
+        """
+
+        super().__init__(get_response)
+
+        if settings.DEBUG or not os.path.isdir(settings.STATIC_ROOT or ""):
+            raise MiddlewareNotUsed
+
+        errors = check_manifest(None)
+
+        if errors:
+            raise ImproperlyConfigured(errors[0].msg + " " + errors[0].hint)
+
+        self.prefix = "/" + settings.STATIC_URL.lstrip("/")
+        self.index = build_index(
+            str(settings.STATIC_ROOT),
+            self.prefix,
+            set(getattr(staticfiles_storage, "hashed_files", {}).values()),
+        )
+
+    def process_request(self, request: WSGIRequest) -> Optional[FileResponse]:
+        """
+        Serves the request if it is for a collected static file
+
+        Parameters
+        ----------
+        request : WSGIRequest
+            The request object
+
+        Returns
+        -------
+        Optional[FileResponse]
+            The file, a not modified response or None
+            to let the rest of the stack answer
+        """
+
+        if request.method not in ("GET", "HEAD"):
+            return None
+
+        asset: Optional[StaticAsset] = self.index.get(request.path_info)
+
+        if asset is None:
+            return None
+
+        if not was_modified_since(
+            request.headers.get("If-Modified-Since"), asset.modified_at
+        ):
+            return HttpResponseNotModified()
+
+        accepted = accepted_encodings(request)
+        encoding = next(
+            (encoding for encoding in asset.variants if encoding in accepted), None
+        )
+        response = FileResponse(
+            open(asset.variants[encoding] if encoding else asset.path, "rb"),
+            content_type=asset.content_type,
+        )
+
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+        if asset.variants:
+            response["Vary"] = "Accept-Encoding"
+
+        response["Last-Modified"] = http_date(asset.modified_at)
+        response["Cache-Control"] = (
+            IMMUTABLE_CACHE_CONTROL if asset.immutable else MUTABLE_CACHE_CONTROL
+        )
+
+        return response
@@ -0,0 +1,36 @@
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+from utils.static.compression import compress_file
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also writes precompressed variants of
+    the hashed files, so they can be served without compressing
+    them per request and cached forever
+    """
+
+    def post_process(self, paths: dict, dry_run: bool = False, **options):
+        """
+        Hashes the collected files and compresses the hashed copies
+
+        Parameters
+        ----------
+        paths : dict
+            The collected files
+        dry_run : bool
+            Whether to only report what would be done
+
+        Returns
+        -------
+        Iterator[tuple[str, str, bool | Exception]]
+            The original name, hashed name and whether it was processed
+        """
+
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+
+        if dry_run:
+            return
+
+        for hashed_name in set(self.hashed_files.values()):
+            compress_file(self.path(hashed_name))
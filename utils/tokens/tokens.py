@@ -1,12 +1,232 @@
 import datetime
-from typing import Optional
+import functools
+import uuid
+from typing import Any, Optional
 
 import jwt
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.encoding import force_bytes
+from jwt.algorithms import HMACAlgorithm, get_default_algorithms
+from jwt.utils import base64url_encode
 
 from utils.tokens.constants import DEFAULT_EXPIRATION_DAYS
 from utils.tokens.exceptions import TokenValidationError
 
+TOKEN_SETTINGS = {"TOKEN_SIGNING_KEYS", "TOKEN_SIGNING_KEY_ID", "TOKEN_ALGORITHM"}
+
+
+class TokenService:
+    """
+    Signs and verifies tokens with keys and algorithm resolved once
+
+    Attributes
+    ----------
+    algorithm : str
+        The HMAC algorithm name
+    signing_key_id : str
+        The id of the key new tokens are signed with
+    """
+
+    def __init__(
+        self, keys: dict[str, str], signing_key_id: str, algorithm: str = "HS256"
+    ) -> None:
+        """
+        Initializes the token service
+
+        Parameters
+        ----------
+        keys : dict[str, str]
+            The keys tokens are verified with, by key id
+        signing_key_id : str
+            The id of the key new tokens are signed with
+        algorithm : str
+            The HMAC algorithm name
+        """
+
+        if not isinstance(get_default_algorithms()[algorithm], HMACAlgorithm):
+            raise ValueError(f"{algorithm} is not an HMAC algorithm")
+
+        self.algorithm = algorithm
+        self.signing_key_id = signing_key_id
+        self._signing_key = force_bytes(keys[signing_key_id])
+        # Prepared once per key id, decoding reuses them instead of the raw keys
+        self._keys = {
+            key_id: jwt.PyJWK(
+                {
+                    "kty": "oct",
+                    "k": base64url_encode(force_bytes(key)).decode(),
+                    "alg": algorithm,
+                }
+            )
+            for key_id, key in keys.items()
+        }
+        self._headers = {"kid": signing_key_id}
+
+    def _encode(self, payload: dict[str, Any]) -> str:
+        """
+        Signs the payload with the current key
+
+        Parameters
+        ----------
+        payload : dict[str, Any]
+            The token claims
+
+        Returns
+        -------
+        str
+            The token
+        """
+
+        return jwt.encode(
+            payload, self._signing_key, algorithm=self.algorithm, headers=self._headers
+        )
+
+    def _expiration(self, expiration_days: Optional[int]) -> int:
+        """
+        Returns the expiration timestamp of tokens generated now
+
+        Parameters
+        ----------
+        expiration_days : Optional[int]
+            The days until the token expires
+
+        Returns
+        -------
+        int
+            The expiration timestamp
+        """
+
+        expires_at = datetime.datetime.now(tz=datetime.timezone.utc) + (
+            datetime.timedelta(days=expiration_days or DEFAULT_EXPIRATION_DAYS)
+        )
+
+        return int(expires_at.timestamp())
+
+    def generate_token(
+        self,
+        data: Optional[dict[str, Any]] = None,
+        expiration_days: Optional[int] = None,
+    ) -> str:
+        """
+        Generates a token signed with the current key and a unique id
+
+        Parameters
+        ----------
+        data : Optional[dict[str, Any]]
+            The data to include in the token
+        expiration_days : Optional[int]
+            The days until the token expires
+
+        Returns
+        -------
+        str
+            The generated token
+        """
+
+        payload = {"exp": self._expiration(expiration_days), "jti": uuid.uuid4().hex}
+
+        if data:
+            payload.update(data)
+
+        return self._encode(payload)
+
+    def generate_tokens(
+        self,
+        data: list[dict[str, Any]],
+        expiration_days: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Generates a token for every data, sharing the expiration time
+
+        Parameters
+        ----------
+        data : list[dict[str, Any]]
+            The data to include in each token, an exp timestamp in it
+            replaces the shared expiration time
+        expiration_days : Optional[int]
+            The days until the tokens expire
+
+        Returns
+        -------
+        list[str]
+            The generated tokens, in the same order
+        """
+
+        exp = self._expiration(expiration_days)
+
+        return [
+            self._encode({"exp": exp, "jti": uuid.uuid4().hex, **item}) for item in data
+        ]
+
+    def validate_token(self, token: str) -> dict[str, Any]:
+        """
+        Validates a token with the key named in its header
+
+        Parameters
+        ----------
+        token : str
+            The token
+
+        Returns
+        -------
+        dict[str, Any]
+            The token payload
+
+        Raises
+        ------
+        TokenValidationError
+            If the token is invalid, expired, has no expiration
+            or is signed with an unknown key
+        """
+
+        try:
+            header = jwt.get_unverified_header(token)
+            key = self._keys[header.get("kid", self.signing_key_id)]
+
+            return jwt.decode(
+                token,
+                key,
+                algorithms=[self.algorithm],
+                options={"require": ["exp"]},
+            )
+        except (jwt.PyJWTError, KeyError, TypeError):
+            raise TokenValidationError("Error validating token")
+
+
+@functools.cache
+def get_token_service() -> TokenService:
+    """
+    Returns the token service configured in the settings
+
+    Returns
+    -------
+    TokenService
+        The token service
+    """
+
+    return TokenService(
+        keys=settings.TOKEN_SIGNING_KEYS,
+        signing_key_id=settings.TOKEN_SIGNING_KEY_ID,
+        algorithm=settings.TOKEN_ALGORITHM,
+    )
+
+
+@receiver(setting_changed)
+def reset_token_service(setting: str, **kwargs) -> None:
+    """
+    Rebuilds the token service when the token settings are overridden
+
+    Parameters
+    ----------
+    setting : str
+        The name of the changed setting
+    """
+
+    if setting in TOKEN_SETTINGS:
+        get_token_service.cache_clear()
+
 
 class Tokens:
     """
@@ -15,15 +235,17 @@ class Tokens:
 
     @staticmethod
     def generate_token(
-        data: Optional[dict[str, any]] = None, expiration_days: Optional[int] = None
+        data: Optional[dict[str, Any]] = None, expiration_days: Optional[int] = None
     ) -> str:
         """
         Generates a token
 
         Parameters
         ----------
-        data : Optional[dict[str, any]]
+        data : Optional[dict[str, Any]]
             The data to include in the token
+        expiration_days : Optional[int]
+            The days until the token expires
 
         Returns
         -------
@@ -31,19 +253,37 @@ class Tokens:
             The generated token
         """
 
-        expiration_days = DEFAULT_EXPIRATION_DAYS or 30
+        return get_token_service().generate_token(
+            data=data, expiration_days=expiration_days
+        )
 
-        payload = {
-            "exp": datetime.datetime.now() + datetime.timedelta(days=expiration_days),
-        }
+    @staticmethod
+    def generate_tokens(
+        data: list[dict[str, Any]], expiration_days: Optional[int] = None
+    ) -> list[str]:
+        """
+        Generates a token for every data
 
-        if data:
-            payload.update(data)
+        Parameters
+        ----------
+        data : list[dict[str, Any]]
+            The data to include in each token, an exp timestamp in it
+            replaces the shared expiration time
+        expiration_days : Optional[int]
+            The days until the tokens expire
 
-        return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+        Returns
+        -------
+        list[str]
+            The generated tokens
+        """
+
+        return get_token_service().generate_tokens(
+            data=data, expiration_days=expiration_days
+        )
 
     @staticmethod
-    def validate_token(token: str) -> dict[str, any]:
+    def validate_token(token: str) -> dict[str, Any]:
         """
         Validates a token
 
@@ -54,7 +294,7 @@ class Tokens:
 
         Returns
         -------
-        dict[str, any]
+        dict[str, Any]
             The token payload
 
         Raises
@@ -63,8 +303,4 @@ class Tokens:
             If the token is invalid
         """
 
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-            return payload
-        except Exception:
-            raise TokenValidationError("Error validating token")
+        return get_token_service().validate_token(token=token)